@@ -1,19 +1,31 @@
-from pydantic import BaseModel
+import pydantic
 
 from algebra.field.base import Field, FieldElement
 from algebra.number.util import is_prime
+from algebra.util.model import construct
 
 
 class FinitePrimeField(Field):
     char: int
 
-    def __post_init__(self):
-        if not is_prime(self.char):
+    def __init__(self, char: int = None, **kwargs):
+        # FinitePrimeField(p) is allowed
+        if char is not None:
+            kwargs['char'] = char
+        super().__init__(**kwargs)
+
+    @pydantic.field_validator('char')
+    @classmethod
+    def check_char(cls, char: int) -> int:
+        if not is_prime(char):
             raise ValueError("Prime should be given")
+        return char
 
     def element(self, number) -> 'FieldElement':
         if isinstance(number, int):
-            return FinitePrimeFieldElement(self, number % self.char)
+            return FinitePrimeFieldElement(
+                field=self, value=number % self.char
+            )
         elif isinstance(number, FinitePrimeFieldElement):
             if number.field == self:
                 return number
@@ -101,7 +113,10 @@ class FinitePrimeFieldElement(FieldElement):
         elif isinstance(other, int):
             return other
 
+    @classmethod
+    def from_value(cls, field: FinitePrimeField, value: int):
+        # no validation, value should be reduced already
+        return construct(cls, field=field, value=value)
+
     def _wrap_result(self, value):
-        return FinitePrimeFieldElement(
-            field=self.field, value=value % self.field.char
-        )
+        return self.from_value(self.field, value % self.field.char)
@@ -3,6 +3,7 @@ from fractions import Fraction
 
 from algebra.field.base import Field, FieldElement
 from algebra.number.util import is_square, is_square_free
+from algebra.util.model import construct
 
 
 class RationalField(Field):
@@ -68,8 +69,13 @@ class RationalFieldElement(FieldElement):
     def convert(self, field):
         return field.element(int(self.value))
 
+    @classmethod
+    def from_value(cls, field: RationalField, value: Fraction):
+        # no validation, for result of arithmetic
+        return construct(cls, field=field, value=value)
+
     def _wrap(self, number):
-        return RationalFieldElement(field=self.field, value=Fraction(number))
+        return self.from_value(self.field, Fraction(number))
 
     def _check_type(self, other):
         if self.field != other.field:
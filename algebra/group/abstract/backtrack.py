@@ -0,0 +1,307 @@
+from typing import List, Optional, Set
+
+from algebra.group.abstract.base import Group, GroupElement, StabilizerChain, \
+    ElementContainer, T
+
+
+class BacktrackSearch:
+    """
+    Search subgroup {g in G | test(g)} over stabilizer chain of G.
+
+    Elements are built level by level as images of base points, a branch is
+    cut as soon as `refine` fails on the known base images. On each level,
+    only one element per orbit of the already found subgroup is searched
+    (Sims' subgroup search), so the cost follows the size of the chain
+    rather than the order of the group.
+    """
+    def __init__(self, group: Group):
+        self.group = group
+        self.chain: Optional[StabilizerChain] = None
+        self.level_list: List[StabilizerChain] = []
+        self.base: List[T] = []
+        self.result: Optional[StabilizerChain] = None
+        self.next_object: Optional[ElementContainer] = None
+
+    def test(self, element: GroupElement) -> bool:
+        raise NotImplementedError(self)
+
+    def refine(self, element: GroupElement, depth: int) -> bool:
+        """
+        `element` has right images of base[:depth + 1], images of
+        base[:depth] are already checked.
+        """
+        return True
+
+    def preferred_base(self) -> List[T]:
+        return []
+
+    def known_element_list(self) -> List[GroupElement]:
+        return []
+
+    def run(self) -> Group:
+        rep = self.group.represent
+        self._prepare()
+
+        self.result = StabilizerChain(group=rep.group())
+        self.next_object = ElementContainer(rep.object_list())
+        for element in self.known_element_list():
+            self._append(element)
+
+        for depth in reversed(range(len(self.level_list))):
+            self._search_level(depth)
+
+        return self.result.construct()
+
+    def find(self) -> Optional[GroupElement]:
+        """
+        Find one element passing the test, or None
+        """
+        self._prepare()
+
+        if not self.level_list:
+            identity = self.group.represent.identity
+            return identity if self.test(identity) else None
+
+        for t in self.level_list[0].transversal.values():
+            found = self._search(0, t.element)
+            if found is not None:
+                return found
+        return None
+
+    def setup(self):
+        # called after base is fixed
+        pass
+
+    def _prepare(self):
+        # rebase a copy, the chain cached by the group is left as it is
+        self.chain = self.group.stabilizer_chain().copy_chain()
+        self._adapt_base()
+
+        self.level_list = [
+            level
+            for level in self.chain.travel()
+            if not level.is_trivial()
+        ]
+        self.base = [level.point for level in self.level_list]
+        self.setup()
+
+    def _adapt_base(self):
+        level = self.chain
+        for point in self.preferred_base():
+            if level.is_trivial():
+                break
+            if point != level.point and point not in level.transversal:
+                if all(
+                    g.element.act(point) == point
+                    for g in level.generator_factor.values()
+                ):
+                    # fixed, it would be a redundant base point
+                    continue
+            level.change_base([point])
+            level = level.stabilizer
+
+    def _search_level(self, depth: int):
+        level = self.level_list[depth]
+        beta = self.base[depth]
+
+        generator_list = self._result_generator(depth)
+        searched = [beta]
+        covered = self._orbit_union(searched, generator_list)
+
+        for gamma in list(level.transversal):
+            if gamma in covered:
+                continue
+
+            element = self._search(depth, level.transversal[gamma].element)
+            if element is not None:
+                self._append(element)
+                generator_list = self._result_generator(depth)
+            else:
+                searched.append(gamma)
+            covered = self._orbit_union(searched, generator_list)
+
+    def _search(self, depth: int, element: GroupElement):
+        if not self.refine(element, depth):
+            return None
+
+        if depth + 1 == len(self.level_list):
+            return element if self.test(element) else None
+
+        for t in self.level_list[depth + 1].transversal.values():
+            found = self._search(depth + 1, t.element + element)
+            if found is not None:
+                return found
+
+        return None
+
+    def _append(self, element: GroupElement):
+        if not self.result.element_test(element):
+            self.result.extend(element, self.next_object)
+
+    def _result_generator(self, depth: int):
+        # generators of result fixing base[:depth]
+        level = self.result.change_base(self.base[:depth + 1])
+        for _ in range(depth):
+            level = level.stabilizer
+        return list(level.generator_factor.values())
+
+    @staticmethod
+    def _orbit_union(point_list, generator_list) -> Set[T]:
+        covered = set()
+        for point in point_list:
+            if point not in covered:
+                covered.update(
+                    StabilizerChain._orbit_points(point, generator_list)
+                )
+        return covered
+
+
+class CentralizerSearch(BacktrackSearch):
+    """
+    Elements g with x + g == g + y for each pair of element_list and
+    target_list, target_list is element_list for centralizer.
+    """
+    def __init__(self,
+                 group: Group,
+                 element_list: List[GroupElement],
+                 target_list: Optional[List[GroupElement]] = None):
+        super().__init__(group)
+        self.element_list = element_list
+        if target_list is None:
+            target_list = element_list
+        self.target_list = target_list
+        self.check_list = []
+
+    def test(self, element):
+        for x, y in zip(self.element_list, self.target_list):
+            if x + element != element + y:
+                return False
+        return True
+
+    def preferred_base(self):
+        if len(self.element_list) != 1:
+            return []
+        # base along cycles makes x(beta_j) a base point
+        cycle_list = sorted(
+            self.element_list[0].to_seq(),
+            key=len,
+            reverse=True
+        )
+        ol = list(self.group.represent.object_list())
+        return [ol[i] for cycle in cycle_list for i in cycle]
+
+    def setup(self):
+        # pairs of base index (j, m) with x(beta_j) = beta_m, by max(j, m)
+        index = {point: i for i, point in enumerate(self.base)}
+        self.check_list = [[] for _ in self.base]
+        for x, y in zip(self.element_list, self.target_list):
+            for j, point in enumerate(self.base):
+                m = index.get(x.act(point))
+                if m is not None:
+                    self.check_list[max(j, m)].append((y, j, m))
+
+    def refine(self, element, depth):
+        for y, j, m in self.check_list[depth]:
+            image = element.act(self.base[j])
+            if element.act(self.base[m]) != y.act(image):
+                return False
+        return True
+
+    def known_element_list(self):
+        return [
+            g
+            for g in self.group.generator + self.element_list
+            if self.group.element_test(g) and self.test(g)
+        ]
+
+
+class NormalizerSearch(BacktrackSearch):
+    """
+    Elements g with -g + subgroup + g == target, target is subgroup for
+    normalizer.
+    """
+    def __init__(self,
+                 group: Group,
+                 subgroup: Group,
+                 target: Optional[Group] = None):
+        super().__init__(group)
+        self.subgroup = subgroup
+        self.target = subgroup if target is None else target
+        self.orbit_index, self.orbit_size = self._orbit_map(subgroup)
+        if self.target is subgroup:
+            self.target_index = self.orbit_index
+            self.target_size = self.orbit_size
+        else:
+            self.target_index, self.target_size = self._orbit_map(
+                self.target
+            )
+
+    @staticmethod
+    def _orbit_map(group: Group):
+        partition = group.orbit_partition()
+        orbit_index = {}
+        orbit_size = {}
+        for i, o in enumerate(partition.point_list):
+            root = partition.root[i]
+            orbit_index[o] = root
+            orbit_size[o] = len(partition.member[root])
+        return orbit_index, orbit_size
+
+    def test(self, element):
+        for h in self.subgroup.generator:
+            if not self.target.element_test(-element + h + element):
+                return False
+        return True
+
+    def preferred_base(self):
+        # points in small non-trivial orbit first
+        point_list = [p for p, size in self.orbit_size.items() if size > 1]
+        point_list.sort(key=lambda p: (self.orbit_size[p], self.orbit_index[p]))
+        return point_list
+
+    def refine(self, element, depth):
+        # orbits of subgroup should be moved to orbits of target
+        beta = self.base[depth]
+        image = element.act(beta)
+        if self.orbit_size[beta] != self.target_size[image]:
+            return False
+
+        orbit_index = self.orbit_index
+        target_index = self.target_index
+        for j in range(depth):
+            same = orbit_index[self.base[j]] == orbit_index[beta]
+            same_image = (
+                target_index[element.act(self.base[j])] == target_index[image]
+            )
+            if same != same_image:
+                return False
+        return True
+
+    def known_element_list(self):
+        return [
+            g
+            for g in self.group.generator + self.subgroup.generator
+            if self.group.element_test(g) and self.test(g)
+        ]
+
+
+class SetStabilizerSearch(BacktrackSearch):
+    def __init__(self, group: Group, obj_list: List[T]):
+        super().__init__(group)
+        self.obj_set = set(obj_list)
+
+    def test(self, element):
+        for o in self.obj_set:
+            if element.act(o) not in self.obj_set:
+                return False
+        return True
+
+    def preferred_base(self):
+        return sorted(self.obj_set)
+
+    def refine(self, element, depth):
+        beta = self.base[depth]
+        return (beta in self.obj_set) == (element.act(beta) in self.obj_set)
+
+    def known_element_list(self):
+        return [g for g in self.group.generator if self.test(g)]
@@ -1,9 +1,11 @@
 import collections
+import functools
 import itertools
 import random
+import weakref
 from queue import Queue
 from typing import List, TypeVar, Set, Dict, Optional, Iterator, Union, \
-    Type
+    Type, Tuple
 
 import pydantic
 from pydantic import BaseModel
@@ -13,16 +15,48 @@ from algebra.util.my_hash import int_sequence_hash
 
 T = TypeVar("T")
 
+# Groups of at least this order use the batch operation of its GroupRep
+BATCH_THRESHOLD = 1 << 12
+BATCH_BLOCK_SIZE = 1 << 14
+
+# Number of coset representatives kept by SchreierVector
+SCHREIER_VECTOR_CACHE_SIZE = 64
+
+# group_id of groups up to this order has invariants of isomorphism test
+GROUP_ID_INVARIANT_ORDER = 1 << 10
+
 
 class GroupRep(BaseModel):
     @property
     def identity(self):
         raise NotImplementedError(self)
 
+    @functools.cached_property
+    def _intern_table(self) -> weakref.WeakValueDictionary:
+        """
+        Canonical key of element to the only object of it, so that equal
+        elements of this GroupRep are identical while one is alive.
+        """
+        return weakref.WeakValueDictionary()
+
+    def __getstate__(self):
+        # unpickled elements are interned again
+        state = super().__getstate__()
+        state['__dict__'] = {
+            k: v
+            for k, v in state['__dict__'].items()
+            if k != '_intern_table'
+        }
+        return state
+
     @property
     def group_cls(self) -> Type:
         return Group
 
+    def is_object_listed(self):
+        # object_list and check_object should be implemented if True
+        return False
+
     def object_list(self):
         raise NotImplementedError(self)
 
@@ -69,34 +103,282 @@ class GroupRep(BaseModel):
                 [ol[i] for i in chain]
                 for chain in element
             ]
-            generator_list.append(self.element(*rep_elem))
-        return self.group(*generator_list, name=name)
+            generator_list.append(self.element(rep_elem))
+        return self.group(generator_list, name=name)
 
     def as_group(self):
         raise NotImplementedError(self)
 
+    def is_batch_available(self):
+        # batch, batch_element_list, batch_compose, batch_product and
+        # batch_order should be implemented if True
+        return False
+
+
+class CosetTraveler:
+    """
+    Elements t_k + ... + t_0 where t_i is taken from row_list[i], by index
+    as a mixed-radix number whose i-th digit is the position in row_list[i],
+    top level is the most significant. It holds only the rows, so it can
+    be sent to other process.
+    """
+    def __init__(self, row_list, identity):
+        self.row_list = row_list
+        self.identity: GroupElement = identity
+        self.radix_list: List[int] = [len(row) for row in row_list]
+
+        self.order = 1
+        for radix in self.radix_list:
+            self.order *= radix
+
+    def visit(self, start: int = 0, stop: Optional[int] = None):
+        stop = self.order if stop is None else min(stop, self.order)
+        if start >= stop:
+            return
+        if not self.radix_list:
+            yield self.identity
+            return
+
+        # prefix_list[i] = t_i + ... + t_0, only changed levels are rebuilt
+        digit_list = self._digit_list(start)
+        last = len(digit_list) - 1
+        prefix_list = [None] * last
+        self._build_prefix(digit_list[:last], prefix_list, 0)
+
+        row = [self._coset(last, i) for i in range(self.radix_list[last])]
+        count = stop - start
+        while True:
+            # deepest level is the inner loop
+            upper = prefix_list[last - 1] if last else None
+            for element in row[digit_list[last]:]:
+                yield element if upper is None else element + upper
+                count -= 1
+                if count == 0:
+                    return
+
+            digit_list[last] = 0
+            i = last - 1
+            while i >= 0:
+                digit_list[i] += 1
+                if digit_list[i] < self.radix_list[i]:
+                    break
+                digit_list[i] = 0
+                i -= 1
+
+            if i < 0:
+                return
+            self._build_prefix(digit_list[:last], prefix_list, i)
+
+    def unrank(self, index: int) -> 'GroupElement':
+        if not 0 <= index < self.order:
+            raise IndexError(index)
+
+        element = self.identity
+        for i, digit in enumerate(self._digit_list(index)):
+            element = self._coset(i, digit) + element
+        return element
+
+    def batch_visit(self,
+                    start: int = 0,
+                    stop: Optional[int] = None,
+                    block_size: int = BATCH_BLOCK_SIZE):
+        """
+        Elements of index in [start, stop) as blocks of matrix built by
+        GroupRep batch operation, in no particular order.
+        """
+        stop = self.order if stop is None else min(stop, self.order)
+        if start >= stop:
+            return
+        rep = self.identity.group
+        level_list = [
+            rep.batch([self._coset(i, d) for d in range(radix)])
+            for i, radix in enumerate(self.radix_list)
+        ]
+
+        # number of elements below each level
+        size_list = [1]
+        for radix in reversed(self.radix_list):
+            size_list.append(size_list[-1] * radix)
+        size_list.reverse()
+
+        stack = [(0, 0, rep.batch([self.identity]))]
+        while stack:
+            depth, offset, prefix = stack.pop()
+            size = size_list[depth]
+            if start <= offset and offset + size <= stop \
+                    and size <= block_size:
+                for level in level_list[depth:]:
+                    prefix = rep.batch_product(level, prefix)
+                yield prefix
+                continue
+
+            below = size_list[depth + 1]
+            level = level_list[depth]
+            for i in range(len(level)):
+                lower = offset + i * below
+                if lower < stop and start < lower + below:
+                    stack.append((
+                        depth + 1,
+                        lower,
+                        rep.batch_compose(level[i:i + 1], prefix)
+                    ))
+
+    def block_list(self, count: int) -> List[Tuple[int, int]]:
+        """
+        Split indices into at least `count` ranges along top level digits
+        """
+        block_number = 1
+        for radix in self.radix_list:
+            if block_number >= count:
+                break
+            block_number *= radix
+
+        block_size = self.order // block_number
+        return [
+            (i * block_size, (i + 1) * block_size)
+            for i in range(block_number)
+        ]
+
+    def _coset(self, depth: int, digit: int) -> 'GroupElement':
+        return self.row_list[depth][digit]
+
+    def _digit_list(self, index: int) -> List[int]:
+        digit_list = []
+        for radix in reversed(self.radix_list):
+            index, digit = divmod(index, radix)
+            digit_list.append(digit)
+        digit_list.reverse()
+        return digit_list
+
+    def _build_prefix(self, digit_list, prefix_list, depth):
+        for i in range(depth, len(digit_list)):
+            element = self._coset(i, digit_list[i])
+            if i == 0:
+                prefix_list[i] = element
+            else:
+                prefix_list[i] = element + prefix_list[i - 1]
 
-class StabilizerTraveler:
+
+class StabilizerTraveler(CosetTraveler):
+    """
+    CosetTraveler over transversals of stabilizer chain. Index is kept
+    while base of the stabilizer chain is not changed.
+    """
     def __init__(self, group):
         self.group: Group = group
 
+        self.point_list: List[T] = []
+        self.key_list: List[List[T]] = []
+        self.position_list: List[Dict[T, int]] = []
+        self.transversal_list = []
+        row_list = []
+        for chain in self.group.stabilizer_chain().travel():
+            if chain.is_trivial():
+                break
+            key_list = list(chain.transversal)
+            self.point_list.append(chain.point)
+            self.key_list.append(key_list)
+            self.position_list.append({
+                key: i
+                for i, key in enumerate(key_list)
+            })
+            self.transversal_list.append(chain.transversal)
+            if isinstance(chain.transversal, dict):
+                # SchreierVector builds element on lookup, others are kept
+                row_list.append([
+                    chain.transversal[key].element
+                    for key in key_list
+                ])
+            else:
+                row_list.append(TransversalRow(key_list, chain.transversal))
+
+        super().__init__(row_list, group.represent.identity)
+
+    def rank(self, element: 'GroupElement') -> int:
+        index = 0
+        for key_list, position, transversal, point in zip(
+            self.key_list,
+            self.position_list,
+            self.transversal_list,
+            self.point_list
+        ):
+            key = element.act(point)
+            if key not in position:
+                raise ValueError('Element not in the Group')
+            index = index * len(key_list) + position[key]
+            element = element - transversal[key].element
+
+        if not element.is_identity():
+            raise ValueError('Element not in the Group')
+        return index
+
+    def coset_traveler(self) -> CosetTraveler:
+        # every row is built, for sending to other process
+        return CosetTraveler(
+            [
+                [row[digit] for digit in range(len(row))]
+                for row in self.row_list
+            ],
+            self.identity
+        )
+
+
+class TransversalRow:
+    """
+    Coset representatives of a SchreierVector in order of key_list, built
+    on lookup.
+    """
+    def __init__(self, key_list, transversal: 'SchreierVector'):
+        self.key_list = key_list
+        self.transversal = transversal
+
+    def __len__(self):
+        return len(self.key_list)
+
+    def __getitem__(self, digit: int) -> 'GroupElement':
+        return self.transversal[self.key_list[digit]].element
+
+
+class StabilizerBatchTraveler:
+    """
+    Same as StabilizerTraveler, but yield elements as blocks of matrix
+    built by GroupRep batch operation.
+    """
+    def __init__(self, group, block_size: int = BATCH_BLOCK_SIZE):
+        self.group: Group = group
+        self.block_size = block_size
+
     def visit(self):
-        stack = [(
-            self.group.stabilizer_chain(),
-            self.group.represent.identity
-        )]
+        rep = self.group.represent
 
-        while stack:
-            chain, element = stack.pop()
-            chain: StabilizerChain
-            element: GroupElement
+        level_list = []
+        for chain in self.group.stabilizer_chain().travel():
             if chain.is_trivial():
-                yield element
+                break
+            level_list.append(rep.batch([
+                t.element
+                for t in chain.transversal.values()
+            ]))
+
+        # number of elements below each level
+        size_list = [1]
+        for level in reversed(level_list):
+            size_list.append(size_list[-1] * len(level))
+        size_list.reverse()
+
+        stack = [(0, rep.batch([rep.identity]))]
+        while stack:
+            depth, prefix = stack.pop()
+            if size_list[depth] <= self.block_size:
+                for level in level_list[depth:]:
+                    prefix = rep.batch_product(level, prefix)
+                yield prefix
             else:
-                for t in chain.transversal.values():
+                level = level_list[depth]
+                for i in range(len(level)):
                     stack.append((
-                        chain.stabilizer,
-                        t.element + element
+                        depth + 1,
+                        rep.batch_compose(level[i:i + 1], prefix)
                     ))
 
 
@@ -134,6 +416,9 @@ class Group(BaseModel):
     generator: List['GroupElement']
     name: Optional[str] = ''
     _stabilizer_chain: Optional['StabilizerChain'] = None
+    _factorization = None
+    _orbit_partition = None
+    _block_systems = None
 
     def __str__(self):
         if self.name:
@@ -149,16 +434,41 @@ class Group(BaseModel):
         for g in self.generator:
             print('-', g)
 
-    def group_id(self):
-        # unique value up to isomorphism
+    def group_id(self, workers: Optional[int] = None):
+        """
+        Same value for isomorphic groups. Abelian groups are identified by
+        its abelian key, other groups by order statistics. Groups up to
+        GROUP_ID_INVARIANT_ORDER acting on listed objects also have derived
+        series, center and class structure of the isomorphism test, which
+        separate most small groups, while is_isomorphism should confirm
+        groups of same id.
+        """
         if self.is_abelian():
             key_list = [1]
             key_list.extend(self.get_abelian_key())
-        else:
-            key_list = [0]
-            for item in sorted(self.order_statistics().items()):
-                key_list.extend(item)
-
+            return int_sequence_hash('Group', key_list)
+
+        key_list = [0]
+        order_statistics = self.order_statistics(workers)
+        for item in sorted(order_statistics.items()):
+            key_list.extend(item)
+
+        if not self.represent.is_object_listed() or \
+                self.order() > GROUP_ID_INVARIANT_ORDER:
+            return int_sequence_hash('Group', key_list)
+
+        from algebra.group.abstract.isomorphism import invariant_iter
+
+        for name, value in invariant_iter(self, order_statistics):
+            if name == 'derived_series':
+                key_list.append(len(value))
+                key_list.extend(value)
+            elif name == 'center':
+                key_list.append(value)
+            elif name == 'class_structure':
+                key_list.append(len(value))
+                for (order, size), count in value:
+                    key_list.extend((order, size, count))
         return int_sequence_hash('Group', key_list)
 
     def append(self, element):
@@ -167,20 +477,64 @@ class Group(BaseModel):
     def order(self):
         return self.stabilizer_chain().order
 
-    def order_statistics(self):
+    def order_statistics(self, workers: Optional[int] = None):
+        """
+        :param workers: Count elements in this number of processes
+        :return: number of elements by order
+        """
+        if workers is not None and workers > 1:
+            from algebra.group.abstract.parallel import \
+                ParallelOrderStatisticsAlgorithm
+
+            return ParallelOrderStatisticsAlgorithm(self, workers).run()
+
         order_count = collections.defaultdict(int)
+        if self._is_batch():
+            batch_order = self.represent.batch_order
+            for matrix in StabilizerBatchTraveler(self).visit():
+                for order in batch_order(matrix).tolist():
+                    order_count[order] += 1
+            return dict(order_count)
+
         for element in self.element_list():
             order_count[element.order()] += 1
         return dict(order_count)
 
     def order_statistics_element(self):
         order_count = collections.defaultdict(list)
+        if self._is_batch():
+            rep = self.represent
+            for matrix in StabilizerBatchTraveler(self).visit():
+                order_list = rep.batch_order(matrix).tolist()
+                element_iter = rep.batch_element_list(matrix)
+                for order, element in zip(order_list, element_iter):
+                    order_count[order].append(element)
+            return dict(order_count)
+
         for element in self.element_list():
             order_count[element.order()].append(element)
         return dict(order_count)
 
-    def element_list(self) -> Iterator['GroupElement']:
-        return StabilizerTraveler(self).visit()
+    def _is_batch(self):
+        return (
+            self.represent.is_batch_available() and
+            self.order() >= BATCH_THRESHOLD
+        )
+
+    def element_list(self,
+                     start: int = 0,
+                     stop: Optional[int] = None
+                     ) -> Iterator['GroupElement']:
+        """
+        Elements of index in [start, stop), see element_rank
+        """
+        return StabilizerTraveler(self).visit(start, stop)
+
+    def element_rank(self, element: 'GroupElement') -> int:
+        return StabilizerTraveler(self).rank(element)
+
+    def element_unrank(self, index: int) -> 'GroupElement':
+        return StabilizerTraveler(self).unrank(index)
 
     def is_abelian(self):
         for g1 in self.generator:
@@ -196,6 +550,12 @@ class Group(BaseModel):
         return True
 
     def orbit(self, o: T) -> Set[T]:
+        if not self.represent.is_object_listed():
+            # no orbit partition, e.g. automorphisms acting on subgroups
+            return self._orbit_search(o)
+        return set(self.orbit_partition().orbit(o))
+
+    def _orbit_search(self, o: T) -> Set[T]:
         done = set()
         queue = {o}
         while queue:
@@ -208,38 +568,90 @@ class Group(BaseModel):
         return done
 
     def orbit_list(self):
-        o_done = set()
-        o_list = []
+        return self.orbit_partition().orbit_list()
 
-        for o in self.represent.object_list():
-            if o in o_done:
-                continue
+    def is_transitive(self):
+        return self.orbit_partition().is_transitive()
 
-            orbit = self.orbit(o)
-            if len(orbit) > 1:
-                o_list.append(orbit)
-            o_done.update(orbit)
+    def orbit_partition(self):
+        """
+        Orbits of all points, computed once and shared by orbit queries and
+        base selection of the stabilizer chain
+        """
+        if self._orbit_partition is None:
+            from algebra.group.abstract.orbit import OrbitPartition
 
-        return o_list
+            self._orbit_partition = OrbitPartition(self)
+        return self._orbit_partition
 
-    def is_transitive(self):
-        object_list = list(self.represent.object_list())
-        for o in object_list:
-            return len(self.orbit(o)) == len(object_list)
+    def minimal_block_system(self, o_list: List[T]) -> List[Set[T]]:
+        """
+        Finest block system where the given points are in one block
+        """
+        from algebra.group.abstract.block import MinimalBlockAlgorithm
+
+        return MinimalBlockAlgorithm(self, o_list).run()
+
+    def block_systems(self) -> List[List[Set[T]]]:
+        """
+        Non-trivial block systems of a transitive group, by block size
+        """
+        if self._block_systems is None:
+            from algebra.group.abstract.block import BlockSystemAlgorithm
+
+            if not self.is_transitive():
+                raise ValueError('Group should be transitive')
+            self._block_systems = BlockSystemAlgorithm(self).run()
+        return self._block_systems
+
+    def is_primitive(self) -> bool:
+        if self._block_systems is not None:
+            return not self._block_systems
+
+        from algebra.group.abstract.block import is_primitive
+
+        return is_primitive(self)
+
+    def block_action(self, system: List[Set[T]]):
+        from algebra.group.abstract.block import block_action
+
+        return block_action(self, system)
 
     def is_conjugate(self, other: 'Group') -> bool:
         if self.represent != other.represent:
             return False
 
-        if not self.is_isomorphism(other):
+        if self.order() != other.order():
+            return False
+
+        if self.class_statistics() != other.class_statistics():
             return False
 
-        for g in self.represent.as_group().element_list():
-            conjugate = self.conjugate(g)
-            if conjugate.is_equal(other):
-                return True
+        from algebra.group.abstract.backtrack import NormalizerSearch
 
-        return False
+        ambient = self.represent.as_group()
+        return NormalizerSearch(ambient, self, other).find() is not None
+
+    def class_statistics(self) -> dict:
+        # number of elements by class invariant, e.g. cycle type
+        from algebra.group.abstract.conjugacy import class_invariant
+
+        statistics = collections.defaultdict(int)
+        for conjugacy_class in self.conjugacy_classes():
+            key = class_invariant(conjugacy_class.representative)
+            statistics[key] += conjugacy_class.size
+        return dict(statistics)
+
+    def element_conjugator(self,
+                           element: 'GroupElement',
+                           other: 'GroupElement'
+                           ) -> Optional['GroupElement']:
+        """
+        g in this group with -g + element + g == other, None if not exist
+        """
+        from algebra.group.abstract.backtrack import CentralizerSearch
+
+        return CentralizerSearch(self, [element], [other]).find()
 
     def conjugate(self, other: 'GroupElement') -> 'Group':
         return Group(
@@ -268,53 +680,94 @@ class Group(BaseModel):
     def stabilizer(self, o: T) -> 'Group':
         self.represent.check_object(o)
 
-        done = set()
-        queue = {o}
-        transversal = {o: self.represent.identity}
+        if self._stabilizer_chain is not None:
+            # rebase a copy, so that indices of elements are kept
+            chain = self._stabilizer_chain.copy_chain().change_base([o])
+            return chain.stabilizer.construct()
 
-        new_generator = []
+        # Schreier generators are sifted, only new one is kept
+        chain = StabilizerChain(group=self.represent.group())
+        obj_iter = ElementContainer(self.represent.object_list())
+
+        queue = collections.deque([o])
+        transversal = {o: self.represent.identity}
         while queue:
-            c = queue.pop()
-            done.add(c)
+            c = queue.popleft()
             for g in self.generator:
                 gc = g.act(c)
-                if gc not in done:
+                if gc not in transversal:
                     transversal[gc] = transversal[c] + g
-                    queue.add(gc)
+                    queue.append(gc)
                 else:
-                    new_generator.append(
-                        transversal[c] + g - transversal[gc]
-                    )
+                    schreier = transversal[c] + g - transversal[gc]
+                    if not chain.element_test(schreier):
+                        chain.extend(schreier, obj_iter)
 
-        return Group(
-            represent=self.represent,
-            generator=[
-                g
-                for g in new_generator
-                if not g.is_identity()
-            ]
-        )
+        return chain.construct()
 
     def stabilizer_many(self, obj_list: List[T]) -> 'Group':
-        current = self
+        # pointwise stabilizer is a level of chain whose base starts with
+        # obj_list
+        obj_list = list(dict.fromkeys(obj_list))
         for obj in obj_list:
-            current = current.stabilizer(obj)
-        return current
+            self.represent.check_object(obj)
+
+        # rebase a copy, so that indices of elements are kept
+        chain = self.stabilizer_chain().copy_chain().change_base(obj_list)
+        for _ in obj_list:
+            chain = chain.stabilizer
+        return chain.construct()
 
-    def stabilizer_chain(self, is_factor: bool = False) -> 'StabilizerChain':
+    def stabilizer_chain(self,
+                         is_factor: bool = False,
+                         certainty: Optional[int] = None,
+                         order: Optional[int] = None,
+                         verify: bool = False,
+                         schreier_vector: bool = False) -> 'StabilizerChain':
+        """
+        :param is_factor: Keep the generator word of every transversal
+        :param certainty: Use randomized Schreier-Sims which stops after
+            `certainty` consecutive random elements are sifted
+        :param order: Exact order of the group, randomized Schreier-Sims
+            stops as soon as the chain reaches it. If it only divides the
+            order, the chain may be of a subgroup, unless `verify` is given
+        :param verify: Check every Schreier generator after randomized
+            Schreier-Sims, so that the chain is always correct
+        :param schreier_vector: Store transversal as Schreier vector, which
+            keeps only the generator reaching each point
+        :return:
+        """
         if self._stabilizer_chain is not None:
             # check factor info
             if not is_factor or self._stabilizer_chain.is_factor:
                 return self._stabilizer_chain
 
+        if certainty is not None or order is not None:
+            from algebra.group.abstract.schreier_sims import \
+                RandomSchreierSimsAlgorithm
+
+            chain = RandomSchreierSimsAlgorithm(
+                self,
+                certainty=certainty,
+                order=order,
+                verify=verify,
+                is_factor=is_factor,
+                schreier_vector=schreier_vector
+            ).run()
+            self._stabilizer_chain = chain
+            return chain
+
         chain = StabilizerChain(
             group=self.represent.group(),
-            is_factor=is_factor
+            is_factor=is_factor,
+            schreier_vector=schreier_vector
+        )
+        obj_iter = ElementContainer(
+            self.represent.object_list(), self.orbit_partition()
         )
-        obj_iter = ElementContainer(self.represent.object_list())
         for g in self.generator:
             if is_factor:
-                g = ElementInfo(g, [g])
+                g = ElementInfo(element=g, factor=[g])
             chain.extend(g, obj_iter)
 
         self._stabilizer_chain = chain
@@ -328,16 +781,27 @@ class Group(BaseModel):
         for stabilizer in self.stabilizer_chain().travel():
             if stabilizer.is_trivial():
                 break
-            info = random.choice(list(stabilizer.transversal.values()))
-            element += info.element
+            point = random.choice(list(stabilizer.transversal))
+            # element of chain is t_deep + ... + t_top
+            element = stabilizer.transversal[point].element + element
         return element
 
-    def factor(self, element: 'GroupElement'):
-        chain = self.stabilizer_chain(True)
-        if not self.element_test(element):
-            raise ValueError('Element not in the Group')
+    def factor(self,
+               element: 'GroupElement',
+               max_length: Optional[int] = None) -> List['GroupElement']:
+        """
+        Word of generators and their inverses whose sum is `element`.
 
-        return chain.factor(element)
+        :param max_length: Goal of the word length, see Factorization
+        """
+        return self.factorization().factor(element, max_length)
+
+    def factorization(self):
+        if self._factorization is None:
+            from algebra.group.abstract.factorization import Factorization
+
+            self._factorization = Factorization(self)
+        return self._factorization
 
     def normal_closure(self, element_list: List['GroupElement']):
         for element in element_list:
@@ -359,16 +823,28 @@ class Group(BaseModel):
 
         return chain.construct()
 
-    def center(self):
-        chain = StabilizerChain(group=self.represent.group())
-        obj_iter = ElementContainer(self.represent.object_list())
+    def derived_subgroup(self) -> 'Group':
+        # normal closure of commutators of generators
+        return self.normal_closure([
+            -a - b + a + b
+            for a, b in itertools.combinations(self.generator, 2)
+        ])
 
-        for element in self.element_list():
-            if self.is_commute(element):
-                if not chain.element_test(element):
-                    chain.extend(element, obj_iter)
+    def derived_series(self) -> List['Group']:
+        """
+        Derived subgroups until it does not change, starting from itself
+        """
+        series = [self]
+        while True:
+            derived = series[-1].derived_subgroup()
+            if derived.order() == series[-1].order():
+                return series
+            series.append(derived)
 
-        return chain.construct()
+    def center(self):
+        from algebra.group.abstract.backtrack import CentralizerSearch
+
+        return CentralizerSearch(self, self.generator).run()
 
     def is_commute(self, element: 'GroupElement'):
         for gen in self.generator:
@@ -397,57 +873,11 @@ class Group(BaseModel):
         return True
 
     def is_isomorphism(self, others: 'Group'):
-        # abelian 인지 확인한다.
-        if self.is_abelian():
-            if others.is_abelian():
-                # abelian인 경우 abelian key를 계산해서 비교ㄴㄴㄴ
-                return self.get_abelian_key() == others.get_abelian_key()
-            else:
-                return False
-        else:
-            if others.is_abelian():
-                return False
-
-        # order 확인
-        if self.order() != others.order():
-            return False
-
-        # order statistics 확인
-        if self.order_statistics() != others.order_statistics():
-            return False
-
-        # FIXME: 맞지는 않지만, 당장의 runtime을 위해 이걸로 충분할 것이다.
-        if True:
-            return True
+        if self.is_abelian() and others.is_abelian():
+            # abelian key is a complete invariant
+            return self.get_abelian_key() == others.get_abelian_key()
 
-        # 일일이 확인 |G| = |f(G)| = |H|임을 이용
-        others_statistics = others.order_statistics_element()
-        candidate_list = []
-        for gen in self.generator:
-            candidate = others_statistics[gen.order()]
-            candidate_list.append(candidate)
-
-        from algebra.group.homomorphism import GroupHomomorphism
-
-        order = self.order()
-
-        for valid_image in itertools.product(*candidate_list):
-            hom = GroupHomomorphism(
-                domain=self,
-                codomain=others,
-                mapping=dict(zip(self.generator, valid_image)),
-                raise_exception=False
-            )
-            if not hom.is_valid_structure():
-                continue
-            if hom.image().order() != order:
-                continue
-
-            return True
-
-        print("Order Statistic은 같은데 Isomorphism하지 않은 반례")
-        print(self, others)
-        return False
+        return self.isomorphism_groups(others) is not None
 
     def get_abelian_key(self) -> list[int]:
         if not self.is_abelian():
@@ -462,32 +892,103 @@ class Group(BaseModel):
     def _get_abelian_key_gen(self):
         return StabilizerOrderTraveler(self).visit()
 
-    def subgroup_list(self):
-        raise NotImplementedError(self)
+    def subgroup_list(self) -> Iterator['Group']:
+        for subgroup_class in self.conjugacy_classes_subgroups_iter():
+            yield from subgroup_class.subgroup_list()
 
     def centralizer(self, element: 'GroupElement'):
-        pass
+        from algebra.group.abstract.backtrack import CentralizerSearch
+
+        return CentralizerSearch(self, [element]).run()
 
     def normalizer(self, subgroup: 'Group'):
-        pass
+        from algebra.group.abstract.backtrack import NormalizerSearch
+
+        return NormalizerSearch(self, subgroup).run()
+
+    def set_stabilizer(self, obj_list: List[T]) -> 'Group':
+        for obj in obj_list:
+            self.represent.check_object(obj)
+
+        from algebra.group.abstract.backtrack import SetStabilizerSearch
+
+        return SetStabilizerSearch(self, obj_list).run()
 
     def conjugacy_classes(self):
-        pass
+        from algebra.group.abstract.conjugacy import ConjugacyClassAlgorithm
 
-    def conjugacy_classes_subgroups(self):
-        pass
+        return ConjugacyClassAlgorithm(self).run()
 
-    def intermediate_subgroups(self):
-        pass
+    def conjugacy_classes_subgroups_iter(self):
+        """
+        Conjugacy classes of subgroups, yielded by increasing number of prime
+        factors of the order as they are found
+        """
+        from algebra.group.abstract.lattice import SubgroupLatticeAlgorithm
 
-    def normal_subgroups(self):
-        pass
+        return SubgroupLatticeAlgorithm(self).run()
 
-    def maximal_subgroup_class_reps(self):
-        pass
+    def conjugacy_classes_subgroups(self):
+        return list(self.conjugacy_classes_subgroups_iter())
+
+    def intermediate_subgroups(self, subgroup: 'Group') -> List['Group']:
+        """
+        Subgroups strictly between `subgroup` and this group
+        """
+        order = subgroup.order()
+        result = []
+        for subgroup_class in self.conjugacy_classes_subgroups_iter():
+            size = subgroup_class.representative.order()
+            if size == order or size == self.order() or size % order != 0:
+                continue
+            for candidate in subgroup_class.subgroup_list():
+                if subgroup.is_subgroup(candidate):
+                    result.append(candidate)
+        return result
+
+    def normal_subgroups(self) -> List['Group']:
+        return [
+            subgroup_class.representative
+            for subgroup_class in self.conjugacy_classes_subgroups_iter()
+            if subgroup_class.size == 1
+        ]
+
+    def maximal_subgroup_class_reps(self) -> List['Group']:
+        """
+        A proper subgroup is maximal if no conjugate of it is in a proper
+        subgroup of larger order
+        """
+        order = self.order()
+        class_list = [
+            c for c in self.conjugacy_classes_subgroups()
+            if c.representative.order() != order
+        ]
+
+        result = []
+        for subgroup_class in class_list:
+            size = subgroup_class.representative.order()
+            upper_list = [
+                c.representative for c in class_list
+                if c.representative.order() > size and
+                c.representative.order() % size == 0
+            ]
+            is_maximal = not any(
+                conjugate.is_subgroup(upper)
+                for conjugate in subgroup_class.subgroup_list()
+                for upper in upper_list
+            )
+            if is_maximal:
+                result.append(subgroup_class.representative)
+        return result
 
     def isomorphism_groups(self, others: 'Group'):
-        pass
+        """
+        :return: GroupHomomorphism which is an isomorphism onto `others`,
+            None if they are not isomorphic
+        """
+        from algebra.group.abstract.isomorphism import IsomorphismSearch
+
+        return IsomorphismSearch(self, others).run()
 
     def automorphism_group(self):
         raise NotImplementedError(self)
@@ -497,14 +998,22 @@ class Group(BaseModel):
 
 
 class ElementContainer:
-    def __init__(self, element_list):
-        self.element_set = set(element_list)
+    """
+    Candidates of base points. With an orbit partition, points in larger
+    orbits come first and fixed points of the group are never tried.
+    """
+
+    def __init__(self, element_list, partition=None):
+        if partition is None:
+            self.element_list = list(dict.fromkeys(element_list))
+        else:
+            self.element_list = partition.base_order()
         self.element_iter = self.iter_repeat()
         self.element_used = set()
 
     def iter_repeat(self):
         while True:
-            for element in self.element_set:
+            for element in self.element_list:
                 yield element
 
     def get_next(self, group_element: 'GroupElement'):
@@ -559,7 +1068,8 @@ class ElementInfo(BaseModel):
     def length(self):
         return len(self.factor) if self.factor else 0
 
-    def _normalize_factor(self, factor_list):
+    @staticmethod
+    def _normalize_factor(factor_list):
         factor_count = []
 
         for factor in factor_list:
@@ -574,8 +1084,9 @@ class ElementInfo(BaseModel):
 
         factor_result = []
         for factor, count in factor_count:
-            order_it = count % factor.order()
-            order_left = -count % factor.order()
+            order = factor.order()
+            order_it = count % order
+            order_left = -count % order
 
             if order_it > order_left:
                 order_it = order_left
@@ -584,16 +1095,103 @@ class ElementInfo(BaseModel):
         return factor_result
 
 
+class SchreierVector(BaseModel):
+    """
+    Transversal which keeps, for every point, the previous point and the
+    label of the generator reaching it. Coset representatives are rebuilt
+    by walking back to the root, recently used ones are cached.
+    """
+    identity: ElementInfo
+    parent: Dict[T, Optional[Tuple[T, int]]] = pydantic.Field(
+        default_factory=dict
+    )
+    label_list: List[ElementInfo] = pydantic.Field(default_factory=list)
+    cache_size: int = SCHREIER_VECTOR_CACHE_SIZE
+    _label_map: Optional[Dict['GroupElement', int]] = None
+    _cache: Optional[collections.OrderedDict] = None
+
+    def model_post_init(self, __context):
+        self._label_map = {}
+        self._cache = collections.OrderedDict()
+
+    def add(self, point: T, parent: Optional[T], label: ElementInfo):
+        """
+        `point` is `label` acting on `parent`, root has no parent.
+        """
+        if parent is None:
+            self.parent[point] = None
+            return
+
+        index = self._label_map.get(label.element)
+        if index is None:
+            index = self._label_map[label.element] = len(self.label_list)
+            self.label_list.append(label)
+        self.parent[point] = parent, index
+
+    def __contains__(self, point: T):
+        return point in self.parent
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __iter__(self):
+        return iter(self.parent)
+
+    def __getitem__(self, point: T) -> ElementInfo:
+        cache = self._cache
+        if point in cache:
+            cache.move_to_end(point)
+            return cache[point]
+
+        path = []
+        current = point
+        info = self.identity
+        while self.parent[current] is not None:
+            if current in cache:
+                info = cache[current]
+                break
+            current, index = self.parent[current]
+            path.append(index)
+
+        for index in reversed(path):
+            info = info + self.label_list[index]
+
+        if self.cache_size > 0:
+            cache[point] = info
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+        return info
+
+    def keys(self):
+        return self.parent.keys()
+
+    def values(self):
+        for point in self.parent:
+            yield self[point]
+
+    def items(self):
+        for point in self.parent:
+            yield point, self[point]
+
+
 class StabilizerChain(BaseModel):
     group: Group
     point: T = None
-    transversal: Dict[T, ElementInfo] = pydantic.Field(default_factory=dict)
+    transversal: Union[Dict[T, ElementInfo], SchreierVector] = pydantic.Field(
+        default_factory=dict
+    )
     generator_factor: Dict['GroupElement', ElementInfo] = pydantic.Field(
         default_factory=dict
     )
     stabilizer: Optional['StabilizerChain'] = None
     depth: int = 0
     is_factor: bool = False
+    schreier_vector: bool = False
+
+    def model_post_init(self, __context):
+        if self.schreier_vector and not self.transversal:
+            self.transversal = SchreierVector(identity=self._identity_info())
 
     @property
     def order(self):
@@ -635,8 +1233,8 @@ class StabilizerChain(BaseModel):
             return []
 
         factor_info = ElementInfo(
-            self.group.represent.identity,
-            []
+            element=self.group.represent.identity,
+            factor=[]
         )
 
         for stabilizer in self.travel():
@@ -646,10 +1244,60 @@ class StabilizerChain(BaseModel):
             base = element.act(stabilizer.point)
             info = stabilizer.transversal[base]
             element -= info.element
-            factor_info += info
+            factor_info = info + factor_info
 
         return factor_info.factor
 
+    def sift(self, element: ElementInfo):
+        """
+        Strip element with transversal as much as possible.
+
+        :param element: Element to sift
+        :return: Residue and the chain where sifting is stopped
+        """
+        for stabilizer in self.travel():
+            if stabilizer.is_trivial():
+                return element, stabilizer
+
+            base = element.element.act(stabilizer.point)
+            if base not in stabilizer.transversal:
+                return element, stabilizer
+
+            element -= stabilizer.transversal[base]
+
+    def append_generator(self,
+                         alpha: ElementInfo,
+                         next_object: ElementContainer):
+        """
+        Add a generator on this level and extend orbit of the base point,
+        Schreier generators are not pushed to the stabilizer.
+        """
+        if self.is_trivial():
+            self.point = next_object.get_next(alpha.element)
+            self.stabilizer = self._new_layer()
+            self._set_transversal(self.point, self._identity_info())
+
+        self.group.generator.append(alpha.element)
+        self.generator_factor[alpha.element] = alpha
+
+        queue = collections.deque(
+            (delta, transversal, False)
+            for delta, transversal in self.transversal.items()
+        )
+        while queue:
+            delta, transversal, is_new = queue.popleft()
+            if is_new:
+                check_element = list(self.generator_factor.values())
+            else:
+                check_element = [alpha]
+
+            for element in check_element:
+                gamma = element.element.act(delta)
+                if gamma not in self.transversal:
+                    new_element = transversal + element
+                    self._set_transversal(gamma, new_element, delta, element)
+                    queue.append((gamma, new_element, True))
+
     def show(self):
         for stack in self.travel():
             print(f"=== STACK-{stack.depth} ===")
@@ -682,22 +1330,16 @@ class StabilizerChain(BaseModel):
 
                 # pick random object from base point
                 beta = self.point = next_object.get_next(alpha.element)
-                self.stabilizer = StabilizerChain(  # Add a new layer
-                    group=self.group.represent.group(),
-                    depth=self.depth + 1,
-                    is_factor=self.is_factor
-                )
-                self.transversal[beta] = ElementInfo(
-                    element=self.group.represent.identity,
-                    factor=[] if self.is_factor else None
-                )
+                self.stabilizer = self._new_layer()  # Add a new layer
+                self._set_transversal(beta, self._identity_info())
 
-                delta = alpha.element.act(beta)
+                previous, delta = beta, alpha.element.act(beta)
                 s = alpha  # orbit algorithm for single generator group
 
                 while delta != beta:
-                    self.transversal[delta] = s
-                    delta, s = alpha.element.act(delta), s + alpha
+                    self._set_transversal(delta, s, previous, alpha)
+                    previous, delta = delta, alpha.element.act(delta)
+                    s = s + alpha
 
                 self.stabilizer.extend(s, next_object)  # remove recursive
             else:
@@ -722,20 +1364,28 @@ class StabilizerChain(BaseModel):
                         if gamma not in self.transversal:
                             if gamma not in new_orbit:
                                 queue.put((gamma, new_element, True))
-                            new_orbit[gamma].append(new_element)
+                            new_orbit[gamma].append(
+                                (new_element, delta, element)
+                            )
                         else:
                             self.stabilizer.extend(
                                 new_element - self.transversal[gamma],
                                 next_object
                             )
 
-                for gamma, new_element_list in new_orbit.items():
-                    new_element = min(
-                        new_element_list,
-                        key=lambda e: e.length()
-                    )
-                    self.transversal[gamma] = new_element
-                    for another_element in new_element_list:
+                for gamma, candidate_list in new_orbit.items():
+                    if self.schreier_vector:
+                        # first one is reached from BFS parent, so the
+                        # Schreier tree never has a cycle
+                        candidate = candidate_list[0]
+                    else:
+                        candidate = min(
+                            candidate_list,
+                            key=lambda c: c[0].length()
+                        )
+                    new_element, delta, element = candidate
+                    self._set_transversal(gamma, new_element, delta, element)
+                    for another_element, _, _ in candidate_list:
                         if new_element == another_element:
                             continue
                         self.stabilizer.extend(
@@ -746,6 +1396,196 @@ class StabilizerChain(BaseModel):
                 self.group.generator.append(alpha.element)
                 self.generator_factor[alpha.element] = alpha
 
+    def base(self) -> List[T]:
+        return [
+            stabilizer.point
+            for stabilizer in self.travel()
+            if not stabilizer.is_trivial()
+        ]
+
+    def copy_chain(self) -> 'StabilizerChain':
+        """
+        Copy this level and below. Elements and transversals are shared,
+        since base change replaces them instead of changing them in place.
+        """
+        level_list = [stabilizer.model_copy() for stabilizer in self.travel()]
+        for level, below in zip(level_list, level_list[1:]):
+            level.stabilizer = below
+        return level_list[0]
+
+    def change_base(self, point_list: List[T]) -> 'StabilizerChain':
+        """
+        Change base in place so that it starts with `point_list`, using
+        conjugation if the point is in the orbit, otherwise moving the point
+        up from lower level by transposition.
+        """
+        level = self
+        for point in point_list:
+            if level.point != point:
+                if level.point is not None and point in level.transversal:
+                    level.conjugate(level.transversal[point])
+                else:
+                    level._lift_point(point)
+            level = level.stabilizer
+        return self
+
+    def conjugate(self, g: ElementInfo):
+        """
+        Conjugate this level and below by `g`, which should be an element of
+        this level. The group is same, but every base point is moved by `g`.
+        """
+        neg_g = -g
+        for stabilizer in self.travel():
+            if stabilizer.is_trivial():
+                break
+
+            stabilizer.point = g.element.act(stabilizer.point)
+            transversal = stabilizer.transversal
+            if isinstance(transversal, SchreierVector):
+                stabilizer.transversal = SchreierVector(
+                    identity=transversal.identity,
+                    parent={
+                        g.element.act(k): None if v is None else (
+                            g.element.act(v[0]), v[1]
+                        )
+                        for k, v in transversal.parent.items()
+                    },
+                    label_list=[
+                        neg_g + label + g
+                        for label in transversal.label_list
+                    ],
+                    cache_size=transversal.cache_size
+                )
+            else:
+                stabilizer.transversal = {
+                    g.element.act(k): neg_g + t + g
+                    for k, t in transversal.items()
+                }
+            stabilizer._set_generator([
+                neg_g + s + g
+                for s in stabilizer.generator_factor.values()
+            ])
+
+    def swap(self):
+        """
+        Transpose the base point of this level and the next level.
+        Only these two levels are changed.
+        """
+        below = self.stabilizer
+        if self.is_trivial() or below.is_trivial():
+            raise ValueError('Two base points are needed')
+
+        beta, beta_next = self.point, below.point
+        transversal = self.transversal
+        below_transversal = below.transversal
+        size = len(transversal) * len(below_transversal)
+
+        # New top level : same group, orbit of beta_next
+        self.point = beta_next
+        self._rebuild_transversal()
+        size //= len(self.transversal)
+
+        # New lower level : stabilizer of beta_next, orbit of beta
+        generator_list = list(below.stabilizer.generator_factor.values())
+        orbit = self._orbit_points(beta, generator_list)
+        excluded = set()
+        while len(orbit) < size:
+            gamma = next(
+                gamma for gamma in transversal
+                if gamma not in orbit and gamma not in excluded
+            )
+            g = transversal[gamma]
+            point = (-g.element).act(beta_next)
+            if point in below_transversal:
+                # fix beta_next and move beta to gamma
+                generator_list.append(below_transversal[point] + g)
+                orbit = self._orbit_points(beta, generator_list)
+            else:
+                excluded.update(self._orbit_points(gamma, generator_list))
+
+        below.point = beta
+        below._set_generator(generator_list)
+        below._rebuild_transversal()
+
+    def _lift_point(self, point: T):
+        level_list = []
+        for stabilizer in self.travel():
+            level_list.append(stabilizer)
+            if stabilizer.point == point:
+                break
+        else:
+            # insert redundant base point at the bottom
+            bottom = level_list[-1]
+            bottom.point = point
+            bottom.stabilizer = bottom._new_layer()
+            bottom._rebuild_transversal()
+
+        level_list.pop()
+        for stabilizer in reversed(level_list):
+            stabilizer.swap()
+
+    def _set_generator(self, generator_list: List[ElementInfo]):
+        self.group = self.group.represent.group([
+            g.element for g in generator_list
+        ])
+        self.generator_factor = {g.element: g for g in generator_list}
+
+    def _rebuild_transversal(self):
+        if self.schreier_vector:
+            self.transversal = SchreierVector(identity=self._identity_info())
+        else:
+            self.transversal = {}
+        self._set_transversal(self.point, self._identity_info())
+
+        generator_list = list(self.generator_factor.values())
+        queue = collections.deque([(self.point, self._identity_info())])
+        while queue:
+            delta, transversal = queue.popleft()
+            for element in generator_list:
+                gamma = element.element.act(delta)
+                if gamma not in self.transversal:
+                    new_element = transversal + element
+                    self._set_transversal(gamma, new_element, delta, element)
+                    queue.append((gamma, new_element))
+
+    @staticmethod
+    def _orbit_points(point: T, generator_list: List[ElementInfo]) -> Set[T]:
+        orbit = {point}
+        queue = [point]
+        while queue:
+            delta = queue.pop()
+            for element in generator_list:
+                gamma = element.element.act(delta)
+                if gamma not in orbit:
+                    orbit.add(gamma)
+                    queue.append(gamma)
+        return orbit
+
+    def _new_layer(self) -> 'StabilizerChain':
+        return StabilizerChain(
+            group=self.group.represent.group(),
+            depth=self.depth + 1,
+            is_factor=self.is_factor,
+            schreier_vector=self.schreier_vector
+        )
+
+    def _identity_info(self) -> ElementInfo:
+        return ElementInfo(
+            element=self.group.represent.identity,
+            factor=[] if self.is_factor else None
+        )
+
+    def _set_transversal(self,
+                         gamma: T,
+                         info: ElementInfo,
+                         parent: Optional[T] = None,
+                         label: Optional[ElementInfo] = None):
+        # `info` is `label` acting after transversal of `parent`
+        if isinstance(self.transversal, SchreierVector):
+            self.transversal.add(gamma, parent, label)
+        else:
+            self.transversal[gamma] = info
+
     def construct(self):
         new_group = self.group.copy()
         new_group._stabilizer_chain = self
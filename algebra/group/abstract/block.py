@@ -0,0 +1,152 @@
+from typing import Dict, FrozenSet, List, Set
+
+from algebra.group.abstract.base import Group, T
+from algebra.group.abstract.permutation import PermutationGroupRep
+from algebra.group.homomorphism import GroupHomomorphism
+
+
+class MinimalBlockAlgorithm:
+    """
+    Atkinson's algorithm. Given points are merged into one class, then
+    classes are merged by union-find until images of every merged pair
+    under generators fall in the same class. The classes form the finest
+    block system where the given points are in one block.
+    """
+
+    def __init__(self, group: Group, point_list: List[T]):
+        if not group.is_transitive():
+            raise ValueError('Group should be transitive')
+
+        self.partition = group.orbit_partition()
+        self.index_list = [self.partition.index[p] for p in point_list]
+
+    def run(self) -> List[Set[T]]:
+        size = len(self.partition.point_list)
+        parent = list(range(size))
+        queue = []
+
+        def union(i: int, j: int):
+            i, j = self._find(parent, i), self._find(parent, j)
+            if i == j:
+                return
+            if j < i:
+                i, j = j, i
+            parent[j] = i
+            queue.append((i, j))
+
+        first = self.index_list[0]
+        for i in self.index_list[1:]:
+            union(first, i)
+
+        image_list = self.partition.image_list
+        while queue:
+            i, j = queue.pop()
+            for image in image_list:
+                union(image[i], image[j])
+
+        block_map: Dict[int, Set[T]] = {}
+        for i, point in enumerate(self.partition.point_list):
+            block_map.setdefault(self._find(parent, i), set()).add(point)
+        return list(block_map.values())
+
+    @staticmethod
+    def _find(parent: List[int], i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+
+class BlockSystemAlgorithm:
+    """
+    All non-trivial block systems of a transitive group.
+
+    A block containing the first point `a` is a union of minimal blocks of
+    `{a, b}`, and the minimal block only depends on the orbit of `b` under
+    the stabilizer of `a`. So minimal blocks of suborbit representatives
+    are computed, then closed under joins.
+    """
+
+    def __init__(self, group: Group):
+        self.group = group
+        self.point_list = group.orbit_partition().point_list
+
+    def run(self) -> List[List[Set[T]]]:
+        if len(self.point_list) < 2:
+            return []
+
+        alpha = self.point_list[0]
+        system_map: Dict[FrozenSet[T], List[Set[T]]] = {}
+        queue = []
+        for beta in self.suborbit_representative_list():
+            self._add(system_map, queue, [alpha, beta])
+
+        while queue:
+            block = queue.pop()
+            for other in list(system_map):
+                self._add(system_map, queue, list(block | other))
+
+        system_list = list(system_map.values())
+        system_list.sort(key=lambda s: len(s[0]))
+        return system_list
+
+    def suborbit_representative_list(self) -> List[T]:
+        alpha = self.point_list[0]
+        partition = self.group.stabilizer(alpha).orbit_partition()
+        point_list = partition.point_list
+        return [
+            point_list[root]
+            for root in partition.member
+            if point_list[root] != alpha
+        ]
+
+    def _add(self, system_map, queue, point_list: List[T]):
+        system = MinimalBlockAlgorithm(self.group, point_list).run()
+        if len(system) == 1:
+            return
+
+        block = next(b for b in system if point_list[0] in b)
+        key = frozenset(block)
+        if key in system_map:
+            return
+        system_map[key] = system
+        queue.append(key)
+
+
+def is_primitive(group: Group) -> bool:
+    if not group.is_transitive():
+        return False
+
+    algorithm = BlockSystemAlgorithm(group)
+    if len(algorithm.point_list) < 2:
+        return True
+
+    alpha = algorithm.point_list[0]
+    for beta in algorithm.suborbit_representative_list():
+        system = MinimalBlockAlgorithm(group, [alpha, beta]).run()
+        if len(system) > 1:
+            return False
+    return True
+
+
+def block_action(group: Group, system: List[Set[T]]) -> GroupHomomorphism:
+    """
+    Action on blocks, a homomorphism into the symmetric group of degree
+    the number of blocks
+    """
+    block_index = {}
+    for i, block in enumerate(system):
+        for point in block:
+            block_index[point] = i
+
+    rep = PermutationGroupRep(degree=len(system))
+    mapping = {}
+    for g in group.generator:
+        cycle = {
+            i: block_index[g.act(next(iter(block)))]
+            for i, block in enumerate(system)
+        }
+        mapping[g] = rep.element([cycle])
+
+    codomain = rep.group(list(mapping.values()))
+    return GroupHomomorphism(domain=group, codomain=codomain, mapping=mapping)
@@ -0,0 +1,146 @@
+import collections
+import math
+from typing import Hashable, List, Optional
+
+from pydantic import BaseModel, PrivateAttr
+
+from algebra.group.abstract.base import Group, GroupElement
+from algebra.group.abstract.permutation import PermutationGroupRep
+from algebra.util.partitions import integer_partition_list
+
+# Random elements without new class before every element is visited
+CONJUGACY_RANDOM_LIMIT = 64
+
+
+def class_invariant(element: GroupElement) -> Hashable:
+    """
+    Same value on a conjugacy class, cycle type for permutation
+    """
+    if isinstance(element.group, PermutationGroupRep):
+        return element.cycle_type()
+    return element.order()
+
+
+class ConjugacyClass(BaseModel):
+    group: Group
+    representative: GroupElement
+    size: int
+
+    _centralizer: Optional[Group] = PrivateAttr(default=None)
+
+    def centralizer(self) -> Group:
+        if self._centralizer is None:
+            self._centralizer = self.group.centralizer(self.representative)
+        return self._centralizer
+
+    def element_test(self, element: GroupElement) -> bool:
+        if class_invariant(element) != class_invariant(self.representative):
+            return False
+        return self.group.element_conjugator(
+            self.representative, element
+        ) is not None
+
+
+class ConjugacyClassAlgorithm:
+    def __init__(self, group: Group):
+        self.group = group
+        self.order = group.order()
+        self.class_list: List[ConjugacyClass] = []
+        self.class_map = collections.defaultdict(list)
+        self.total = 0
+
+    def run(self) -> List[ConjugacyClass]:
+        if self._is_symmetric():
+            return self._symmetric_class_list()
+
+        for element in self._candidate_iter():
+            if self.total == self.order:
+                break
+            self._append(element)
+
+        self.class_list.sort(
+            key=lambda c: (c.representative.order(), c.size)
+        )
+        return self.class_list
+
+    def _append(self, element: GroupElement) -> bool:
+        key = class_invariant(element)
+        for conjugacy_class in self.class_map[key]:
+            if conjugacy_class.element_test(element):
+                return False
+
+        centralizer = self.group.centralizer(element)
+        conjugacy_class = ConjugacyClass(
+            group=self.group,
+            representative=element,
+            size=self.order // centralizer.order()
+        )
+        conjugacy_class._centralizer = centralizer
+
+        self.class_list.append(conjugacy_class)
+        self.class_map[key].append(conjugacy_class)
+        self.total += conjugacy_class.size
+        return True
+
+    def _candidate_iter(self):
+        # powers of new representative are likely to be new
+        yield self.group.represent.identity
+
+        miss = 0
+        while miss < CONJUGACY_RANDOM_LIMIT:
+            element = self.group.random_element()
+            if self.total == self.order:
+                return
+            if self._append(element):
+                miss = 0
+                yield from self._power_list(element)
+            else:
+                miss += 1
+
+        # rare classes are left, visit every element
+        yield from self.group.element_list()
+
+    @staticmethod
+    def _power_list(element: GroupElement):
+        current = element + element
+        while not current.is_identity():
+            yield current
+            current += element
+
+    def _is_symmetric(self) -> bool:
+        if not isinstance(self.group.represent, PermutationGroupRep):
+            return False
+
+        return self.order == math.factorial(len(self._support()))
+
+    def _support(self):
+        support = set()
+        for orbit in self.group.orbit_list():
+            support.update(orbit)
+        return sorted(support)
+
+    def _symmetric_class_list(self) -> List[ConjugacyClass]:
+        # classes of symmetric group are cycle types
+        rep = self.group.represent
+        support = self._support()
+
+        for partition in integer_partition_list(len(support)):
+            cycle_list = []
+            start = 0
+            for length in partition:
+                if length > 1:
+                    cycle_list.append(support[start:start + length])
+                start += length
+
+            centralizer_order = 1
+            for length, count in collections.Counter(partition).items():
+                centralizer_order *= length ** count * math.factorial(count)
+
+            self.class_list.append(ConjugacyClass(
+                group=self.group,
+                representative=rep.element(cycle_list),
+                size=self.order // centralizer_order
+            ))
+
+        self.class_list.reverse()
+        return self.class_list
@@ -0,0 +1,167 @@
+import collections
+import functools
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+from algebra.group.abstract.base import ElementInfo, Group, GroupElement
+
+# Words of at most this length are tabulated by breadth first search
+FACTOR_DEPTH = 8
+# Breadth first search stops when the table reaches this size
+FACTOR_TABLE_SIZE = 1 << 14
+# Number of shortest table words tried from the element side
+FACTOR_MEET_SIZE = 1 << 8
+# Number of factorized elements kept
+FACTOR_CACHE_SIZE = 1 << 12
+
+Word = Tuple[GroupElement, ...]
+
+
+class Factorization:
+    """
+    Factorize elements into words of generators and their inverses.
+
+    Short words of every element within `depth` of the identity are
+    tabulated once, when a word is first requested. An element is written
+    as `a + b` with `a` in the table and `b` one of `meet_size` shortest
+    words, which is a bidirectional search. Other elements are sifted
+    through the stabilizer chain and the short words of its transversal
+    elements are concatenated, so that a new element costs only the depth
+    of the chain once transversal words are known.
+    """
+
+    def __init__(self,
+                 group: Group,
+                 depth: int = FACTOR_DEPTH,
+                 table_size: int = FACTOR_TABLE_SIZE,
+                 meet_size: int = FACTOR_MEET_SIZE,
+                 cache_size: int = FACTOR_CACHE_SIZE):
+        self.group = group
+        self.chain = group.stabilizer_chain(True)
+        self.depth = depth
+        self.table_size = table_size
+        self.meet_size = meet_size
+        self.cache_size = cache_size
+
+        self.letter_list: List[GroupElement] = []
+        for g in group.generator:
+            for letter in (g, -g):
+                if not letter.is_identity() and \
+                        letter not in self.letter_list:
+                    self.letter_list.append(letter)
+
+        self.transversal_word: Dict[GroupElement, Word] = {}
+        self._cache: collections.OrderedDict = collections.OrderedDict()
+
+    @functools.cached_property
+    def table(self) -> Dict[GroupElement, Word]:
+        # breadth first, so the first word found is a shortest one
+        identity = self.group.represent.identity
+        table = {identity: ()}
+        frontier = [identity]
+        for _ in range(self.depth):
+            next_frontier = []
+            for element in frontier:
+                word = table[element]
+                for letter in self.letter_list:
+                    new_element = element + letter
+                    if new_element not in table:
+                        table[new_element] = word + (letter,)
+                        next_frontier.append(new_element)
+                        if len(table) >= self.table_size:
+                            return table
+            frontier = next_frontier
+        return table
+
+    @functools.cached_property
+    def meet_list(self) -> List[Tuple[GroupElement, Word]]:
+        # table is ordered by word length
+        return list(itertools.islice(self.table.items(), self.meet_size))
+
+    def sift(self, element: GroupElement) -> Optional[List[ElementInfo]]:
+        """
+        :return: Transversal elements from the top of the chain, `element`
+            is the sum of them in reverse order. None if `element` is not
+            in the group
+        """
+        info_list = []
+        for stabilizer in self.chain.travel():
+            if stabilizer.is_trivial():
+                break
+
+            base = element.act(stabilizer.point)
+            if base not in stabilizer.transversal:
+                return None
+
+            info = stabilizer.transversal[base]
+            element -= info.element
+            info_list.append(info)
+
+        if not element.is_identity():
+            return None
+        return info_list
+
+    def short_word(self, element: GroupElement) -> Optional[Word]:
+        """
+        Shortest word through the table, None if it is not found.
+        """
+        word = self.table.get(element)
+        if word is not None:
+            return word
+
+        best = None
+        for right, right_word in self.meet_list:
+            if best is not None and len(right_word) >= len(best):
+                break
+            left_word = self.table.get(element - right)
+            if left_word is None:
+                continue
+            if best is None or len(left_word) + len(right_word) < len(best):
+                best = left_word + right_word
+        return best
+
+    def word_of_transversal(self, info: ElementInfo) -> Word:
+        word = self.transversal_word.get(info.element)
+        if word is None:
+            word = self.short_word(info.element)
+            if word is None or len(word) > len(info.factor):
+                word = tuple(info.factor)
+            self.transversal_word[info.element] = word
+        return word
+
+    def factor(self,
+               element: GroupElement,
+               max_length: Optional[int] = None) -> List[GroupElement]:
+        """
+        :param max_length: Try the direct search of the table when the word
+            from the chain is longer than it. The word is not guaranteed to
+            be shorter, as the table has limited depth
+        :return: Letters whose sum is `element`
+        """
+        cache = self._cache
+        word = cache.get(element)
+        if word is None:
+            word = self.table.get(element)
+        if word is None:
+            info_list = self.sift(element)
+            if info_list is None:
+                raise ValueError('Element not in the Group')
+
+            word = []
+            for info in info_list:
+                word = ElementInfo._normalize_factor(
+                    list(self.word_of_transversal(info)) + word
+                )
+            word = tuple(word)
+
+        if max_length is not None and len(word) > max_length:
+            short = self.short_word(element)
+            if short is not None and len(short) < len(word):
+                word = short
+
+        cache[element] = word
+        cache.move_to_end(element)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+        return list(word)
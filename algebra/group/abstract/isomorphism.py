@@ -0,0 +1,139 @@
+import collections
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from algebra.group.abstract.base import Group, GroupElement
+from algebra.group.homomorphism import GroupHomomorphism
+
+
+def invariant_iter(group: Group,
+                   order_statistics: Optional[Dict[int, int]] = None
+                   ) -> Iterator[Tuple[str, Any]]:
+    """
+    Isomorphism invariants from the cheapest one. Abelian key decides the
+    isomorphism type of an abelian group, so nothing follows it.
+
+    :param order_statistics: Order statistics if already computed
+    """
+    yield 'order', group.order()
+
+    is_abelian = group.is_abelian()
+    yield 'abelian', is_abelian
+    if is_abelian:
+        yield 'abelian_key', tuple(group.get_abelian_key())
+        return
+
+    yield 'derived_series', tuple(g.order() for g in group.derived_series())
+    yield 'center', group.center().order()
+    if order_statistics is None:
+        order_statistics = group.order_statistics()
+    yield 'order_statistics', tuple(sorted(order_statistics.items()))
+
+    class_count = collections.Counter(
+        (c.representative.order(), c.size)
+        for c in group.conjugacy_classes()
+    )
+    yield 'class_structure', tuple(sorted(class_count.items()))
+
+
+def is_invariant_equal(group: Group, other: Group) -> bool:
+    for (_, left), (_, right) in zip(invariant_iter(group),
+                                     invariant_iter(other)):
+        if left != right:
+            return False
+    return True
+
+
+class IsomorphismSearch:
+    """
+    Find an isomorphism by assigning images to generators one by one.
+
+    Image of the first generator is taken among representatives of
+    conjugacy classes, as an isomorphism can be followed by an inner
+    automorphism. A partial assignment should keep orders of products of two
+    generators and the order of the subgroup generated so far. A complete
+    assignment is checked by relators of the domain chain.
+    """
+
+    def __init__(self, group: Group, other: Group):
+        self.group = group
+        self.other = other
+
+        self.generator_list: List[GroupElement] = []
+        for g in group.generator:
+            if not g.is_identity() and g not in self.generator_list:
+                self.generator_list.append(g)
+
+        self.prefix_order: List[int] = []
+        self.candidate_list: List[List[GroupElement]] = []
+
+    def run(self) -> Optional[GroupHomomorphism]:
+        if not is_invariant_equal(self.group, self.other):
+            return None
+
+        self._prepare()
+        return self._search([])
+
+    def _prepare(self):
+        rep = self.group.represent
+        for i in range(len(self.generator_list)):
+            prefix = rep.group(self.generator_list[:i + 1])
+            self.prefix_order.append(prefix.order())
+
+        element_by_order = self.other.order_statistics_element()
+        for i, g in enumerate(self.generator_list):
+            if i == 0:
+                candidate = [
+                    c.representative
+                    for c in self.other.conjugacy_classes()
+                    if c.representative.order() == g.order()
+                ]
+            else:
+                candidate = element_by_order.get(g.order(), [])
+            self.candidate_list.append(candidate)
+
+    def _search(self, image_list: List[GroupElement]
+                ) -> Optional[GroupHomomorphism]:
+        depth = len(image_list)
+        if depth == len(self.generator_list):
+            return self._homomorphism(image_list)
+
+        for h in self.candidate_list[depth]:
+            if not self._is_consistent(image_list, h):
+                continue
+
+            result = self._search(image_list + [h])
+            if result is not None:
+                return result
+        return None
+
+    def _is_consistent(self, image_list: List[GroupElement],
+                       h: GroupElement) -> bool:
+        depth = len(image_list)
+        g = self.generator_list[depth]
+        for g_prev, h_prev in zip(self.generator_list, image_list):
+            if (g + g_prev).order() != (h + h_prev).order():
+                return False
+            if (g - g_prev).order() != (h - h_prev).order():
+                return False
+
+        if depth == 0:
+            return True
+        subgroup = self.other.represent.group(image_list + [h])
+        return subgroup.order() == self.prefix_order[depth]
+
+    def _homomorphism(self, image_list: List[GroupElement]
+                      ) -> Optional[GroupHomomorphism]:
+        mapping = dict(zip(self.generator_list, image_list))
+        for g in self.group.generator:
+            mapping.setdefault(g, self.other.represent.identity)
+
+        hom = GroupHomomorphism(
+            domain=self.group,
+            codomain=self.other,
+            mapping=mapping,
+            raise_exception=False
+        )
+        # images generate a group of the same order, so it is bijective
+        if hom.is_valid_structure():
+            return hom
+        return None
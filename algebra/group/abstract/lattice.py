@@ -0,0 +1,217 @@
+import collections
+from typing import Dict, Iterator, List, Tuple
+
+from pydantic import BaseModel
+
+from algebra.group.abstract.backtrack import NormalizerSearch
+from algebra.group.abstract.base import Group, GroupElement
+from algebra.group.abstract.conjugacy import class_invariant
+from algebra.number.util import factorize
+
+
+def prime_power(n: int) -> Tuple[int, int]:
+    """
+    (p, k) with n == p ** k, (1, 0) for 1 and (0, 0) for others
+    """
+    if n == 1:
+        return 1, 0
+    factor = factorize(n)
+    if len(factor) != 1:
+        return 0, 0
+    return next(iter(factor.items()))
+
+
+def multiple(element: GroupElement, n: int) -> GroupElement:
+    result = element.group.identity
+    for _ in range(n):
+        result += element
+    return result
+
+
+class SubgroupClass(BaseModel):
+    group: Group
+    representative: Group
+    normalizer: Group
+
+    @property
+    def size(self) -> int:
+        # number of conjugate subgroups
+        return self.group.order() // self.normalizer.order()
+
+    def subgroup_list(self) -> Iterator[Group]:
+        """
+        Conjugates of the representative, found by conjugating with the
+        generators of group until no new subgroup appears.
+        """
+        if self.size == 1:
+            yield self.representative
+            return
+
+        rep = self.representative
+        done = {self._key(rep)}
+        queue = collections.deque([rep])
+        yield rep
+        while queue:
+            current = queue.popleft()
+            for g in self.group.generator:
+                conjugate = current.conjugate(g)
+                key = self._key(conjugate)
+                if key in done:
+                    continue
+                done.add(key)
+                queue.append(conjugate)
+                yield conjugate
+
+    @staticmethod
+    def _key(group: Group) -> frozenset:
+        return frozenset(group.element_list())
+
+
+class SubgroupLatticeAlgorithm:
+    """
+    Conjugacy classes of subgroups by cyclic extension.
+
+    A subgroup which is not perfect has a normal subgroup `U` of prime
+    index `p`, and it is generated by `U` and an element `z` of p-power
+    order which normalizes `U` with `p * z` in `U`. So subgroups are found
+    layer by layer, a layer is the number of prime factors of the order,
+    taking `z` among class representatives of the normalizer of `U`.
+
+    Perfect subgroups are seeded by subgroups generated by an involution
+    and an element of prime order of the perfect residual, which covers
+    every simple group. Candidates are deduplicated by an invariant index
+    and a conjugacy test in the group.
+    """
+
+    def __init__(self, group: Group):
+        self.group = group
+        self.index: Dict[tuple, List[SubgroupClass]] = \
+            collections.defaultdict(list)
+
+    def run(self) -> Iterator[SubgroupClass]:
+        trivial = self.group.represent.group()
+        seed_map = self._perfect_seed_map()
+
+        layer = [self._insert(trivial)]
+        yield layer[0]
+
+        for depth in range(1, self._length(self.group.order()) + 1):
+            next_layer = []
+            candidate_iter = (
+                subgroup
+                for subgroup_class in layer
+                for subgroup in self._extension(subgroup_class)
+            )
+            for subgroup in candidate_iter:
+                subgroup_class = self._insert(subgroup)
+                if subgroup_class is not None:
+                    next_layer.append(subgroup_class)
+                    yield subgroup_class
+
+            for subgroup in seed_map.get(depth, []):
+                subgroup_class = self._insert(subgroup)
+                if subgroup_class is not None:
+                    next_layer.append(subgroup_class)
+                    yield subgroup_class
+
+            layer = next_layer
+
+    @staticmethod
+    def _length(order: int) -> int:
+        # number of prime factors with multiplicity
+        return sum(factorize(order).values()) if order > 1 else 0
+
+    def _extension(self, subgroup_class: SubgroupClass) -> Iterator[Group]:
+        subgroup = subgroup_class.representative
+        normalizer = subgroup_class.normalizer
+        if normalizer.order() == subgroup.order():
+            return
+
+        for element_class in normalizer.conjugacy_classes():
+            z = element_class.representative
+            p, _ = prime_power(z.order())
+            if p < 2 or subgroup.element_test(z):
+                continue
+            if not subgroup.element_test(multiple(z, p)):
+                continue
+            yield subgroup.append(z)
+
+    def _perfect_seed_map(self) -> Dict[int, List[Group]]:
+        residual = self.group.derived_series()[-1]
+        if residual.order() == 1:
+            return {}
+
+        involution_list = [
+            c.representative
+            for c in self.group.conjugacy_classes()
+            if c.representative.order() == 2 and
+            residual.element_test(c.representative)
+        ]
+
+        seed_map = collections.defaultdict(list)
+        for x in involution_list:
+            centralizer = self.group.centralizer(x)
+            for y in self._orbit_representative_list(residual, centralizer):
+                if prime_power(y.order())[1] != 1:
+                    continue
+                candidate = self.group.represent.group([x, y])
+                order = candidate.order()
+                # non-solvable, by Burnside's p^a q^b theorem
+                if order % 4 != 0 or len(factorize(order)) < 3:
+                    continue
+                if candidate.derived_subgroup().order() != order:
+                    continue
+                seed_map[self._length(order)].append(candidate)
+        return seed_map
+
+    @staticmethod
+    def _orbit_representative_list(group: Group, acting: Group
+                                   ) -> List[GroupElement]:
+        # elements of group up to conjugation by acting
+        done = set()
+        result = []
+        for element in group.element_list():
+            if element in done:
+                continue
+            result.append(element)
+            queue = [element]
+            done.add(element)
+            while queue:
+                current = queue.pop()
+                for g in acting.generator:
+                    conjugate = -g + current + g
+                    if conjugate not in done:
+                        done.add(conjugate)
+                        queue.append(conjugate)
+        return result
+
+    def _invariant(self, subgroup: Group) -> tuple:
+        orbit_length = sorted(len(o) for o in subgroup.orbit_list())
+        statistics = collections.Counter(
+            class_invariant(element) for element in subgroup.element_list()
+        )
+        return (
+            subgroup.order(),
+            tuple(orbit_length),
+            frozenset(statistics.items())
+        )
+
+    def _insert(self, subgroup: Group):
+        """
+        :return: New class of the subgroup, None if it is already found
+        """
+        key = self._invariant(subgroup)
+        for subgroup_class in self.index[key]:
+            found = NormalizerSearch(
+                self.group, subgroup_class.representative, subgroup
+            ).find()
+            if found is not None:
+                return None
+
+        subgroup_class = SubgroupClass(
+            group=self.group,
+            representative=subgroup,
+            normalizer=self.group.normalizer(subgroup)
+        )
+        self.index[key].append(subgroup_class)
+        return subgroup_class
@@ -0,0 +1,109 @@
+import collections
+from typing import Dict, List, Optional, Set, Tuple
+
+from algebra.group.abstract.base import Group, GroupElement, T
+
+
+class OrbitPartition:
+    """
+    Orbits of every point in one pass. Points are indexed by their position
+    in object_list, and images of generators are merged by union-find.
+    """
+
+    def __init__(self, group: Group):
+        self.group = group
+        self.point_list = list(group.represent.object_list())
+        self.index: Dict[T, int] = {
+            point: i for i, point in enumerate(self.point_list)
+        }
+        self.image_list: List[List[int]] = [
+            self._image(g) for g in group.generator
+        ]
+
+        parent = list(range(len(self.point_list)))
+        for image in self.image_list:
+            for i, j in enumerate(image):
+                root_i, root_j = self._find(parent, i), self._find(parent, j)
+                if root_i != root_j:
+                    # smaller index is the root, so orbits are ordered
+                    if root_i < root_j:
+                        parent[root_j] = root_i
+                    else:
+                        parent[root_i] = root_j
+
+        self.root = [self._find(parent, i) for i in parent]
+        self.member: Dict[int, List[int]] = collections.defaultdict(list)
+        for i, root in enumerate(self.root):
+            self.member[root].append(i)
+
+    @staticmethod
+    def _find(parent: List[int], i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _image(self, g: GroupElement) -> List[int]:
+        index = self.index
+        return [index[g.act(point)] for point in self.point_list]
+
+    def orbit(self, point: T) -> List[T]:
+        root = self.root[self.index[point]]
+        return [self.point_list[i] for i in self.member[root]]
+
+    def orbit_size(self, point: T) -> int:
+        return len(self.member[self.root[self.index[point]]])
+
+    def orbit_list(self) -> List[Set[T]]:
+        """
+        Non-trivial orbits, ordered by their first point
+        """
+        return [
+            {self.point_list[i] for i in member}
+            for member in self.member.values()
+            if len(member) > 1
+        ]
+
+    def is_transitive(self) -> bool:
+        return len(self.member) == 1
+
+    def is_same_orbit(self, point: T, other: T) -> bool:
+        return self.root[self.index[point]] == self.root[self.index[other]]
+
+    def schreier_tree(self, point: T
+                      ) -> Dict[T, Optional[Tuple[T, GroupElement]]]:
+        """
+        Breadth first tree of the orbit, every point maps to its parent and
+        the generator moving the parent to it, root maps to None.
+        """
+        start = self.index[point]
+        tree: List[Optional[Tuple[int, int]]] = [None] * len(self.point_list)
+        visited = bytearray(len(self.point_list))
+        visited[start] = 1
+        queue = collections.deque([start])
+        while queue:
+            i = queue.popleft()
+            for k, image in enumerate(self.image_list):
+                j = image[i]
+                if not visited[j]:
+                    visited[j] = 1
+                    tree[j] = i, k
+                    queue.append(j)
+
+        point_list = self.point_list
+        generator = self.group.generator
+        result = {point: None}
+        for i in self.member[self.root[start]]:
+            if tree[i] is not None:
+                parent, k = tree[i]
+                result[point_list[i]] = point_list[parent], generator[k]
+        return result
+
+    def base_order(self) -> List[T]:
+        """
+        Moved points from larger orbits, a good order of base points
+        """
+        moved = [i for i, root in enumerate(self.root)
+                 if len(self.member[root]) > 1]
+        moved.sort(key=lambda i: (-len(self.member[self.root[i]]), i))
+        return [self.point_list[i] for i in moved]
@@ -0,0 +1,59 @@
+import collections
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+from algebra.group.abstract.base import CosetTraveler, Group, \
+    StabilizerTraveler
+
+# Index blocks for each worker, more blocks balance uneven workers
+PARALLEL_BLOCK_PER_WORKER = 4
+
+
+def order_statistics_block(traveler: CosetTraveler,
+                           start: int,
+                           stop: int,
+                           batch: bool = False) -> Dict[int, int]:
+    order_count = collections.defaultdict(int)
+    if batch:
+        batch_order = traveler.identity.group.batch_order
+        for matrix in traveler.batch_visit(start, stop):
+            for order in batch_order(matrix).tolist():
+                order_count[order] += 1
+        return dict(order_count)
+
+    for element in traveler.visit(start, stop):
+        order_count[element.order()] += 1
+    return dict(order_count)
+
+
+class ParallelOrderStatisticsAlgorithm:
+    """
+    Order statistics whose index blocks, split along top levels of the
+    stabilizer chain, are counted by worker processes and merged.
+    """
+    def __init__(self, group: Group, workers: int):
+        self.group = group
+        self.workers = workers
+
+    def run(self) -> Dict[int, int]:
+        # rows of coset representatives are sent instead of the group
+        traveler = StabilizerTraveler(self.group).coset_traveler()
+        block_list = traveler.block_list(
+            self.workers * PARALLEL_BLOCK_PER_WORKER
+        )
+
+        batch = self.group._is_batch()
+
+        order_count = collections.defaultdict(int)
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            future_list = [
+                executor.submit(
+                    order_statistics_block, traveler, start, stop, batch
+                )
+                for start, stop in block_list
+            ]
+            for future in future_list:
+                for order, count in future.result().items():
+                    order_count[order] += count
+
+        return dict(order_count)
@@ -1,9 +1,21 @@
+import functools
+from array import array
+
 import pydantic
 from pydantic import BaseModel
-from typing import Dict, Type
+from typing import Dict, Type, Tuple
 
 from algebra.group.abstract.base import GroupRep, GroupElement
 from algebra.number.util import lcm
+from algebra.util.model import construct
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, batch operations are disabled
+    numpy = None
+
+# Landau's function g(n) fits in int64 up to this degree
+BATCH_LCM_DEGREE = 256
 
 
 class PermutationObject(BaseModel):
@@ -20,23 +32,78 @@ class PermutationObject(BaseModel):
         return self.value < other.value
 
 
+class CycleType:
+    """
+    Lengths of non-trivial cycles in non-increasing order, which is same on
+    a conjugacy class of symmetric group. Order is computed once.
+    """
+    __slots__ = ('length', 'order')
+
+    def __init__(self, length):
+        self.length: Tuple[int, ...] = tuple(sorted(length, reverse=True))
+        self.order: int = functools.reduce(lcm, self.length, 1)
+
+    def __eq__(self, other):
+        if not isinstance(other, CycleType):
+            return NotImplemented
+        return self.length == other.length
+
+    def __hash__(self):
+        return hash(self.length)
+
+    def __lt__(self, other):
+        return self.length < other.length
+
+    def __iter__(self):
+        return iter(self.length)
+
+    def __len__(self):
+        return len(self.length)
+
+    def __repr__(self):
+        return f'CycleType{self.length}'
+
+    def support(self) -> int:
+        # number of moved points
+        return sum(self.length)
+
+
 class PermutationGroupRep(GroupRep):
     degree: int
+    compact: bool = False
 
     def __hash__(self):
         return id(self)
 
     @property
     def identity(self):
-        return self.cls_element(group=self)
+        return self._element_from_map({})
 
     @property
     def cls_element(self) -> Type:
+        if self.compact:
+            return CompactPermutationGroupElement
         return PermutationGroupElement
 
+    @functools.cached_property
+    def object_tuple(self) -> Tuple[PermutationObject, ...]:
+        return tuple(
+            PermutationObject(permutation=self, value=i)
+            for i in range(self.degree)
+        )
+
+    @functools.cached_property
+    def typecode(self) -> str:
+        # smallest unsigned array type which can hold every point
+        if self.degree <= 1 << 16:
+            return 'H'
+        return 'L'
+
+    def is_object_listed(self):
+        return True
+
     def object_list(self):
-        for i in range(self.degree):
-            yield PermutationObject(permutation=self, value=i)
+        yield from self.object_tuple
 
     def check_object(self, o: PermutationObject):
         if o.permutation != self:
@@ -63,13 +130,114 @@ class PermutationGroupRep(GroupRep):
                 for k, v in mapping.items()
             }
 
-            i += self.cls_element(group=self, perm_map=new_mapping)
+            i += self._element_from_map(new_mapping)
 
         return i
 
     def as_group(self):
         return self.group_([[[0, 1]], [list(range(self.degree))]])
 
+    def is_batch_available(self):
+        return numpy is not None
+
+    def batch(self, element_list) -> 'numpy.ndarray':
+        """
+        Stack elements into a matrix, i-th row is the image array of i-th
+        element.
+        """
+        return numpy.array(
+            [self.image_of(element) for element in element_list],
+            dtype=numpy.intp
+        ).reshape(-1, self.degree)
+
+    def batch_element_list(self, matrix: 'numpy.ndarray'):
+        for row in matrix.tolist():
+            yield self._element_from_image(row)
+
+    def batch_compose(self, left, right):
+        """
+        Row-wise `left + right`. One side may be a single row which is
+        broadcast to the other.
+        """
+        left, right = numpy.broadcast_arrays(left, right)
+        return numpy.take_along_axis(right, left, axis=1)
+
+    def batch_product(self, left, right):
+        """
+        `left[p] + right[q]` for every pair, ordered by q first.
+        """
+        return right[:, left].reshape(-1, self.degree)
+
+    def batch_inverse(self, matrix):
+        inverse = numpy.empty_like(matrix)
+        numpy.put_along_axis(
+            inverse, matrix,
+            numpy.broadcast_to(numpy.arange(self.degree), matrix.shape),
+            axis=1
+        )
+        return inverse
+
+    def batch_order(self, matrix):
+        """
+        Order of every row, detecting the cycle length of each point by
+        iterating the permutations until every point is back home.
+        """
+        home = numpy.arange(self.degree)
+        length = numpy.zeros(matrix.shape, dtype=numpy.int64)
+        current = matrix
+        for k in range(1, self.degree + 1):
+            length[(current == home) & (length == 0)] = k
+            if length.all():
+                break
+            current = numpy.take_along_axis(matrix, current, axis=1)
+
+        if self.degree <= BATCH_LCM_DEGREE:
+            return numpy.lcm.reduce(length, axis=1)
+
+        order_list = []
+        for row in length.tolist():
+            order = 1
+            for cycle in set(row):
+                order = lcm(order, cycle)
+            order_list.append(order)
+        return numpy.array(order_list, dtype=object)
+
+    def image_of(self, element) -> list[int]:
+        if isinstance(element, CompactPermutationGroupElement):
+            return element.image.tolist()
+        return [element.act(o).value for o in self.object_tuple]
+
+    def _element_from_image(self, image):
+        if self.compact:
+            return CompactPermutationGroupElement.from_image(
+                self, array(self.typecode, image)
+            )
+
+        ot = self.object_tuple
+        return self._element_from_map({
+            ot[k]: ot[v]
+            for k, v in enumerate(image)
+            if k != v
+        })
+
+    def _element_from_map(self, mapping):
+        if self.compact:
+            image = array(self.typecode, range(self.degree))
+            for k, v in mapping.items():
+                image[k.value] = v.value
+            return CompactPermutationGroupElement.from_image(self, image)
+
+        key = frozenset((k.value, v.value) for k, v in mapping.items())
+        table = self._intern_table
+        element = table.get(key)
+        if element is None:
+            # mapping is built from wrapped objects, skip validation
+            element = construct(
+                self.cls_element, group=self, perm_map=mapping
+            )
+            table[key] = element
+        return element
+
     def _wrap_object(self, o):
         if isinstance(o, int):
             o = PermutationObject(permutation=self, value=o)
@@ -79,6 +247,10 @@ class PermutationGroupRep(GroupRep):
 
 
 class PermutationGroupElement(GroupElement):
+    """
+    Elements built by PermutationGroupRep are interned, perm_map should not
+    be changed.
+    """
     group: PermutationGroupRep
     perm_map: Dict[
         PermutationObject,
@@ -92,13 +264,55 @@ class PermutationGroupElement(GroupElement):
             e2 = other.act(self.act(e1))
             if e1 != e2:
                 d[e1] = e2
-        return self.cls_element(group=self.group, perm_map=d)
+        return self.group._element_from_map(d)
 
     def __neg__(self):
-        return self.cls_element(
-            group=self.group,
-            perm_map={v: k for k, v in self.perm_map.items()}
+        inverse = self.group._element_from_map(
+            {v: k for k, v in self.perm_map.items()}
         )
+        self._share_cycle_type(inverse)
+        return inverse
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, PermutationGroupElement):
+            return NotImplemented
+        return self._key == other._key
+
+    def __reduce__(self):
+        return self.group._element_from_map, (self.perm_map,)
+
+    @functools.cached_property
+    def _key(self) -> frozenset:
+        return frozenset((k.value, v.value) for k, v in self.perm_map.items())
+
+    @functools.cached_property
+    def _hash(self) -> int:
+        return hash(self._key)
+
+    def cycle_type(self) -> CycleType:
+        return self._cycle_type
+
+    @functools.cached_property
+    def _cycle_type(self) -> CycleType:
+        length_list = []
+        done = set()
+        for k in self.perm_map:
+            if k in done:
+                continue
+            length = 0
+            while k not in done:
+                done.add(k)
+                k = self.perm_map[k]
+                length += 1
+            length_list.append(length)
+        return CycleType(length_list)
+
+    def _share_cycle_type(self, other):
+        # inverse has same cycle type
+        if '_cycle_type' in self.__dict__:
+            other.__dict__['_cycle_type'] = self._cycle_type
 
     def to_seq(self):
         done = set()
@@ -120,7 +334,7 @@ class PermutationGroupElement(GroupElement):
         return str(list(self.to_seq()))
 
     def __hash__(self):
-        return hash((self.group, str(self)))
+        return self._hash
 
     def is_identity(self) -> bool:
         return len(self.perm_map) == 0
@@ -129,10 +343,7 @@ class PermutationGroupElement(GroupElement):
         return self.perm_map.get(o, o)
 
     def order(self) -> int:
-        order = 1
-        for seq in self.to_seq():
-            order = lcm(order, len(seq))
-        return order
+        return self.cycle_type().order
 
     def orbit(self, o: PermutationObject) -> list[PermutationObject]:
         o_list = [o]
@@ -148,3 +359,116 @@ class PermutationGroupElement(GroupElement):
     @property
     def cls_element(self) -> Type:
         return type(self)
+
+
+class CompactPermutationGroupElement(GroupElement):
+    """
+    Permutation stored as an image array, ``image[i]`` is the image of i.
+    Elements are built with ``from_image`` so that no validation and no
+    ``PermutationObject`` allocation happens on the hot path, and are
+    interned by its image so that image should not be changed.
+    """
+    model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+
+    group: PermutationGroupRep
+    image: array
+
+    @classmethod
+    def from_image(cls, group: PermutationGroupRep, image: array):
+        key = image.tobytes()
+        table = group._intern_table
+        element = table.get(key)
+        if element is None:
+            element = construct(cls, group=group, image=image)
+            table[key] = element
+        return element
+
+    def __add__(self, other: 'CompactPermutationGroupElement'):
+        # (self + other).act(o) == other.act(self.act(o))
+        return self.from_image(
+            self.group,
+            array(self.image.typecode, map(other.image.__getitem__, self.image))
+        )
+
+    def __neg__(self):
+        # sorting points by its image gives the inverse permutation
+        inverse = self.from_image(
+            self.group,
+            array(
+                self.image.typecode,
+                sorted(range(len(self.image)), key=self.image.__getitem__)
+            )
+        )
+        self._share_cycle_type(inverse)
+        return inverse
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, CompactPermutationGroupElement):
+            return NotImplemented
+        return self.image == other.image
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return self.from_image, (self.group, self.image)
+
+    @functools.cached_property
+    def _hash(self) -> int:
+        return hash(self.image.tobytes())
+
+    def __str__(self):
+        return str(list(self.to_seq()))
+
+    def is_identity(self) -> bool:
+        for i, v in enumerate(self.image):
+            if i != v:
+                return False
+        return True
+
+    def act(self, o):
+        if isinstance(o, int):
+            return self.image[o]
+        return self.group.object_tuple[self.image[o.value]]
+
+    def to_seq(self):
+        image = self.image
+        done = bytearray(len(image))
+        for k, v in enumerate(image):
+            if done[k] or k == v:
+                continue
+
+            one = []
+            while not done[k]:
+                one.append(k)
+                done[k] = 1
+                k = image[k]
+            yield one
+
+    def cycle_type(self) -> CycleType:
+        return self._cycle_type
+
+    @functools.cached_property
+    def _cycle_type(self) -> CycleType:
+        return CycleType(map(len, self.to_seq()))
+
+    def _share_cycle_type(self, other):
+        # inverse has same cycle type
+        if '_cycle_type' in self.__dict__:
+            other.__dict__['_cycle_type'] = self._cycle_type
+
+    def order(self) -> int:
+        return self.cycle_type().order
+
+    def orbit(self, o: PermutationObject) -> list[PermutationObject]:
+        o_list = [o]
+        o_c = self.act(o)
+        while o_c != o:
+            o_list.append(o_c)
+            o_c = self.act(o_c)
+        return o_list
+
+    def orbit_list(self):
+        return len(list(self.to_seq()))
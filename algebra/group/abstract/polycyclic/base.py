@@ -2,16 +2,19 @@ import functools
 import itertools
 import random
 from functools import singledispatchmethod
-from typing import Any
+from typing import Any, Optional
 
 import pydantic
-from pydantic import BaseModel, model_serializer, PlainSerializer
+from pydantic import BeforeValidator, model_serializer, PlainSerializer
 from typing_extensions import Annotated
 
 from algebra.group.abstract.automorphism import AutomorphismGroupRep, \
     AutomorphismMap
 from algebra.group.abstract.base import GroupElement, GroupRep, Group
+from algebra.group.abstract.polycyclic.collector import Collector
+from algebra.group.abstract.polycyclic.deep_thought import DeepThought
 from algebra.group.abstract.polycyclic.reduced import PolyCyclicRowReduced
+from algebra.util.model import construct
 
 
 def dict_to_item_list(o):
@@ -23,9 +26,22 @@ def dict_to_item_list(o):
     return result
 
 
+def item_list_to_dict(o):
+    if not isinstance(o, list):
+        return o
+    result = {}
+    for item in o:
+        k = item['key']
+        if isinstance(k, list):
+            k = tuple(k)
+        result[k] = item['value']
+    return result
+
+
 DictWrapper = Annotated[
     dict[int | tuple[int, int], list[int]],
-    PlainSerializer(dict_to_item_list, return_type=list)
+    PlainSerializer(dict_to_item_list, return_type=list),
+    BeforeValidator(item_list_to_dict)
 ]
 
 
@@ -38,6 +54,7 @@ class PolyCyclicGroupRep(GroupRep):
     commute_relation: DictWrapper = pydantic.Field(
         default_factory=dict
     )
+    _deep_thought: Optional[DeepThought] = None
 
     @property
     def group_cls(self):
@@ -58,9 +75,49 @@ class PolyCyclicGroupRep(GroupRep):
     def as_group(self):
         return self.group(self.generator_list())
 
+    @functools.cached_property
+    def collector(self) -> Collector:
+        """
+        Collector of the current relations. Relations should be changed
+        through add_number or remove_index, which drop it.
+        """
+        return Collector.from_rep(self)
+
+    def reset_collector(self):
+        self.__dict__.pop('collector', None)
+        self._deep_thought = None
+
+    def build_deep_thought(self, cache_dir: Optional[str] = None
+                           ) -> DeepThought:
+        """
+        Evaluate products, inverses and powers by Deep Thought formulas
+        from now on, until relations are changed. ValueError is raised if
+        the formulas are too large, and the collector is kept.
+
+        :param cache_dir: Directory keeping formulas per presentation
+        """
+        self._deep_thought = DeepThought.build(self, cache_dir)
+        return self._deep_thought
+
+    def multiply(self, left: list[int], right: list[int]) -> list[int]:
+        if self._deep_thought is not None:
+            return self._deep_thought.multiply(left, right)
+        return self.collector.multiply(left, right)
+
+    def negate(self, vector: list[int]) -> list[int]:
+        if self._deep_thought is not None:
+            return self._deep_thought.negate(vector)
+        return self.collector.inverse(vector)
+
+    def power(self, vector: list[int], n: int) -> list[int]:
+        if self._deep_thought is not None:
+            return self._deep_thought.power(vector, n)
+        return self.collector.power(vector, n)
+
     def add_number(self):
         n = self.number
         self.number += 1
+        self.reset_collector()
         return n
 
     def generator_list(self, count=1):
@@ -85,6 +142,32 @@ class PolyCyclicGroupRep(GroupRep):
             self.commute_relation, rel_map
         )
         self.number -= 1
+        self.reset_collector()
+
+    def remove_index_map(self, sub_map: dict[int, list[int]]):
+        """
+        Remove indices at once, each one replaced by a word in remaining
+        indices
+        """
+        new_index = {}
+        for k in range(self.number):
+            if k not in sub_map:
+                new_index[k] = len(new_index)
+
+        rel_map = {}
+        for k in range(self.number):
+            if k in sub_map:
+                rel_map[k] = [new_index[i] for i in sub_map[k]]
+            else:
+                rel_map[k] = [new_index[k]]
+        self.power_relation = self._remove_index_obj(
+            self.power_relation, rel_map
+        )
+        self.commute_relation = self._remove_index_obj(
+            self.commute_relation, rel_map
+        )
+        self.number -= len(sub_map)
+        self.reset_collector()
 
     def _remove_index_obj(self, o, rel_map):
         if isinstance(o, int):
@@ -119,6 +202,7 @@ class PolyCyclicGroupRep(GroupRep):
 
 class PolyCyclicGroup(Group):
     generator: list['PolyCyclicGroupElement']
+    _p_cover = None
 
     def __hash__(self):
         return hash((id(self.represent), str(self)))
@@ -175,20 +259,38 @@ class PolyCyclicGroup(Group):
         if other is None:
             other = self
 
-        generator_list = []
-        for g1 in self.generator:
-            for h in other.generator:
-                for g2 in other.generator:
-                    generator_list.append(
-                        g1 + h - g1 - h +
-                        g2 * self.represent.degree
-                    )
+        generator_list = [
+            g + h - g - h
+            for g in self.generator
+            for h in other.generator
+        ]
+        generator_list.extend(
+            h * self.represent.degree
+            for h in other.generator
+        )
 
         return PolyCyclicGroup(
             represent=self.represent,
             generator=generator_list
         )
 
+    def p_cover(self):
+        """
+        p-cover with the p-multiplicator and the nucleus, see PCover
+        """
+        if self._p_cover is None:
+            from algebra.group.abstract.polycyclic.p_convering import \
+                PCoverAlgorithm
+
+            self._p_cover = PCoverAlgorithm(self).run()
+        return self._p_cover
+
+    def p_multiplicator(self):
+        return self.p_cover().multiplicator
+
+    def nucleus(self):
+        return self.p_cover().nucleus
+
     def automorphism_group(self):
         exponent_series = list(self.lower_exponent_p_central_series())
 
@@ -315,9 +417,16 @@ class PolyCyclicAutomorphismMap(AutomorphismMap):
         ])
 
     def _value(self, element: GroupElement):
-        result = self.row_reduced.reduce(element, [element.group.identity])
-        for row in result.rows:
-            return -row
+        # element is a product of powers of rows from the left
+        index_map = self.row_reduced.index_map
+        result = element.group.identity
+        while not element.is_identity():
+            index = element.min_index()
+            power = element.power[index]
+            row = index_map[index]
+            element = -(row.element * power) + element
+            result = result + row.rows[0] * power
+        return result
 
     @functools.cached_property
     def row_reduced(self) -> PolyCyclicRowReduced:
@@ -340,105 +449,20 @@ class PolyCyclicGroupElement(GroupElement):
     def __lt__(self, other):
         return self.power < other.power
 
-    def _normalize_sequence(self, sequence):
-        stack = []
-        right_stack = list(sequence)
-        right_stack.reverse()
-
-        while right_stack:
-            self._show(stack, right_stack)
-
-            right = right_stack.pop()
-
-            if right.power == 0:
-                continue
-
-            if right.power < 0:
-                if right.index in self.group.power_relation:
-                    right_stack.extend(
-                        self._to_index(self.group.power_relation[right.index])
-                    )
-                self._append_index(
-                    right_stack,
-                    right.index, right.power + self.group.degree
-                )
-                continue
-
-            if len(stack) == 0:
-                stack.append(right)
-                continue
-
-            left = stack.pop()
-
-            if left.index < right.index:
-                stack.extend([left, right])
-            elif left.index == right.index:
-                q, r = divmod(left.power + right.power, self.group.degree)
-                if left.index in self.group.power_relation:
-                    for _ in range(q):
-                        right_stack.extend(
-                            self._to_index(
-                                self.group.power_relation[left.index]
-                            )
-                        )
-                self._append_index(right_stack,left.index, r)
-            else:
-                pair = left.index, right.index
-                if pair not in self.group.commute_relation:
-                    right_stack.extend([left, right])
-                else:
-                    self._append_index(
-                        right_stack,
-                        right.index, right.power - 1
-                    )
-                    for _ in range(left.power):
-                        right_stack.extend(
-                            self._to_index(
-                                self.group.commute_relation[pair]
-                            )
-                        )
-                        self._append_index(right_stack,left.index, 1)
-                    self._append_index(right_stack,right.index, 1)
-
-        self._show(stack, right_stack)
-
-        # return result
-        p = [0] * self.group.number
-        for left in stack:
-            p[left.index] = left.power
-        return PolyCyclicGroupElement(group=self.group, power=p)
-
-    @staticmethod
-    def _append_index(stack, index, power):
-        stack.append(PolyCyclicIndex(index=index, power=power))
-
     def __add__(self, other: 'PolyCyclicGroupElement'):
-        return self._normalize_sequence(
-            itertools.chain(
-                self._build_stack(),
-                other._build_stack()
-            )
-        )
+        power = self.group.multiply(self.power, other.power)
+        return construct(type(self), group=self.group, power=power)
 
     def __sub__(self, other):
         return self + (-other)
 
     def __neg__(self):
-        stack = self._build_stack()
-        stack.reverse()
-        return self._normalize_sequence([
-            PolyCyclicIndex(index=index.index, power=-index.power)
-            for index in stack
-        ])
-
-    def __mul__(self, other):
-        if other == 0:
-            return self.group.identity
+        power = self.group.negate(self.power)
+        return construct(type(self), group=self.group, power=power)
 
-        current = self
-        for i in range(1, other):
-            current += self
-        return current
+    def __mul__(self, other: int):
+        power = self.group.power(self.power, other)
+        return construct(type(self), group=self.group, power=power)
 
     def __str__(self):
         return str(self.power)
@@ -469,35 +493,13 @@ class PolyCyclicGroupElement(GroupElement):
         return True
 
     def order(self) -> int:
-        current = self
+        # every element has p-power order, p-th powers go deeper
+        p = self.group.degree
+        power = self.power
         current_order = 1
 
-        while not current.is_identity():
-            current_order *= self.group.degree
-            current *= self.group.degree
+        while any(power):
+            current_order *= p
+            power = self.group.power(power, p)
 
         return current_order
-
-    def _build_stack(self):
-        power_list = []
-        for i, p in enumerate(self.power):
-            if p != 0:
-                power_list.append(PolyCyclicIndex(index=i, power=p))
-        return power_list
-
-    def _to_index(self, int_list):
-        return [
-            PolyCyclicIndex(index=index, power=1)
-            for index in int_list[::-1]
-        ]
-
-    def _show(self, stack, right_stack):
-        # print(stack)
-        # print(right_stack)
-        # input()
-        pass
-
-
-class PolyCyclicIndex(BaseModel):
-    index: int
-    power: int
@@ -0,0 +1,159 @@
+from typing import Dict, List, Tuple
+
+Syllable = Tuple[int, int]
+
+
+def to_syllable_list(word: List[int]) -> List[Syllable]:
+    """
+    Word of generator indices to (index, power) with runs merged
+    """
+    result = []
+    for index in word:
+        if result and result[-1][0] == index:
+            result[-1] = index, result[-1][1] + 1
+        else:
+            result.append((index, 1))
+    return result
+
+
+def vector_to_syllable_list(vector: List[int]) -> List[Syllable]:
+    return [(i, p) for i, p in enumerate(vector) if p]
+
+
+class Collector:
+    """
+    Collection from the left on exponent vectors of a power-commutator
+    presentation, on plain integer lists.
+
+    Generators are `a_0, ..., a_{n-1}` of relative order `p = degree` with
+
+    - `a_i ^ p = w_i` from power_relation[i]
+    - `a_j a_i = a_i a_j c_ji` from commute_relation[j, i] for `j > i`
+
+    where words are in larger indices. Multiplying a collected word
+    `h a_i^e t`, with `t` in indices over `i`, by `a_i` gives
+    `h a_i^(e+1) t^(a_i)`, and `t^(a_i)` is the product of conjugates
+    `(a_j^k)^(a_i)`, which are collected once and kept in a table.
+    """
+
+    def __init__(self, degree: int, number: int,
+                 power_relation: Dict[int, List[int]],
+                 commute_relation: Dict[Tuple[int, int], List[int]]):
+        self.degree = degree
+        self.number = number
+        self.power_list: List[List[Syllable]] = [
+            to_syllable_list(power_relation.get(i, []))
+            for i in range(number)
+        ]
+        self.commutator_map: Dict[Tuple[int, int], List[Syllable]] = {
+            pair: to_syllable_list(word)
+            for pair, word in commute_relation.items()
+            if word
+        }
+        # (i, j, k) -> collected (a_j^k)^(a_i)
+        self.conjugate_table: Dict[Tuple[int, int, int], List[Syllable]] = {}
+        # generators from here are central, and never moved in collection
+        self.central_start = 1 + max(
+            (j for j, _ in self.commutator_map), default=0
+        )
+
+    @classmethod
+    def from_rep(cls, rep) -> 'Collector':
+        return cls(
+            rep.degree, rep.number,
+            rep.power_relation, rep.commute_relation
+        )
+
+    def multiply(self, left: List[int], right: List[int]) -> List[int]:
+        vector = list(left)
+        self.collect(vector, vector_to_syllable_list(right))
+        return vector
+
+    def power(self, vector: List[int], n: int) -> List[int]:
+        """
+        Square and multiply, negative powers from the inverse
+        """
+        if n < 0:
+            vector, n = self.inverse(vector), -n
+
+        result = [0] * self.number
+        while n:
+            if n & 1:
+                result = self.multiply(result, vector)
+            n >>= 1
+            if n:
+                vector = self.multiply(vector, vector)
+        return result
+
+    def inverse(self, vector: List[int]) -> List[int]:
+        """
+        Multiply by powers of a_0, a_1, ... which clear the exponents one
+        by one, the powers are the exponents of the inverse
+        """
+        current = list(vector)
+        result = [0] * self.number
+        for i in range(self.number):
+            if current[i]:
+                result[i] = self.degree - current[i]
+                self.collect(current, [(i, result[i])])
+        return result
+
+    def collect(self, vector: List[int], word: List[Syllable]):
+        """
+        Multiply the collected vector by the word in place
+        """
+        p = self.degree
+        central_start = self.central_start
+        power_list = self.power_list
+        commutator_map = self.commutator_map
+
+        stack = word[::-1]
+        while stack:
+            i, k = stack.pop()
+            if k == 0:
+                continue
+
+            tail = [
+                (j, vector[j])
+                for j in range(i + 1, central_start)
+                if vector[j]
+            ]
+            if all((j, i) not in commutator_map for j, _ in tail):
+                # a_i commutes with the tail, powers are added at once
+                q, vector[i] = divmod(vector[i] + k, p)
+                if q == 0:
+                    continue
+                for j, _ in tail:
+                    vector[j] = 0
+                stack.extend(tail[::-1])
+                for _ in range(q):
+                    stack.extend(power_list[i][::-1])
+                continue
+
+            for j, _ in tail:
+                vector[j] = 0
+            q, vector[i] = divmod(vector[i] + 1, p)
+            if k > 1:
+                stack.append((i, k - 1))
+            for j, e in tail[::-1]:
+                stack.extend(self.conjugate(i, j, e)[::-1])
+            if q:
+                stack.extend(power_list[i][::-1])
+
+    def conjugate(self, i: int, j: int, k: int) -> List[Syllable]:
+        """
+        Collected `(a_j^k)^(a_i)` for `i < j`
+        """
+        commutator = self.commutator_map.get((j, i))
+        if commutator is None:
+            return [(j, k)]
+
+        key = i, j, k
+        result = self.conjugate_table.get(key)
+        if result is None:
+            vector = [0] * self.number
+            # (a_j^k)^(a_i) = (a_j c_ji)^k
+            self.collect(vector, ([(j, 1)] + commutator) * k)
+            result = vector_to_syllable_list(vector)
+            self.conjugate_table[key] = result
+        return result
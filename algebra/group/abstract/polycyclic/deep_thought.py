@@ -0,0 +1,292 @@
+import itertools
+import random
+from math import comb, prod
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from algebra.group.abstract.polycyclic.collector import to_syllable_list
+from algebra.util.my_hash import int_sequence_hash
+
+# (variable, power) of a binomial coefficient binom(value, power)
+Factor = Tuple[int, int]
+# coefficient and product of binomial coefficients
+Term = Tuple[int, List[Factor]]
+
+# Random products compared with the collector after the formulas are built
+DEEP_THOUGHT_VERIFY_SIZE = 64
+# Points of finite differences summed over the monomials of all formulas,
+# which bounds the cost of building them
+DEEP_THOUGHT_POINT_LIMIT = 1 << 18
+
+
+def presentation_key(rep) -> str:
+    """
+    Name of a presentation, the same for equal relations
+    """
+    sequence = [rep.degree, rep.number]
+    for i, word in sorted(rep.power_relation.items()):
+        sequence.extend([-1, i, len(word)] + list(word))
+    for (j, i), word in sorted(rep.commute_relation.items()):
+        sequence.extend([-2, j, i, len(word)] + list(word))
+    return int_sequence_hash('DeepThought', sequence)
+
+
+def presentation_weight(rep) -> List[int]:
+    """
+    Weights of generators which bound the degree of formulas. A power
+    relation `a_i^p = w` puts `w` in weight `p * wt(a_i)`, as the carry of
+    `x + y` is `binom(x + y, p)` mod p, and a commutator relation puts
+    `[a_j, a_i]` in weight `wt(a_i) + wt(a_j)`. Words are collected first,
+    as relations may have unreduced words.
+    """
+    collector = rep.collector
+
+    def support(word):
+        vector = [0] * rep.number
+        collector.collect(vector, to_syllable_list(word))
+        return [k for k, power in enumerate(vector) if power]
+
+    weight = [1] * rep.number
+    for j in range(rep.number):
+        for k in support(rep.power_relation.get(j, [])):
+            if k <= j:
+                raise ValueError('Power relation should be in later indices')
+            weight[k] = max(weight[k], rep.degree * weight[j])
+        for i in range(j):
+            for k in support(rep.commute_relation.get((j, i), [])):
+                if k <= j:
+                    raise ValueError(
+                        'Commute relation should be in later indices'
+                    )
+                weight[k] = max(weight[k], weight[i] + weight[j])
+    return weight
+
+
+class DeepThought(BaseModel):
+    """
+    Deep Thought formulas of a polycyclic presentation. Exponent `k` of a
+    product is a polynomial in binomial coefficients of exponents of the
+    factors, so products need integer arithmetic only.
+
+    Variables of product are exponents of the left factor, then of the
+    right one. Variables of inverse are exponents of the element.
+    """
+    key: str
+    degree: int
+    number: int
+    product: List[List[Term]]
+    inverse: List[List[Term]]
+    _binomial: List[List[int]] = []
+
+    def model_post_init(self, __context):
+        p = self.degree
+        self._binomial = [[comb(n, k) % p for k in range(p)] for n in range(p)]
+
+    @classmethod
+    def build(cls, rep, cache_dir: Optional[str] = None) -> 'DeepThought':
+        """
+        Formulas of the presentation, read from or written to
+        `cache_dir/<key>.json` if the directory is given
+        """
+        key = presentation_key(rep)
+        path = None if cache_dir is None else Path(cache_dir) / f'{key}.json'
+        if path is not None and path.exists():
+            return cls.model_validate_json(path.read_text())
+
+        result = DeepThoughtAlgorithm(rep).run()
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(result.model_dump_json())
+        return result
+
+    def multiply(self, left: List[int], right: List[int]) -> List[int]:
+        return self._evaluate(self.product, left + right)
+
+    def negate(self, vector: List[int]) -> List[int]:
+        return self._evaluate(self.inverse, vector)
+
+    def power(self, vector: List[int], n: int) -> List[int]:
+        if n < 0:
+            vector, n = self.negate(vector), -n
+
+        result = [0] * self.number
+        while n:
+            if n & 1:
+                result = self.multiply(result, vector)
+            n >>= 1
+            if n:
+                vector = self.multiply(vector, vector)
+        return result
+
+    def _evaluate(self, formula_list: List[List[Term]],
+                  value: List[int]) -> List[int]:
+        binomial = self._binomial
+        result = []
+        for formula in formula_list:
+            total = 0
+            for coefficient, factor_list in formula:
+                for variable, power in factor_list:
+                    b = binomial[value[variable]][power]
+                    if b == 0:
+                        break
+                    coefficient *= b
+                else:
+                    total += coefficient
+            result.append(total % self.degree)
+        return result
+
+
+class DeepThoughtAlgorithm:
+    """
+    Formulas by interpolation. Exponent `k` depends on exponents of index
+    up to `k`, and only monomials of weighted degree up to the weight of
+    `a_k` appear, so the coefficients of them are the finite differences
+    of collected products at small exponent vectors.
+
+    The number of monomials grows fast with p and the weights, which is
+    already over a million for the second p-covering group of C5 x C5, so
+    ValueError is raised beyond DEEP_THOUGHT_POINT_LIMIT before anything is
+    collected.
+    """
+
+    def __init__(self, rep):
+        self.rep = rep
+        self.collector = rep.collector
+        self.weight = presentation_weight(rep)
+        self.point_count = 0
+
+    def run(self) -> DeepThought:
+        rep = self.rep
+        n = rep.number
+        product_cache = {}
+        inverse_cache = {}
+
+        def product(point):
+            value = [0] * (2 * n)
+            for variable, power in point:
+                value[variable] = power
+            return self.collector.multiply(value[:n], value[n:])
+
+        def inverse(point):
+            value = [0] * n
+            for variable, power in point:
+                value[variable] = power
+            return self.collector.inverse(value)
+
+        # monomials are listed first, so that the limit is checked before
+        # anything is collected
+        monomial_list = []
+        for k in range(n):
+            product_variable = [
+                (v, self.weight[v % n])
+                for i in range(k + 1)
+                for v in (i, n + i)
+            ]
+            inverse_variable = [(i, self.weight[i]) for i in range(k + 1)]
+            monomial_list.append((
+                self._monomial_list(product_variable, self.weight[k]),
+                self._monomial_list(inverse_variable, self.weight[k])
+            ))
+
+        product_list = []
+        inverse_list = []
+        for k, (product_monomial, inverse_monomial) in \
+                enumerate(monomial_list):
+            product_list.append(self._interpolate(
+                k, product_monomial, product, product_cache
+            ))
+            inverse_list.append(self._interpolate(
+                k, inverse_monomial, inverse, inverse_cache
+            ))
+
+        result = DeepThought(
+            key=presentation_key(rep),
+            degree=rep.degree,
+            number=n,
+            product=product_list,
+            inverse=inverse_list
+        )
+        self._verify(result)
+        return result
+
+    def _interpolate(self, k: int, monomial_list: List[List[Factor]],
+                     function, cache: Dict) -> List[Term]:
+        p = self.rep.degree
+        formula = []
+        for monomial in monomial_list:
+            # finite difference of the monomial at zero
+            coefficient = 0
+            for point in itertools.product(*[
+                range(power + 1) for _, power in monomial
+            ]):
+                sign = 1
+                for (_, power), t in zip(monomial, point):
+                    sign *= comb(power, t) * (-1) ** (power - t)
+
+                key = tuple(
+                    (variable, t)
+                    for (variable, _), t in zip(monomial, point)
+                    if t
+                )
+                value = cache.get(key)
+                if value is None:
+                    value = cache[key] = function(key)
+                coefficient += sign * value[k]
+
+            coefficient %= p
+            if coefficient:
+                formula.append((coefficient, monomial))
+        return formula
+
+    def _monomial_list(self, variable_list: List[Tuple[int, int]],
+                       bound: int) -> List[List[Factor]]:
+        # powers below p with weighted degree up to the bound, no constant
+        p = self.rep.degree
+        result = []
+
+        def search(start, current, degree):
+            if current:
+                result.append(list(current))
+                self.point_count += prod(power + 1 for _, power in current)
+                if self.point_count > DEEP_THOUGHT_POINT_LIMIT:
+                    raise ValueError(
+                        'Too many monomials, products should be collected'
+                    )
+            for i in range(start, len(variable_list)):
+                variable, weight = variable_list[i]
+                for power in range(1, p):
+                    if degree + power * weight > bound:
+                        break
+                    current.append((variable, power))
+                    search(i + 1, current, degree + power * weight)
+                    current.pop()
+
+        search(0, [], 0)
+        return result
+
+    def _verify(self, deep_thought: DeepThought):
+        """
+        Compare with collection on every pair of generators and on
+        DEEP_THOUGHT_VERIFY_SIZE random pairs, which is a sample rather
+        than a proof.
+        """
+        rep = self.rep
+        n = rep.number
+
+        def random_vector():
+            return [random.randrange(rep.degree) for _ in range(n)]
+
+        generator_list = [rep.from_index(i).power for i in range(n)]
+        pair_list = list(itertools.product(generator_list, repeat=2))
+        pair_list.extend(
+            (random_vector(), random_vector())
+            for _ in range(DEEP_THOUGHT_VERIFY_SIZE)
+        )
+        for left, right in pair_list:
+            expected = self.collector.multiply(left, right)
+            if deep_thought.multiply(left, right) != expected:
+                raise ValueError('Formulas do not agree with collection')
+            if deep_thought.negate(left) != self.collector.inverse(left):
+                raise ValueError('Formulas do not agree with collection')
@@ -0,0 +1,517 @@
+import collections
+import itertools
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pydantic
+from pydantic import BaseModel
+
+from algebra.group.abstract.base import ElementContainer, StabilizerChain
+from algebra.group.abstract.permutation import PermutationGroupRep, \
+    CompactPermutationGroupElement
+from algebra.group.abstract.polycyclic.base import PolyCyclicGroupRep, \
+    PolyCyclicGroup, PolyCyclicGroupElement, PolyCyclicAutomorphismMap
+from algebra.group.abstract.polycyclic.deep_thought import presentation_key
+from algebra.group.abstract.polycyclic.p_convering import echelon_mod_p
+
+# reduced echelon basis of a subspace of F_p^m
+Subspace = Tuple[Tuple[int, ...], ...]
+
+
+def subspace_key(row_list: List[List[int]], p: int) -> Subspace:
+    """
+    Reduced echelon basis of the span, the same for equal subspaces
+    """
+    return tuple(tuple(row) for _, row in sorted(echelon_mod_p(row_list, p)))
+
+
+def subspace_list(dimension: int, size: int, p: int
+                  ) -> Iterator[List[List[int]]]:
+    """
+    Bases of every subspace of F_p^dimension of the size, in the echelon
+    form of echelon_mod_p
+    """
+    for pivot_list in itertools.combinations(range(dimension), size):
+        pivot_set = set(pivot_list)
+        free_list = [
+            (r, c)
+            for r, pivot in enumerate(pivot_list)
+            for c in range(pivot)
+            if c not in pivot_set
+        ]
+        for value_list in itertools.product(range(p), repeat=len(free_list)):
+            row_list = [[0] * dimension for _ in pivot_list]
+            for r, pivot in enumerate(pivot_list):
+                row_list[r][pivot] = 1
+            for (r, c), value in zip(free_list, value_list):
+                row_list[r][c] = value
+            yield row_list
+
+
+def complement_subspace_list(dimension: int, subspace: List[List[int]],
+                             size: int, p: int
+                             ) -> Iterator[List[List[int]]]:
+    """
+    Bases of every subspace of the size meeting the subspace trivially.
+    Such a subspace is `{w + f(w)}` for `w` in a subspace `W` of the
+    complement spanned by unit vectors out of pivots of the subspace, and
+    `f` from `W` to the subspace.
+    """
+    subspace = [row for _, row in sorted(echelon_mod_p(subspace, p))]
+    pivot_set = {max(i for i, v in enumerate(row) if v) for row in subspace}
+    free_list = [k for k in range(dimension) if k not in pivot_set]
+
+    for w in subspace_list(len(free_list), size, p):
+        base = []
+        for row in w:
+            vector = [0] * dimension
+            for k, value in zip(free_list, row):
+                vector[k] = value
+            base.append(vector)
+
+        for value_list in itertools.product(
+                range(p), repeat=size * len(subspace)):
+            row_list = []
+            for r, vector in enumerate(base):
+                vector = list(vector)
+                coefficient_list = value_list[
+                    r * len(subspace):(r + 1) * len(subspace)
+                ]
+                for coefficient, row in zip(coefficient_list, subspace):
+                    for i, value in enumerate(row):
+                        vector[i] = (vector[i] + coefficient * value) % p
+                row_list.append(vector)
+            yield row_list
+
+
+def annihilator(row_list: List[List[int]], dimension: int, p: int
+                ) -> List[List[int]]:
+    """
+    Basis of vectors `f` with `row . f = 0` for every row
+    """
+    reduced = echelon_mod_p(row_list, p)
+    pivot_set = {pivot for pivot, _ in reduced}
+    result = []
+    for k in range(dimension):
+        if k in pivot_set:
+            continue
+        vector = [0] * dimension
+        vector[k] = 1
+        for pivot, row in reduced:
+            vector[pivot] = -row[k] % p
+        result.append(vector)
+    return result
+
+
+def inverse_mod_p(matrix: List[List[int]], p: int) -> List[List[int]]:
+    # [I | A] is reduced to [A^-1 | I], as pivots are the last columns
+    size = len(matrix)
+    row_list = [
+        [int(i == j) for j in range(size)] + list(row)
+        for i, row in enumerate(matrix)
+    ]
+    return [row[:size] for _, row in sorted(echelon_mod_p(row_list, p))]
+
+
+def automorphism_map(generator_list: List[PolyCyclicGroupElement],
+                     image_list: List[PolyCyclicGroupElement]
+                     ) -> PolyCyclicAutomorphismMap:
+    return PolyCyclicAutomorphismMap(
+        group_element_map=dict(zip(generator_list, image_list))
+    )
+
+
+class PGroup(BaseModel):
+    """
+    p-group with generators of its automorphism group. The first `rank`
+    generators of the presentation generate the group, and automorphisms
+    are given by images of them. They generate a group of
+    automorphism_order.
+    """
+    represent: PolyCyclicGroupRep
+    rank: int
+    automorphism: List[List[List[int]]] = pydantic.Field(
+        default_factory=list
+    )
+    automorphism_order: int = 1
+
+    def order(self) -> int:
+        return pow(self.represent.degree, self.represent.number)
+
+    def group(self) -> PolyCyclicGroup:
+        return self.represent.as_group()
+
+    def defining_generator_list(self) -> List[PolyCyclicGroupElement]:
+        return [self.represent.from_index(i) for i in range(self.rank)]
+
+    def automorphism_image_list(self) -> List[List[PolyCyclicGroupElement]]:
+        return [
+            [self.represent.element(power) for power in image_list]
+            for image_list in self.automorphism
+        ]
+
+    @classmethod
+    def elementary_abelian(cls, degree: int, rank: int) -> 'PGroup':
+        """
+        Elementary abelian group with a transvection, permutations of
+        generators and a scalar of a primitive root, which generate
+        GL(rank, degree)
+        """
+        p = degree
+        root = next(
+            r for r in range(1, p)
+            if len({pow(r, k, p) for k in range(p - 1)}) == p - 1
+        )
+
+        def unit(i, value=1):
+            return [value if k == i else 0 for k in range(rank)]
+
+        identity = [unit(i) for i in range(rank)]
+        automorphism = []
+        if root != 1:
+            automorphism.append([unit(0, root)] + identity[1:])
+        if rank > 1:
+            # x_0 -> x_0 x_1, conjugated to every transvection by
+            # permutations of generators
+            automorphism.append([unit(0)] + identity[1:])
+            automorphism[-1][0][1] = 1
+            automorphism.append(identity[1:] + identity[:1])
+        if rank > 2:
+            automorphism.append([identity[1], identity[0]] + identity[2:])
+
+        automorphism_order = 1
+        for i in range(rank):
+            automorphism_order *= pow(p, rank) - pow(p, i)
+
+        return cls(
+            represent=PolyCyclicGroupRep(degree=degree, number=rank),
+            rank=rank,
+            automorphism=automorphism,
+            automorphism_order=automorphism_order
+        )
+
+
+class DescendantAlgorithm:
+    """
+    Immediate descendants of a p-group `G`, one for each isomorphism class.
+
+    Descendants are quotients `G* / U` of the p-cover by allowable
+    subgroups `U`, which are proper subgroups of the p-multiplicator `M`
+    supplementing the nucleus. Automorphisms of `G` extend to `G*` and act
+    on `M` linearly, and `G* / U` are isomorphic exactly when `U` are in
+    the same orbit. Automorphisms of `G* / U` are the extensions of the
+    stabilizer of `U`, and the central automorphisms multiplying a defining
+    generator by an element of `M / U`.
+
+    Orbits are of annihilators of `U` in the dual of `M` instead, which are
+    subspaces of dimension the step size meeting the annihilator of the
+    nucleus trivially, so that a subspace is given by a few vectors.
+
+    Automorphisms of `G` are also permutations of its elements, so that
+    Schreier generators of the stabilizer are sifted and only new ones are
+    kept, until the order `|Aut(G)| / |orbit|` is reached.
+    """
+
+    def __init__(self, parent: PGroup):
+        self.parent = parent
+        self.degree = parent.represent.degree
+        self.cover = parent.group().p_cover()
+        self.number = parent.represent.number
+        self.dimension = self.cover.group.represent.number - self.number
+
+        self.generator_list = parent.defining_generator_list()
+        self.automorphism_list = [
+            automorphism_map(self.generator_list, image_list)
+            for image_list in parent.automorphism_image_list()
+        ]
+        # action on the dual, inverse transpose of the action on M
+        self.matrix_list = [
+            [
+                list(column)
+                for column in zip(*inverse_mod_p(
+                    self._matrix(automorphism), self.degree
+                ))
+            ]
+            for automorphism in self.automorphism_list
+        ]
+        self.nucleus = [
+            g.power[self.number:] for g in self.cover.nucleus.generator
+        ]
+        self.nucleus_annihilator = annihilator(
+            self.nucleus, self.dimension, self.degree
+        )
+
+        self.permutation_rep = PermutationGroupRep(
+            degree=parent.order(), compact=True
+        )
+        self.permutation_list = [
+            self._permutation(automorphism)
+            for automorphism in self.automorphism_list
+        ]
+
+    def run(self, step: Optional[int] = None) -> Iterator[PGroup]:
+        """
+        Descendants of order `|G| p^step`, or of every possible step
+        """
+        if step is None:
+            step_list = range(1, len(self.nucleus) + 1)
+        else:
+            step_list = [step] if step <= len(self.nucleus) else []
+
+        for step in step_list:
+            done = set()
+            for row_list in complement_subspace_list(
+                    self.dimension, self.nucleus_annihilator, step,
+                    self.degree):
+                key = subspace_key(row_list, self.degree)
+                if key in done:
+                    continue
+                tree = self._orbit(key)
+                done.update(tree)
+                yield self._descendant(key, tree)
+
+    def _index(self, power: List[int]) -> int:
+        index = 0
+        for value in power:
+            index = index * self.degree + value
+        return index
+
+    def _permutation(self, automorphism: PolyCyclicAutomorphismMap
+                     ) -> CompactPermutationGroupElement:
+        rep = self.parent.represent
+        image = [
+            self._index(automorphism.value(rep.element(power)).power)
+            for power in itertools.product(range(self.degree),
+                                           repeat=self.number)
+        ]
+        return CompactPermutationGroupElement.from_image(
+            self.permutation_rep,
+            array(self.permutation_rep.typecode, image)
+        )
+
+    def _matrix(self, automorphism: PolyCyclicAutomorphismMap
+                ) -> List[List[int]]:
+        # image of a generator of M is its row
+        cover_rep = self.cover.group.represent
+        lift = automorphism_map(
+            [cover_rep.from_index(i) for i in range(self.parent.rank)],
+            [
+                cover_rep.element(image.power + [0] * self.dimension)
+                for image in automorphism.group_element_map.values()
+            ]
+        )
+        return [
+            lift.value(cover_rep.from_index(self.number + k))
+            .power[self.number:]
+            for k in range(self.dimension)
+        ]
+
+    def _act(self, key: Subspace, matrix: List[List[int]]) -> Subspace:
+        p = self.degree
+        row_list = []
+        for row in key:
+            image = [0] * self.dimension
+            for k, value in enumerate(row):
+                if value:
+                    for i, a in enumerate(matrix[k]):
+                        image[i] += value * a
+            row_list.append([value % p for value in image])
+        return subspace_key(row_list, p)
+
+    def _orbit(self, key: Subspace
+               ) -> Dict[Subspace, Optional[Tuple[Subspace, int]]]:
+        """
+        Breadth first tree of the orbit, every point maps to its parent and
+        the index of the automorphism moving the parent to it
+        """
+        tree = {key: None}
+        queue = collections.deque([key])
+        while queue:
+            point = queue.popleft()
+            for k, matrix in enumerate(self.matrix_list):
+                image = self._act(point, matrix)
+                if image not in tree:
+                    tree[image] = point, k
+                    queue.append(image)
+        return tree
+
+    def _stabilizer(self, tree: Dict[Subspace,
+                                     Optional[Tuple[Subspace, int]]]
+                    ) -> List[List[int]]:
+        """
+        Generators of the stabilizer, images of defining generators
+        """
+        order = self.parent.automorphism_order // len(tree)
+        rep = self.permutation_rep
+        chain = StabilizerChain(group=rep.group())
+        obj_iter = ElementContainer(rep.object_list())
+
+        transversal = {}
+        for point, edge in tree.items():
+            if edge is None:
+                transversal[point] = rep.identity
+            else:
+                parent, k = edge
+                transversal[point] = (
+                    transversal[parent] + self.permutation_list[k]
+                )
+
+        result = []
+        for point, g in transversal.items():
+            for k, matrix in enumerate(self.matrix_list):
+                if chain.order == order:
+                    break
+
+                image = self._act(point, matrix)
+                if tree[image] == (point, k):
+                    continue
+                schreier = g + self.permutation_list[k] - transversal[image]
+                if not chain.element_test(schreier):
+                    chain.extend(schreier, obj_iter)
+                    result.append(schreier)
+
+        return [
+            [
+                self._power(schreier.image[self._index(g.power)])
+                for g in self.generator_list
+            ]
+            for schreier in result
+        ]
+
+    def _power(self, index: int) -> List[int]:
+        power = []
+        for _ in range(self.number):
+            index, value = divmod(index, self.degree)
+            power.append(value)
+        return power[::-1]
+
+    def _descendant(self, key: Subspace,
+                    tree: Dict[Subspace, Optional[Tuple[Subspace, int]]]
+                    ) -> PGroup:
+        p = self.degree
+        sub_map = {}
+        subgroup = annihilator([list(row) for row in key], self.dimension, p)
+        for pivot, row in echelon_mod_p(subgroup, p):
+            word = []
+            for col, value in enumerate(row):
+                if col != pivot and value:
+                    word.extend([self.number + col] * (-value % p))
+            sub_map[self.number + pivot] = word
+
+        rep = self.cover.group.represent.model_copy(deep=True)
+        rep.remove_index_map(sub_map)
+        step = rep.number - self.number
+
+        automorphism = [
+            [power + [0] * step for power in image_list]
+            for image_list in self._stabilizer(tree)
+        ]
+        for i in range(self.parent.rank):
+            for k in range(step):
+                image_list = [
+                    rep.from_index(j).power for j in range(self.parent.rank)
+                ]
+                image_list[i][self.number + k] = 1
+                automorphism.append(image_list)
+
+        automorphism_order = (
+            self.parent.automorphism_order // len(tree) *
+            pow(p, self.parent.rank * step)
+        )
+        return PGroup(represent=rep, rank=self.parent.rank,
+                      automorphism=automorphism,
+                      automorphism_order=automorphism_order)
+
+
+class DescendantList(BaseModel):
+    key: str
+    step: int
+    group_list: List[PGroup]
+
+
+class PGroupGenerator:
+    """
+    Groups of order p^n, one for each isomorphism class. A group of rank
+    `d` is a descendant of the elementary abelian group of order p^d, so
+    the trees of descendants are searched.
+
+    Descendants are kept for each presentation and step, and written to
+    `cache_dir/<key>-<step>.json` if the directory is given.
+    """
+
+    def __init__(self, degree: int, cache_dir: Optional[str] = None):
+        self.degree = degree
+        self.cache_dir = cache_dir
+        self.descendant_map: Dict[Tuple[str, int], List[PGroup]] = {}
+
+    def group_list(self, number: int) -> Iterator[PGroup]:
+        for rank in range(1, number + 1):
+            yield from self._search(
+                PGroup.elementary_abelian(self.degree, rank), number
+            )
+
+    def descendants(self, parent: PGroup, max_step: Optional[int] = None
+                    ) -> Iterator[PGroup]:
+        """
+        Immediate descendants of order up to `|parent| p^max_step`
+        """
+        key = presentation_key(parent.represent)
+        algorithm = None
+        step = 1
+        while max_step is None or step <= max_step:
+            group_list = self._load(key, step)
+            if group_list is None:
+                if algorithm is None:
+                    algorithm = DescendantAlgorithm(parent)
+                if step > len(algorithm.nucleus):
+                    return
+
+                group_list = []
+                for group in algorithm.run(step):
+                    group_list.append(group)
+                    yield group
+                self._save(key, step, group_list)
+            else:
+                yield from group_list
+
+            if not group_list:
+                # no allowable subgroups for larger steps either
+                return
+            step += 1
+
+    def _search(self, group: PGroup, number: int) -> Iterator[PGroup]:
+        size = group.represent.number
+        if size == number:
+            yield group
+            return
+
+        for child in self.descendants(group, number - size):
+            yield from self._search(child, number)
+
+    def _path(self, key: str, step: int) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return Path(self.cache_dir) / f'{key}-{step}.json'
+
+    def _load(self, key: str, step: int) -> Optional[List[PGroup]]:
+        if (key, step) in self.descendant_map:
+            return self.descendant_map[key, step]
+
+        path = self._path(key, step)
+        if path is None or not path.exists():
+            return None
+        group_list = DescendantList.model_validate_json(
+            path.read_text()
+        ).group_list
+        self.descendant_map[key, step] = group_list
+        return group_list
+
+    def _save(self, key: str, step: int, group_list: List[PGroup]):
+        self.descendant_map[key, step] = group_list
+        path = self._path(key, step)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(DescendantList(
+                key=key, step=step, group_list=group_list
+            ).model_dump_json())
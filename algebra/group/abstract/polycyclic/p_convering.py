@@ -1,7 +1,42 @@
+import itertools
+from typing import List, Tuple
+
 from algebra.group.abstract.polycyclic.base import PolyCyclicGroupRep, \
     PolyCyclicGroup
 
 
+def echelon_mod_p(row_list: List[List[int]], p: int
+                  ) -> List[Tuple[int, List[int]]]:
+    """
+    Reduced echelon form over Z/p. Pivot of a row is its last non-zero
+    column, so later columns are eliminated first.
+
+    :return: (pivot, row) with 1 on the pivot and 0 on other pivots
+    """
+    reduced = []
+    for row in row_list:
+        row = [value % p for value in row]
+        for pivot, other in reduced:
+            value = row[pivot]
+            if value:
+                row = [(a - value * b) % p for a, b in zip(row, other)]
+
+        pivot = max((i for i, value in enumerate(row) if value), default=None)
+        if pivot is None:
+            continue
+
+        inverse = pow(row[pivot], p - 2, p)
+        row = [value * inverse % p for value in row]
+        for k, (other_pivot, other) in enumerate(reduced):
+            value = other[pivot]
+            if value:
+                reduced[k] = other_pivot, [
+                    (a - value * b) % p for a, b in zip(other, row)
+                ]
+        reduced.append((pivot, row))
+    return reduced
+
+
 class PCoveringGroupAlgorithm:
     def __init__(self, pc_group):
         self.group: PolyCyclicGroup = pc_group
@@ -30,36 +65,109 @@ class PCoveringGroupAlgorithm:
         return result.as_group()
 
     def optimize(self, rep: PolyCyclicGroupRep):
-        while self.optimize_once(rep):
-            pass
-
-    def optimize_once(self, rep: PolyCyclicGroupRep):
-        # optimize
+        """
+        Remove redundant tails in one batch. Tails are central of order p,
+        so both sides of a consistency check differ by a vector of tails
+        over Z/p. Every check is evaluated once, and tails of pivot columns
+        of the echelon form are replaced by the other tails.
+        """
+        start = self.group.represent.number
+        row_list = []
         for left, right in self.optimize_check_pair(rep):
-            if left != right:
-                diff = left - right
-                if diff.is_identity():
-                    diff = - left + right
-
-                diff_index = diff.max_index()
-                left = diff - rep.from_index(diff_index)
-                rep.remove_index(diff_index, left.to_index_list())
-                return True
+            diff = (left - right).power
+            if any(diff[:start]):
+                raise ValueError('Presentation should be consistent')
+            if any(diff[start:]):
+                row_list.append(diff[start:])
 
-        return False
+        p = rep.degree
+        sub_map = {}
+        for pivot, row in echelon_mod_p(row_list, p):
+            word = []
+            for col, value in enumerate(row):
+                if col != pivot and value:
+                    word.extend([start + col] * (-value % p))
+            sub_map[start + pivot] = word
+        rep.remove_index_map(sub_map)
 
     def optimize_check_pair(self, rep: PolyCyclicGroupRep):
-        for ei in rep.generator_list():
+        # tails are central without relations, checks with them always hold
+        generator_list = rep.generator_list()[:self.group.represent.number]
+
+        for ei in generator_list:
             ei_p = ei * (rep.degree - 1)
 
             yield (ei + ei_p) + ei, ei + (ei_p + ei)
 
-        for ei, ej in rep.generator_list(2):
+        for ei, ej in itertools.combinations(generator_list, 2):
             ei_p = ei * (rep.degree - 1)
             ej_p = ej * (rep.degree - 1)
 
             yield (ej_p + ej) + ei, ej_p + (ej + ei)
             yield (ej + ei) + ei_p, ej + (ei + ei_p)
 
-        for ei, ej, ek in rep.generator_list(3):
+        for ei, ej, ek in itertools.combinations(generator_list, 3):
             yield (ek + ej) + ei, ek + (ej + ei)
+
+
+class PCover:
+    """
+    p-cover `G* = F / [R, F] R^p` of `G = F / R`, where `F` is free on the
+    defining generators of `G`. Its presentation extends the one of `G` by
+    generators of the p-multiplicator `R / [R, F] R^p`, and the nucleus
+    `P_c(G*)` for the p-class `c` of `G` is in the p-multiplicator.
+    """
+
+    def __init__(self, group: PolyCyclicGroup, rank: int, p_class: int,
+                 multiplicator: PolyCyclicGroup, nucleus: PolyCyclicGroup):
+        self.group = group
+        self.rank = rank
+        self.p_class = p_class
+        self.multiplicator = multiplicator
+        self.nucleus = nucleus
+
+
+class PCoverAlgorithm:
+    """
+    The p-covering group puts tails on definitions too, so it covers `G` as
+    a group on all of its generators. Defining generators generate `G*` in
+    it, and tails out of the pivots of that subgroup are a central
+    complement, which is factored out.
+    """
+
+    def __init__(self, pc_group):
+        self.group: PolyCyclicGroup = pc_group
+
+    def run(self) -> PCover:
+        rep: PolyCyclicGroupRep = self.group.represent
+        series = list(self.group.lower_exponent_p_central_series())
+        p_class = len(series) - 1
+        rank = rep.number
+        if p_class > 0:
+            frattini = series[1]
+            rank -= len(frattini.generator)
+            if any(g.min_index() < rank for g in frattini.generator):
+                raise ValueError(
+                    'Generators should generate the group modulo the '
+                    'Frattini subgroup'
+                )
+
+        covering = self.group.p_covering_group().represent
+        defined = covering.group([
+            covering.from_index(i) for i in range(rank)
+        ])
+        pivot_set = {g.min_index() for g in defined.generator}
+        covering.remove_index_map({
+            k: [] for k in range(rep.number, covering.number)
+            if k not in pivot_set
+        })
+
+        group = covering.as_group()
+        multiplicator = covering.group([
+            covering.from_index(k)
+            for k in range(rep.number, covering.number)
+        ])
+        nucleus = next(itertools.islice(
+            group.lower_exponent_p_central_series(), p_class, None
+        ))
+        return PCover(group, rank, p_class, multiplicator, nucleus)
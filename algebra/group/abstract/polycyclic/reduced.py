@@ -17,10 +17,10 @@ class PolyCyclicRow:
 
     def __mul__(self, other: int):
         assert other >= 1
-        current = self
-        for _ in range(1, other):
-            current += self
-        return current
+        return type(self)(
+            self.element * other,
+            [row * other for row in self.rows]
+        )
 
     def normalize(self):
         min_index = self.min_index()
@@ -67,23 +67,19 @@ class PolyCyclicRowReduced:
             return PolyCyclicLeftRow(e, rows)
 
     def append_mult(self, e, rows=None):
-        g = self.get_row(e, rows)
-        self._append_power(g)
-        self._append_commute(g)
-
-    def _append_power(self, g):
-        d = g.element.group.degree
-        while not g.is_identity():
-            self._append_one(g)
-            g *= d
-
-    def _append_commute(self, g):
-        if g.is_identity():
-            return
-
-        index_item = list(self.index_map.items())
-        for _, e in index_item:
-            self._append_one(g + e - g - e)
+        """
+        Append the element, and powers and commutators of every new row,
+        so that rows are closed under them
+        """
+        queue = [self.get_row(e, rows)]
+        while queue:
+            g = self._append_one(queue.pop())
+            if g.is_identity():
+                continue
+
+            queue.append(g * g.element.group.degree)
+            for other in list(self.index_map.values()):
+                queue.append(g + other - g - other)
 
     def reduce(self, e, rows=None):
         return self._append_one(self.get_row(e, rows), insert=False)
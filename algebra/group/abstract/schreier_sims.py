@@ -0,0 +1,139 @@
+import random
+from typing import Optional
+
+from algebra.group.abstract.base import Group, StabilizerChain, \
+    ElementContainer, ElementInfo
+
+
+class RandomSchreierSimsAlgorithm:
+    """
+    Randomized Schreier-Sims algorithm.
+
+    Random subproducts of strong generators are sifted through the chain and
+    every non-trivial residue is added as a new strong generator. It stops
+    when the known order is reached or `certainty` consecutive elements are
+    sifted to the identity. With `verify`, every Schreier generator is
+    sifted afterwards, which makes the result deterministic and checks the
+    known order.
+    """
+    def __init__(self,
+                 group: Group,
+                 certainty: Optional[int] = None,
+                 order: Optional[int] = None,
+                 verify: bool = False,
+                 is_factor: bool = False,
+                 schreier_vector: bool = False):
+        if certainty is None and order is None:
+            raise ValueError('certainty or order should be given')
+
+        self.group = group
+        self.certainty = certainty
+        self.order = order
+        self.verify = verify
+        self.is_factor = is_factor
+        self.schreier_vector = schreier_vector
+
+    def run(self) -> StabilizerChain:
+        rep = self.group.represent
+        chain = StabilizerChain(
+            group=rep.group(),
+            is_factor=self.is_factor,
+            schreier_vector=self.schreier_vector
+        )
+        next_object = ElementContainer(
+            rep.object_list(), self.group.orbit_partition()
+        )
+
+        for g in self.group.generator:
+            self.sift_append(chain, self._info(g), next_object)
+
+        passed = 0
+        while not self._is_done(chain, passed):
+            element = self.random_element(chain)
+            if self.sift_append(chain, element, next_object):
+                passed = 0
+            else:
+                passed += 1
+
+        if self.verify:
+            self.verify_chain(chain, next_object)
+            if self.order is not None and chain.order != self.order:
+                raise ValueError('Given order is not the order of the group')
+
+        return chain
+
+    def sift_append(self,
+                    chain: StabilizerChain,
+                    element: ElementInfo,
+                    next_object: ElementContainer) -> bool:
+        """
+        :return: True if the chain is changed
+        """
+        residue, stop = chain.sift(element)
+        if residue.element.is_identity():
+            return False
+
+        # residue fixes every base point above `stop`
+        for stabilizer in chain.travel():
+            stabilizer.append_generator(residue, next_object)
+            if stabilizer is stop:
+                break
+
+        return True
+
+    def random_element(self, chain: StabilizerChain) -> ElementInfo:
+        element = self._info(self.group.represent.identity)
+
+        # random element of current chain, t_deep + ... + t_top
+        for stabilizer in chain.travel():
+            if stabilizer.is_trivial():
+                break
+            point = random.choice(list(stabilizer.transversal))
+            element = stabilizer.transversal[point] + element
+
+        # random subproduct of strong generators
+        for generator in list(chain.generator_factor.values()):
+            if random.getrandbits(1):
+                element += generator
+
+        return element
+
+    def verify_chain(self,
+                     chain: StabilizerChain,
+                     next_object: ElementContainer):
+        # Schreier generators of each level should be in the stabilizer,
+        # check from the bottom and restart whenever the chain is changed
+        is_changed = True
+        while is_changed:
+            is_changed = False
+            for level in reversed(list(chain.travel())):
+                if level.is_trivial():
+                    continue
+
+                for delta, transversal in list(level.transversal.items()):
+                    for s in list(level.generator_factor.values()):
+                        gamma = s.element.act(delta)
+                        schreier = transversal + s - level.transversal[gamma]
+                        if self.sift_append(
+                                level.stabilizer, schreier, next_object):
+                            is_changed = True
+
+                if is_changed:
+                    break
+
+    def _is_done(self, chain: StabilizerChain, passed: int):
+        if chain.is_trivial() and not chain.generator_factor:
+            # every generator is the identity
+            return True
+
+        if self.order is not None:
+            if chain.order > self.order:
+                raise ValueError('Given order is smaller than the group')
+            return chain.order == self.order
+
+        return passed >= self.certainty
+
+    def _info(self, element):
+        if self.is_factor:
+            return ElementInfo(element=element, factor=[element])
+        return ElementInfo(element=element)
@@ -1,8 +1,12 @@
+import collections
+import functools
+
 import pydantic
 from pydantic import BaseModel
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from algebra.group.abstract.base import Group, GroupElement, GroupRep
+from algebra.group.abstract.base import ElementContainer, Group, \
+    GroupElement, GroupRep, StabilizerChain
 from algebra.group.abstract.permutation import PermutationGroupRep
 
 
@@ -46,7 +50,7 @@ class GroupDirectProductRep(PermutationGroupRep):
                 if o1 != o2:
                     mapping[map_right[i, o1]] = map_right[i, o2]
 
-        return self.element(mapping)
+        return self.element([mapping])
 
     def right_object_map(self, obj):
         return self.object_map_right[obj]
@@ -56,14 +60,14 @@ class GroupDirectProductRep(PermutationGroupRep):
             raise ValueError('Group not Matched')
 
         item = []
-        for subgroup in self.subgroup_list:
+        for i, subgroup in enumerate(self.subgroup_list):
             gen = {}
             for o1 in subgroup.object_list():
-                o2 = self.object_map_right[o1]
+                o2 = self.object_map_right[i, o1]
                 o3 = element.act(o2)
                 if o2 != o3:
-                    gen[o1] = self.object_map_left[o3]
-            item.append(subgroup.element(gen))
+                    gen[o1] = self.object_map_left[o3][1]
+            item.append(subgroup.element([gen]))
 
         return item
 
@@ -97,50 +101,137 @@ class GroupHomomorphism(BaseModel):
                 raise ValueError('Mapping not Hom')
 
     def is_valid_structure(self):
-        product_order = self.as_direct_product().order()
-        return product_order == self.domain.order()
+        """
+        Check relators of the presentation given by the chain of domain.
+        On each level, `t + s` for a transversal element `t` and a strong
+        generator `s` of the stabilizer is sifted from that level, and its
+        value should be the sum of images of `t` and `s`.
+        """
+        for g, h in self.mapping.items():
+            if self._sift_value(g) != h:
+                return False
 
-    def value(self, element):
-        if not self.domain.element_test(element):
-            raise ValueError('Not Element of domain')
+        # chain of domain may be rebased later, only the snapshot is used
+        table = self._image_table
 
-        value = self.codomain.represent.identity
+        generator_value = {}
+        for level in reversed(range(len(table))):
+            _, row, generator_factor = table[level]
+            for element, info in generator_factor.items():
+                generator_value[element] = self._word_value(info.factor)
 
-        mapping = {}
-        for g, h in self.mapping.items():
-            mapping[g] = h
-            mapping[-g] = -h
+            for transversal, image in row.values():
+                for element, value in generator_value.items():
+                    result = self._sift_value(transversal + element, level)
+                    if result != image + value:
+                        return False
+        return True
 
-        for f in self.domain.factor(element):
-            value += mapping[f]
+    def value(self, element):
+        value = self._sift_value(element)
+        if value is None:
+            raise ValueError('Not Element of domain')
         return value
 
+    def value_list(self, element_list: List[GroupElement]
+                   ) -> List[GroupElement]:
+        return [self.value(element) for element in element_list]
+
     def value_group(self, group: Group):
         return Group(
             represent=self.codomain.represent,
-            generator=[
-                self.value(g)
-                for g in group.generator
-            ]
+            generator=self.value_list(group.generator)
         )
 
-    def kernel(self) -> 'Group':
-        direct = self.as_direct_product()
-        stabilizer = direct.stabilizer_many([
-            direct.represent.right_object_map(o)
-            for o in self.codomain.represent.object_list()
-        ])
+    def _sift_value(self,
+                    element: GroupElement,
+                    level: int = 0) -> Optional[GroupElement]:
+        # element is t_deep + ... + t_top, one image is added for each level
+        value = self.codomain.represent.identity
+        for point, row, _ in self._image_table[level:]:
+            pair = row.get(element.act(point))
+            if pair is None:
+                return None
+            transversal, image = pair
+            element -= transversal
+            value = image + value
+
+        if not element.is_identity():
+            return None
+        return value
 
-        generator = []
-        for g in stabilizer.generator:
-            item = direct.represent.left_element_mep(g)
-            generator.append(item[0])
+    @functools.cached_property
+    def _image_table(self) -> List[Tuple[Any, dict, dict]]:
+        """
+        Base point of every level of the chain of domain, with transversal
+        element and its image for each point of the orbit, and strong
+        generators of the level. Images are taken from the words kept by
+        the chain, so that no table of short words is built.
+        """
+        chain = self.domain.stabilizer_chain(is_factor=True)
+
+        table = []
+        for stabilizer in chain.travel():
+            if stabilizer.is_trivial():
+                break
+
+            row = {}
+            for point, info in stabilizer.transversal.items():
+                row[point] = info.element, self._word_value(info.factor)
+            table.append((
+                stabilizer.point, row, dict(stabilizer.generator_factor)
+            ))
+        return table
+
+    def _word_value(self, word: List[GroupElement]) -> GroupElement:
+        value = self.codomain.represent.identity
+        for letter in word:
+            value += self._letter_map[letter]
+        return value
 
-        return self.domain.represent.group(*generator)
+    @functools.cached_property
+    def _letter_map(self) -> Dict[GroupElement, GroupElement]:
+        letter_map = {}
+        for g, h in self.mapping.items():
+            letter_map[g] = h
+            letter_map[-g] = -h
+        return letter_map
+
+    def kernel(self) -> 'Group':
+        """
+        Stabilizer of the identity in the action of domain on values by
+        `h -> h + value(g)`. Schreier generators `t_h + g - t_(h + value(g))`
+        are sifted, where `t_h` of value `h` is found by breadth first
+        search, so the kernel is generated exactly. ValueError is raised if
+        the mapping is not a homomorphism.
+        """
+        if not self.is_valid_structure():
+            raise ValueError('Mapping not Hom')
+
+        rep = self.domain.represent
+        chain = StabilizerChain(group=rep.group())
+        obj_iter = ElementContainer(rep.object_list())
+
+        identity = self.codomain.represent.identity
+        transversal = {identity: rep.identity}
+        queue = collections.deque([identity])
+        while queue:
+            h = queue.popleft()
+            for g, value in self.mapping.items():
+                image = h + value
+                if image not in transversal:
+                    transversal[image] = transversal[h] + g
+                    queue.append(image)
+                else:
+                    schreier = transversal[h] + g - transversal[image]
+                    if not chain.element_test(schreier):
+                        chain.extend(schreier, obj_iter)
+
+        return chain.construct()
 
     def image(self):
         return self.codomain.represent.group(
-            *self.mapping.values()
+            list(self.mapping.values())
         )
 
     def as_direct_product(self) -> Group:
@@ -156,7 +247,7 @@ class GroupHomomorphism(BaseModel):
             for items in self.mapping.items()
         ]
 
-        return group_rep.group(*generator)
+        return group_rep.group(generator)
 
     @staticmethod
     def _scan_group(element: GroupElement, group: Group, object_map):
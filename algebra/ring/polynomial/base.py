@@ -1,5 +1,6 @@
 import collections
 import copy
+import pydantic
 from pydantic import BaseModel
 import itertools
 import math
@@ -21,18 +22,21 @@ from algebra.ring.polynomial.variable import VariableSystemBase, VariableSystem,
     VariableContainer
 from algebra.ring.quotient import Ideal, QuotientRing, QuotientRingElement
 from algebra.util.decorator import iter_to_str
+from algebra.util.model import construct
 from algebra.util.zero_dict import remove_zero_dict
 
 
 class PolynomialRing(Ring):
+    model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+
     field: Field
     number: int = 0
     variable_system: (
             VariableSystemBase | VariableNameGenerator
     ) = None
-    variable: VariableContainer = dataclasses.field(init=False)
+    variable: VariableContainer = None
 
-    def __post_init__(self):
+    def model_post_init(self, __context):
         # number와 variable_system 값 구죽하기 시작
         number = self.number
         variable_system = None
@@ -139,7 +143,15 @@ class PolynomialRingElement(RingElement):
     value: dict['Monomial', FieldElement]
     _degree: 'Monomial' = None
 
-    def __post_init__(self):
+    @classmethod
+    def from_value(cls, ring: PolynomialRing, value) -> 'PolynomialRingElement':
+        """
+        Build without validation, for result of arithmetic whose monomials
+        and coefficients are already in the ring. Zero terms are dropped
+        """
+        return construct(cls, ring=ring, value=value)
+
+    def model_post_init(self, __context):
         # drop zero element
         self.value = remove_zero_dict(self.value)
 
@@ -188,7 +200,7 @@ class PolynomialRingElement(RingElement):
                                            self._wrap_iter(other)):
             value_map[pow1] += coef1
 
-        return PolynomialRingElement(ring=self.ring, value=value_map)
+        return PolynomialRingElement.from_value(self.ring, value_map)
 
     def __radd__(self, other):
         return self + other
@@ -206,9 +218,9 @@ class PolynomialRingElement(RingElement):
         return other + (-self)
 
     def __neg__(self):
-        return PolynomialRingElement(
-            ring=self.ring,
-            value={
+        return PolynomialRingElement.from_value(
+            self.ring,
+            {
                 k: -v
                 for k, v in self.value.items()
             }
@@ -228,7 +240,7 @@ class PolynomialRingElement(RingElement):
             for pow1, coef1 in self.value.items():
                 value_map[pow1] += coef1 * other
 
-        return PolynomialRingElement(ring=self.ring, value=value_map)
+        return PolynomialRingElement.from_value(self.ring, value_map)
 
     def __rmul__(self, other):
         return self * other
@@ -248,9 +260,9 @@ class PolynomialRingElement(RingElement):
         if other.is_zero():
             raise ValueError('Cannot divide by zero')
 
-        return PolynomialRingElement(
-            ring=self.ring,
-            value={k: v / other for k, v in self.value.items()}
+        return PolynomialRingElement.from_value(
+            self.ring,
+            {k: v / other for k, v in self.value.items()}
         )
 
     def __pow__(self, power: int, modulo=None) -> 'PolynomialRingElement':
@@ -294,8 +306,8 @@ class PolynomialRingElement(RingElement):
                     coefficient /= lc
                     monomial /= lm
                     result[monomial] = coefficient
-                    divisible = PolynomialRingElement(
-                        ring=self.ring, value={monomial: coefficient}
+                    divisible = PolynomialRingElement.from_value(
+                        self.ring, {monomial: coefficient}
                     )
                     current -= divisible * other
                     break
@@ -303,7 +315,7 @@ class PolynomialRingElement(RingElement):
                 break
 
         return (
-            PolynomialRingElement(ring=self.ring, value=result),
+            PolynomialRingElement.from_value(self.ring, result),
             current
         )
 
@@ -353,7 +365,7 @@ class PolynomialRingElement(RingElement):
         )
 
     def constant_monomial(self):
-        return Monomial(ring=self.ring, power=[0]*self.ring.number)
+        return Monomial.from_power(self.ring, [0] * self.ring.number)
 
     def s_polynomial(self, e2: 'PolynomialRingElement'
                      ) -> 'PolynomialRingElement':
@@ -559,10 +571,18 @@ class Monomial(BaseModel):
     power: List[int]
     ring: 'PolynomialRing'
 
-    def __post_init__(self):
-        for i, p in enumerate(self.power):
+    @pydantic.field_validator('power')
+    @classmethod
+    def check_power(cls, power: List[int]) -> List[int]:
+        for i, p in enumerate(power):
             if p < 0:
                 raise ValueError(f"{i}-th index is negative.")
+        return power
+
+    @classmethod
+    def from_power(cls, ring: 'PolynomialRing', power: List[int]):
+        # power is not checked, for result of monomial arithmetic
+        return construct(cls, power=power, ring=ring)
 
     def __hash__(self):
         return hash((tuple(self.power), self.ring))
@@ -582,7 +602,7 @@ class Monomial(BaseModel):
                 raise ValueError("Operation can be with same ring")
 
             power = [x + y for x, y in zip(self.power, other.power)]
-            return Monomial(power=power, ring=self.ring)
+            return Monomial.from_power(self.ring, power)
 
         return NotImplemented
 
@@ -593,7 +613,7 @@ class Monomial(BaseModel):
             raise ValueError("Operation can be with same ring")
 
         power = [x - y for x, y in zip(self.power, other.power)]
-        return Monomial(power=power, ring=self.ring)
+        return Monomial.from_power(self.ring, power)
 
     def __call__(self, value_list):
         if len(self.power) != len(value_list):
@@ -629,15 +649,15 @@ class Monomial(BaseModel):
         return True
 
     def gcd(self, other: 'Monomial') -> 'Monomial':
-        return Monomial(
-            power=[min(x, y) for x, y in zip(self.power, other.power)],
-            ring=self.ring
+        return Monomial.from_power(
+            self.ring,
+            [min(x, y) for x, y in zip(self.power, other.power)]
         )
 
     def lcm(self, other: 'Monomial') -> 'Monomial':
-        return Monomial(
-            power=[max(x, y) for x, y in zip(self.power, other.power)],
-            ring=self.ring
+        return Monomial.from_power(
+            self.ring,
+            [max(x, y) for x, y in zip(self.power, other.power)]
         )
 
     def diff(self, index: int):
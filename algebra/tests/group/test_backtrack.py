@@ -0,0 +1,78 @@
+import math
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep
+
+
+class TestBacktrack(unittest.TestCase):
+    def symmetric(self, degree, compact=False):
+        perm = PermutationGroupRep(degree=degree, compact=compact)
+        return perm, perm.group([[list(range(degree))], [[0, 1]]])
+
+    def test_centralizer(self):
+        perm, group = self.symmetric(6)
+        x = perm.element([[0, 1], [2, 3]])
+
+        centralizer = group.centralizer(x)
+
+        expected = sum(
+            1
+            for element in group.element_list()
+            if element + x == x + element
+        )
+        self.assertEqual(expected, centralizer.order())
+        for g in centralizer.generator:
+            self.assertEqual(g + x, x + g)
+
+    def test_centralizer_cycle_type(self):
+        perm, group = self.symmetric(12, compact=True)
+        x = perm.element([[0, 1, 2], [3, 4, 5], [6, 7]])
+
+        self.assertEqual(
+            3 * 3 * math.factorial(2) * 2 * math.factorial(4),
+            group.centralizer(x).order()
+        )
+
+    def test_center(self):
+        perm, group = self.symmetric(5)
+        self.assertEqual(1, group.center().order())
+
+        dihedral = perm.group([[[0, 1, 2, 3]], [[0, 2]]])
+        self.assertEqual(2, dihedral.center().order())
+
+        abelian = perm.group([[[0, 1, 2]], [[3, 4]]])
+        self.assertEqual(6, abelian.center().order())
+
+    def test_normalizer(self):
+        perm, group = self.symmetric(5)
+
+        cyclic = perm.group([[[0, 1, 2, 3, 4]]])
+        self.assertEqual(20, group.normalizer(cyclic).order())
+
+        klein = perm.group([[[0, 1], [2, 3]], [[0, 2], [1, 3]]])
+        self.assertEqual(24, group.normalizer(klein).order())
+
+    def test_set_stabilizer(self):
+        perm, group = self.symmetric(6)
+        obj_list = list(perm.object_list())
+
+        stabilizer = group.set_stabilizer(obj_list[:2])
+
+        self.assertEqual(
+            math.factorial(2) * math.factorial(4),
+            stabilizer.order()
+        )
+        for g in stabilizer.generator:
+            self.assertEqual(
+                set(obj_list[:2]),
+                {g.act(o) for o in obj_list[:2]}
+            )
+
+    def test_cached_chain(self):
+        perm, group = self.symmetric(6)
+        obj_list = list(perm.object_list())
+        base = group.stabilizer_chain().base()
+
+        # the search rebases a copy of the chain
+        group.set_stabilizer(obj_list[3:5])
+        self.assertEqual(base, group.stabilizer_chain().base())
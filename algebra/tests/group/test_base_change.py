@@ -0,0 +1,106 @@
+import random
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep
+from algebra.group.homomorphism import GroupHomomorphism
+
+
+class TestBaseChange(unittest.TestCase):
+    def _m12(self, compact=False):
+        rep = PermutationGroupRep(degree=12, compact=compact)
+        return rep.group([
+            [list(range(11))],
+            [[0, 11], [1, 10], [2, 5], [3, 7], [4, 8], [6, 9]],
+            [[2, 6, 10, 7], [3, 9, 4, 5]]
+        ])
+
+    def _check_chain(self, chain):
+        for stabilizer in chain.travel():
+            if stabilizer.is_trivial():
+                break
+            for point, info in stabilizer.transversal.items():
+                self.assertEqual(info.element.act(stabilizer.point), point)
+            for g in stabilizer.stabilizer.generator_factor.values():
+                self.assertEqual(g.element.act(stabilizer.point),
+                                 stabilizer.point)
+
+    def test_change_base(self):
+        for schreier_vector in [False, True]:
+            group = self._m12(compact=True)
+            chain = group.stabilizer_chain(schreier_vector=schreier_vector)
+            ol = list(group.represent.object_list())
+
+            for _ in range(5):
+                point_list = random.sample(ol, 4)
+                chain.change_base(point_list)
+                self.assertEqual(chain.base()[:4], point_list)
+                self.assertEqual(chain.order, 95_040)
+                self._check_chain(chain)
+
+            self.assertTrue(group.element_test(group.random_element()))
+            self.assertFalse(
+                group.element_test(group.represent.element([[0, 1]]))
+            )
+
+    def test_swap(self):
+        group = self._m12()
+        chain = group.stabilizer_chain()
+        base = chain.base()
+
+        chain.stabilizer.swap()
+        self.assertEqual(chain.base()[:3], [base[0], base[2], base[1]])
+        self.assertEqual(chain.order, 95_040)
+        self._check_chain(chain)
+
+    def test_redundant_point(self):
+        rep = PermutationGroupRep(degree=10)
+        ol = list(rep.object_list())
+        group = rep.group([[[0, 1, 2, 3]], [[0, 1]]])
+
+        base = group.stabilizer_chain().base()
+        element_list = list(group.element_list())
+
+        stabilizer = group.stabilizer_many([ol[8], ol[2]])
+        self.assertEqual(stabilizer.order(), 6)
+        self.assertEqual(stabilizer.stabilizer_chain().order, 6)
+        self.assertEqual(group.stabilizer_chain().base(), base)
+        self.assertEqual(list(group.element_list()), element_list)
+        self.assertEqual(group.order(), 24)
+
+    def test_stabilizer_many(self):
+        group = self._m12()
+        ol = list(group.represent.object_list())
+
+        # M12 is sharply 5-transitive
+        self.assertEqual(group.stabilizer_many(ol[:3]).order(), 72)
+        self.assertEqual(group.stabilizer_many(ol[3:8]).order(), 1)
+
+    def test_stabilizer_detached(self):
+        rep = PermutationGroupRep(degree=6)
+        ol = list(rep.object_list())
+        group = rep.group([[list(range(6))], [[0, 1]]])
+
+        # second base change should not touch the first stabilizer
+        stabilizer = group.stabilizer_many([ol[0]])
+        group.stabilizer_many([ol[3]])
+        self.assertEqual(stabilizer.order(), 120)
+        self.assertFalse(stabilizer.element_test(rep.element([[0, 1]])))
+        self.assertTrue(stabilizer.element_test(rep.element([[3, 4]])))
+
+    def test_kernel(self):
+        rep = PermutationGroupRep(degree=6)
+        domain = rep.group([[list(range(6))], [[0, 1]]])
+
+        codomain_rep = PermutationGroupRep(degree=2)
+        codomain = codomain_rep.group([[[0, 1]]])
+        one = codomain.generator[0]
+
+        hom = GroupHomomorphism(
+            domain=domain,
+            codomain=codomain,
+            mapping={
+                domain.generator[0]: one,
+                domain.generator[1]: one
+            }
+        )
+        self.assertEqual(hom.kernel().order(), 360)
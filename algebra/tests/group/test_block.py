@@ -0,0 +1,53 @@
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep
+from algebra.group.abstract.shortcut import alternative_group, \
+    dihedral_group, symmetric_group
+
+
+class TestBlock(unittest.TestCase):
+    def test_primitive(self):
+        self.assertTrue(symmetric_group(6).is_primitive())
+        self.assertTrue(alternative_group(5).is_primitive())
+        self.assertEqual(symmetric_group(5).block_systems(), [])
+
+        rep = PermutationGroupRep(degree=6)
+        self.assertFalse(rep.group([[[0, 1]]]).is_primitive())
+        self.assertFalse(rep.group([[list(range(6))]]).is_primitive())
+
+    def test_wreath(self):
+        # C2 wr S3 keeps only the pairs {0, 1}, {2, 3}, {4, 5}
+        rep = PermutationGroupRep(degree=6)
+        group = rep.group([
+            [[0, 1]], [[0, 2, 4], [1, 3, 5]], [[0, 2], [1, 3]]
+        ])
+        o = rep.object_tuple
+
+        system_list = group.block_systems()
+        self.assertEqual(system_list, [
+            [{o[0], o[1]}, {o[2], o[3]}, {o[4], o[5]}]
+        ])
+        self.assertIs(system_list, group.block_systems())
+        self.assertFalse(group.is_primitive())
+
+        self.assertEqual(
+            len(group.minimal_block_system([o[0], o[2]])), 1
+        )
+
+        hom = group.block_action(system_list[0])
+        self.assertEqual(hom.codomain.order(), 6)
+
+    def test_regular(self):
+        # block systems of a regular action are proper non-trivial
+        # subgroups, D12 has 14 of them
+        group = dihedral_group(6)
+        system_list = group.block_systems()
+        self.assertEqual(len(system_list), 14)
+        for system in system_list:
+            size = len(system[0])
+            self.assertEqual(12 % size, 0)
+            for block in system:
+                self.assertEqual(len(block), size)
+                for g in group.generator:
+                    image = {g.act(o) for o in block}
+                    self.assertIn(image, system)
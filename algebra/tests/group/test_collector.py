@@ -0,0 +1,102 @@
+import itertools
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep
+from algebra.group.abstract.polycyclic.base import PolyCyclicGroupRep
+from algebra.group.abstract.polycyclic.collector import Collector, \
+    to_syllable_list
+
+
+class TestCollector(unittest.TestCase):
+    def _dihedral_16(self):
+        return PolyCyclicGroupRep(
+            degree=2, number=4,
+            power_relation={1: [2], 2: [3]},
+            commute_relation={(1, 0): [2, 3], (2, 0): [3]}
+        )
+
+    def test_syllable(self):
+        self.assertEqual(
+            to_syllable_list([1, 1, 2, 1]), [(1, 2), (2, 1), (1, 1)]
+        )
+
+    def test_heisenberg(self):
+        # a1 a0 = a0 a1 a2 with central a2, all of order 3
+        collector = Collector(3, 3, {}, {(1, 0): [2]})
+        self.assertEqual(collector.multiply([0, 1, 0], [1, 0, 0]), [1, 1, 1])
+        self.assertEqual(collector.multiply([0, 2, 0], [2, 0, 0]), [2, 2, 1])
+        self.assertEqual(collector.conjugate(0, 1, 2), [(1, 2), (2, 2)])
+
+    def test_sequence(self):
+        # D16 on the vertices of an octagon, a0 is a reflection and a1 is
+        # the rotation whose powers are a2 and a3
+        rep = self._dihedral_16()
+        perm = PermutationGroupRep(degree=8)
+        rotation = perm.element([list(range(8))])
+        reflection = perm.element([[1, 7], [2, 6], [3, 5]])
+
+        def image(element):
+            a0, a1, a2, a3 = element.power
+            result = reflection if a0 else perm.identity
+            for _ in range(a1 + 2 * a2 + 4 * a3):
+                result += rotation
+            return result
+
+        element_list = [
+            rep.element(power)
+            for power in itertools.product(range(2), repeat=4)
+        ]
+        self.assertEqual(len({image(a) for a in element_list}), 16)
+        for a in element_list:
+            for b in element_list:
+                self.assertEqual(image(a + b), image(a) + image(b))
+
+        for a, b, c in itertools.product(element_list[::3], repeat=3):
+            self.assertEqual((a + b) + c, a + (b + c))
+
+    def test_covering(self):
+        rep = PolyCyclicGroupRep(
+            degree=2, number=3,
+            power_relation={0: [2], 1: [2]},
+            commute_relation={(1, 0): [2]}
+        )
+        group = rep.as_group().p_covering_group()
+        self.assertEqual(group.order(), 64)
+
+        collector = rep.collector
+        self.assertIs(collector, rep.collector)
+        rep.add_number()
+        self.assertIsNot(collector, rep.collector)
+        self.assertEqual(rep.collector.number, 4)
+
+    def test_power(self):
+        rep = self._dihedral_16()
+        element_list = [
+            rep.element(power)
+            for power in itertools.product(range(2), repeat=4)
+        ]
+        for a in element_list:
+            self.assertTrue((a - a).is_identity())
+            self.assertTrue((-a + a).is_identity())
+
+            current = rep.identity
+            for n in range(17):
+                self.assertEqual(a * n, current)
+                current += a
+            self.assertEqual(a * -3, -(a * 3))
+
+            order = 1
+            while not (a * order).is_identity():
+                order += 1
+            self.assertEqual(a.order(), order)
+
+    def test_large_exponent(self):
+        # cyclic group of order 7^6 by power relations
+        rep = PolyCyclicGroupRep(
+            degree=7, number=6,
+            power_relation={i: [i + 1] for i in range(5)}
+        )
+        g = rep.from_index(0)
+        self.assertEqual(g.order(), 7 ** 6)
+        self.assertEqual((g * (7 ** 6 - 1) + g), rep.identity)
+        self.assertEqual((g * 8).power, [1, 1, 0, 0, 0, 0])
@@ -0,0 +1,46 @@
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep, \
+    CompactPermutationGroupElement
+
+
+class TestCompactPermutation(unittest.TestCase):
+    def test_opt_in(self):
+        rep = PermutationGroupRep(degree=5, compact=True)
+        e = rep.element([[0, 1, 2], [3, 4]])
+
+        self.assertIsInstance(e, CompactPermutationGroupElement)
+        self.assertIsInstance(rep.identity, CompactPermutationGroupElement)
+        self.assertEqual(list(e.to_seq()), [[0, 1, 2], [3, 4]])
+        self.assertEqual(e.order(), 6)
+
+    def test_arithmetic(self):
+        rep = PermutationGroupRep(degree=4, compact=True)
+        a0, a1, a2, a3 = rep.object_list()
+
+        e1 = rep.element([[0, 1]])
+        self.assertEqual(e1 + e1, rep.identity)
+
+        e2 = rep.element([[1, 2, 3]])
+        self.assertNotEqual(e2 + e2, rep.identity)
+        self.assertEqual(e2 + e2 + e2, rep.identity)
+        self.assertEqual(e2 + (-e2), rep.identity)
+        self.assertTrue((e2 - e2).is_identity())
+
+        # act on first element first
+        self.assertEqual((e1 + e2).act(a0), a2)
+        self.assertEqual((e2 + e1).act(a0), a1)
+        self.assertEqual(e2.act(1), 2)
+
+    def test_same_as_dict_backend(self):
+        generator = [
+            [list(range(11))],
+            [[2, 6, 10, 7], [3, 9, 4, 5]]
+        ]  # M11
+
+        group = PermutationGroupRep(degree=11).group(generator)
+        compact = PermutationGroupRep(degree=11, compact=True).group(generator)
+
+        self.assertEqual(compact.order(), 7920)
+        self.assertEqual(compact.order_statistics(), group.order_statistics())
+        self.assertEqual(len(set(compact.element_list())), 7920)
@@ -0,0 +1,57 @@
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep
+
+
+class TestConjugacy(unittest.TestCase):
+    def test_symmetric(self):
+        perm = PermutationGroupRep(degree=6)
+        group = perm.group([[list(range(6))], [[0, 1]]])
+
+        class_list = group.conjugacy_classes()
+
+        self.assertEqual(11, len(class_list))
+        self.assertEqual(720, sum(c.size for c in class_list))
+        for conjugacy_class in class_list:
+            self.assertEqual(
+                720,
+                conjugacy_class.size * conjugacy_class.centralizer().order()
+            )
+
+    def test_random_discovery(self):
+        perm = PermutationGroupRep(degree=5, compact=True)
+        alternating = perm.group([[[0, 1, 2]], [[0, 1, 2, 3, 4]]])
+
+        class_list = alternating.conjugacy_classes()
+
+        self.assertEqual(
+            [1, 12, 12, 15, 20],
+            sorted(c.size for c in class_list)
+        )
+        for conjugacy_class in class_list:
+            self.assertEqual(
+                60,
+                conjugacy_class.size * conjugacy_class.centralizer().order()
+            )
+
+        # five cycles are split into two classes
+        x = perm.element([[0, 1, 2, 3, 4]])
+        y = perm.element([[0, 2, 1, 3, 4]])
+        self.assertIsNone(alternating.element_conjugator(x, y))
+
+        z = perm.element([[0, 4, 3, 2, 1]])
+        g = alternating.element_conjugator(x, z)
+        self.assertEqual(z, -g + x + g)
+
+    def test_is_conjugate(self):
+        perm = PermutationGroupRep(degree=5)
+
+        h = perm.group([[[0, 1]]])
+        self.assertTrue(h.is_conjugate(perm.group([[[2, 3]]])))
+        self.assertFalse(h.is_conjugate(perm.group([[[2, 3], [0, 1]]])))
+
+        k1 = perm.group([[[0, 1, 2, 3]], [[0, 2]]])
+        k2 = perm.group([[[1, 2, 4, 3]], [[1, 4]]])
+        k3 = perm.group([[[0, 1, 2, 3]]])
+        self.assertTrue(k1.is_conjugate(k2))
+        self.assertFalse(k1.is_conjugate(k3))
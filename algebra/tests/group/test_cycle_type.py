@@ -0,0 +1,33 @@
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep, \
+    CycleType
+
+
+class TestCycleType(unittest.TestCase):
+    def test_cycle_type(self):
+        for compact in [False, True]:
+            perm = PermutationGroupRep(degree=8, compact=compact)
+            element = perm.element([[0, 1], [2, 3, 4], [5, 6]])
+
+            cycle_type = element.cycle_type()
+            self.assertEqual(CycleType([2, 3, 2]), cycle_type)
+            self.assertEqual((3, 2, 2), cycle_type.length)
+            self.assertEqual(6, cycle_type.order)
+            self.assertEqual(7, cycle_type.support())
+            self.assertEqual(6, element.order())
+
+            # computed once, shared with inverse
+            self.assertIs(cycle_type, element.cycle_type())
+            self.assertIs(cycle_type, (-element).cycle_type())
+
+            self.assertEqual(CycleType([]), perm.identity.cycle_type())
+            self.assertEqual(1, perm.identity.order())
+
+    def test_conjugate(self):
+        perm = PermutationGroupRep(degree=6, compact=True)
+        x = perm.element([[0, 1, 2], [3, 4]])
+        g = perm.element([[0, 5], [1, 3]])
+
+        self.assertEqual(x.cycle_type(), (-g + x + g).cycle_type())
+        self.assertNotEqual(x.cycle_type(), (x + g).cycle_type())
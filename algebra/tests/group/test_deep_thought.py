@@ -0,0 +1,92 @@
+import itertools
+import tempfile
+import unittest
+from pathlib import Path
+
+from algebra.group.abstract.polycyclic.base import PolyCyclicGroupRep
+from algebra.group.abstract.polycyclic.deep_thought import DeepThought, \
+    presentation_weight
+
+
+class TestDeepThought(unittest.TestCase):
+    def _dihedral_16(self):
+        return PolyCyclicGroupRep(
+            degree=2, number=4,
+            power_relation={1: [2], 2: [3]},
+            commute_relation={(1, 0): [2, 3], (2, 0): [3]}
+        )
+
+    def _cyclic_27(self):
+        return PolyCyclicGroupRep(
+            degree=3, number=3,
+            power_relation={0: [1], 1: [2]}
+        )
+
+    def test_weight(self):
+        self.assertEqual(presentation_weight(self._dihedral_16()),
+                         [1, 1, 2, 4])
+        self.assertEqual(presentation_weight(self._cyclic_27()), [1, 3, 9])
+
+    def test_formula(self):
+        for rep in [self._dihedral_16(), self._cyclic_27()]:
+            deep_thought = DeepThought.build(rep)
+            collector = rep.collector
+            point_list = [
+                list(power)
+                for power in itertools.product(
+                    range(rep.degree), repeat=rep.number
+                )
+            ]
+            for left in point_list:
+                self.assertEqual(deep_thought.negate(left),
+                                 collector.inverse(left))
+                for right in point_list:
+                    self.assertEqual(
+                        deep_thought.multiply(left, right),
+                        collector.multiply(left, right)
+                    )
+
+    def test_element(self):
+        rep = self._dihedral_16()
+        element_list = [
+            rep.element(power)
+            for power in itertools.product(range(2), repeat=4)
+        ]
+        expected = [
+            (a + b, a * 5)
+            for a, b in zip(element_list, element_list[::-1])
+        ]
+
+        rep.build_deep_thought()
+        result = [
+            (a + b, a * 5)
+            for a, b in zip(element_list, element_list[::-1])
+        ]
+        self.assertEqual(result, expected)
+        for a in element_list:
+            self.assertTrue((a - a).is_identity())
+
+        rep.add_number()
+        self.assertIsNone(rep._deep_thought)
+
+    def test_limit(self):
+        # cyclic group of order 5^4 has weights 1, 5, 25 and 125
+        rep = PolyCyclicGroupRep(
+            degree=5, number=4,
+            power_relation={0: [1], 1: [2], 2: [3]}
+        )
+        with self.assertRaises(ValueError):
+            rep.build_deep_thought()
+        self.assertIsNone(rep._deep_thought)
+        self.assertEqual(rep.element([1, 0, 0, 0]) * 5,
+                         rep.element([0, 1, 0, 0]))
+
+    def test_cache(self):
+        rep = self._cyclic_27()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            built = rep.build_deep_thought(cache_dir)
+            self.assertEqual(len(list(Path(cache_dir).iterdir())), 1)
+
+            loaded = DeepThought.build(self._cyclic_27(), cache_dir)
+            self.assertEqual(loaded, built)
+            self.assertEqual(loaded.power([1, 0, 0], 26), [2, 2, 2])
@@ -0,0 +1,60 @@
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep
+
+
+class TestElementCursor(unittest.TestCase):
+    def setUp(self):
+        self.perm = PermutationGroupRep(degree=6, compact=True)
+        self.group = self.perm.group([[list(range(6))], [[0, 1]]])
+
+    def test_rank_unrank(self):
+        element_list = list(self.group.element_list())
+        self.assertEqual(720, len(set(element_list)))
+
+        for index, element in enumerate(element_list):
+            self.assertEqual(index, self.group.element_rank(element))
+            self.assertEqual(element, self.group.element_unrank(index))
+
+        with self.assertRaises(IndexError):
+            self.group.element_unrank(720)
+
+        subgroup = self.perm.group([[[0, 1, 2]]])
+        with self.assertRaises(ValueError):
+            subgroup.element_rank(self.perm.element([[0, 1]]))
+
+    def test_slice(self):
+        element_list = list(self.group.element_list())
+
+        self.assertEqual(
+            element_list[100:250],
+            list(self.group.element_list(100, 250))
+        )
+        self.assertEqual(
+            element_list[700:],
+            list(self.group.element_list(700, 1000))
+        )
+        self.assertEqual([], list(self.group.element_list(720)))
+
+        # pages are resumed from each stop
+        paged = []
+        for start in range(0, 720, 97):
+            paged.extend(self.group.element_list(start, start + 97))
+        self.assertEqual(element_list, paged)
+
+    def test_schreier_vector(self):
+        group = self.perm.group([[list(range(6))], [[0, 1]]])
+        group.stabilizer_chain(schreier_vector=True)
+
+        element_list = list(group.element_list(10, 20))
+        for index, element in enumerate(element_list, 10):
+            self.assertEqual(index, group.element_rank(element))
+            self.assertEqual(element, group.element_unrank(index))
+
+    def test_trivial(self):
+        group = self.perm.group()
+        self.assertEqual(
+            [self.perm.identity],
+            list(group.element_list())
+        )
+        self.assertEqual(0, group.element_rank(self.perm.identity))
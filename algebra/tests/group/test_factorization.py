@@ -0,0 +1,87 @@
+import unittest
+
+from algebra.group.abstract.factorization import Factorization
+from algebra.group.abstract.permutation import PermutationGroupRep
+from algebra.group.homomorphism import GroupHomomorphism
+
+
+class TestFactorization(unittest.TestCase):
+    def _evaluate(self, group, word):
+        element = group.represent.identity
+        for letter in word:
+            element += letter
+        return element
+
+    def _mathieu_11(self):
+        rep = PermutationGroupRep(degree=11)
+        return rep.group([
+            [list(range(11))],
+            [[2, 6, 10, 7], [3, 9, 4, 5]]
+        ])
+
+    def test_word(self):
+        group = self._mathieu_11()
+        letter_list = group.generator + [-g for g in group.generator]
+        chain = group.stabilizer_chain(True)
+
+        chain_length = 0
+        word_length = 0
+        for element in group.element_list(0, 60):
+            word = group.factor(element)
+            for letter in word:
+                self.assertIn(letter, letter_list)
+            self.assertEqual(self._evaluate(group, word), element)
+
+            chain_length += len(chain.factor(element))
+            word_length += len(word)
+
+        self.assertLess(word_length, chain_length)
+
+    def test_short_word(self):
+        group = self._mathieu_11()
+        factorization = Factorization(group, depth=3, meet_size=64)
+
+        a, b = group.generator
+        element = a + b + a + a + b + b
+        self.assertNotIn(element, factorization.table)
+
+        word = factorization.short_word(element)
+        self.assertEqual(self._evaluate(group, word), element)
+        self.assertLessEqual(len(word), 6)
+        self.assertEqual(len(factorization.factor(element, 6)), len(word))
+
+    def test_cache(self):
+        group = self._mathieu_11()
+        factorization = Factorization(group, cache_size=4)
+
+        element_list = list(group.element_list(1000, 1010))
+        for element in element_list:
+            factorization.factor(element)
+
+        self.assertEqual(len(factorization._cache), 4)
+        self.assertIn(element_list[-1], factorization._cache)
+
+        rep = PermutationGroupRep(degree=11)
+        with self.assertRaises(ValueError):
+            group.factor(rep.element([[0, 1]]))
+
+    def test_homomorphism(self):
+        # sign of S6
+        rep = PermutationGroupRep(degree=6)
+        domain = rep.group([[list(range(6))], [[0, 1]]])
+        codomain = PermutationGroupRep(degree=2).group([[[0, 1]]])
+        one = codomain.generator[0]
+
+        hom = GroupHomomorphism(
+            domain=domain,
+            codomain=codomain,
+            mapping={g: one for g in domain.generator}
+        )
+
+        for element in domain.element_list():
+            odd = sum(len(c) - 1 for c in element.to_seq()) % 2
+            self.assertEqual(hom.value(element).is_identity(), not odd)
+
+        # values are sifted, no table of short words is needed
+        self.assertIsNone(domain._factorization)
+        self.assertNotIn('table', domain.factorization().__dict__)
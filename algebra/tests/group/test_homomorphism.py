@@ -46,7 +46,7 @@ class TestHomomorphism(unittest.TestCase):
             g: codomain.represent.identity
             for g in domain.generator
         }
-        hom = GroupHomomorphism(domain, codomain, m)
+        hom = GroupHomomorphism(domain=domain, codomain=codomain, mapping=m)
         hom_image = hom.image()
         self.assertEqual(hom_image.order(), 1)  # trivial group
         self.assertEqual(hom.kernel().order(), domain.order())
@@ -57,7 +57,7 @@ class TestHomomorphism(unittest.TestCase):
         domain = alternative_group(n)
         ol = list(domain.represent.object_list())
         domain.generator.append(
-            domain.represent.element(ol[:2])
+            domain.represent.element([ol[:2]])
         )
         self.assertEqual(domain.order(), 40_320)
 
@@ -70,8 +70,87 @@ class TestHomomorphism(unittest.TestCase):
             g: zero if g.order() == 3 else one
             for g in domain.generator
         }
-        hom = GroupHomomorphism(domain, codomain, mapping)
+        hom = GroupHomomorphism(
+            domain=domain, codomain=codomain, mapping=mapping
+        )
 
         self.assertEqual(hom.image().order(), 2)
         self.assertEqual(hom.kernel().order(), 20_160)
         self.assertTrue(domain.is_normal(hom.kernel()))
+
+    def test_value_table(self):
+        # A4 onto A3 by the action on the three pairings of four points
+        domain = alternative_group(4)
+        codomain = symmetric_group(3)
+        ol = list(domain.represent.object_list())
+        pairing_list = [
+            frozenset([frozenset([0, 1]), frozenset([2, 3])]),
+            frozenset([frozenset([0, 2]), frozenset([1, 3])]),
+            frozenset([frozenset([0, 3]), frozenset([1, 2])]),
+        ]
+
+        def act(element):
+            image = {}
+            for i, pairing in enumerate(pairing_list):
+                moved = frozenset(
+                    frozenset(element.act(ol[p]).value for p in pair)
+                    for pair in pairing
+                )
+                image[i] = pairing_list.index(moved)
+            return codomain.represent.element([image])
+
+        hom = GroupHomomorphism(
+            domain=domain,
+            codomain=codomain,
+            mapping={g: act(g) for g in domain.generator}
+        )
+
+        element_list = list(domain.element_list())
+        self.assertEqual(
+            hom.value_list(element_list),
+            [act(element) for element in element_list]
+        )
+        self.assertEqual(hom.value_group(domain).order(), 3)
+        kernel = hom.kernel()
+        self.assertEqual(kernel.order(), 4)
+        self.assertEqual(
+            set(kernel.element_list()),
+            {e for e in element_list if act(e).is_identity()}
+        )
+
+        with self.assertRaises(ValueError):
+            hom.value(domain.represent.element([[0, 1]]))
+
+    def test_valid_structure(self):
+        domain = symmetric_group(5)
+        codomain = cyclic_group(2)
+        one = codomain.generator[0]
+        zero = codomain.represent.identity
+        cycle, transposition = domain.generator
+
+        sign = GroupHomomorphism(
+            domain=domain,
+            codomain=codomain,
+            mapping={cycle: zero, transposition: one}
+        )
+        self.assertTrue(sign.is_valid_structure())
+        kernel = sign.kernel()
+        self.assertEqual(kernel.order(), 60)
+        for g in kernel.generator:
+            self.assertEqual(sign.value(g), zero)
+
+        # 5-cycle is even
+        wrong = GroupHomomorphism(
+            domain=domain,
+            codomain=codomain,
+            mapping={cycle: one, transposition: one}
+        )
+        self.assertFalse(wrong.is_valid_structure())
+        with self.assertRaises(ValueError):
+            wrong.kernel()
+
+        # snapshot of the chain is kept after the domain is rebased
+        ol = list(domain.represent.object_list())
+        domain.stabilizer_chain().change_base(ol[::-1])
+        self.assertTrue(sign.is_valid_structure())
+        self.assertFalse(wrong.is_valid_structure())
@@ -0,0 +1,44 @@
+import gc
+import pickle
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep
+
+
+class TestIntern(unittest.TestCase):
+    def test_identical(self):
+        for compact in [False, True]:
+            perm = PermutationGroupRep(degree=5, compact=compact)
+            a = perm.element([[0, 1, 2]])
+
+            self.assertIs(a, perm.element([[1, 2, 0]]))
+            self.assertIs(perm.identity, a + a + a)
+            self.assertIs(a, -(-a))
+            self.assertEqual(hash(a), hash(perm.element([[2, 0, 1]])))
+
+            # element of other GroupRep is equal, but not shared
+            other = PermutationGroupRep(degree=5, compact=compact)
+            b = other.element([[0, 1, 2]])
+            self.assertIsNot(a, b)
+            self.assertEqual(a, b)
+
+    def test_weak(self):
+        perm = PermutationGroupRep(degree=5, compact=True)
+        a = perm.element([[0, 1, 2, 3, 4]])
+        for _ in range(10):
+            a = a + perm.element([[0, 1]])
+        gc.collect()
+
+        self.assertLessEqual(len(perm._intern_table), 3)
+
+    def test_pickle(self):
+        for compact in [False, True]:
+            perm = PermutationGroupRep(degree=5, compact=compact)
+            a = perm.element([[0, 1, 2]])
+
+            a1, a2 = pickle.loads(pickle.dumps([a, a + perm.identity]))
+            b = a1.group.element([[0, 1, 2]])
+
+            self.assertEqual(a, a1)
+            self.assertIs(a1, a2)
+            self.assertIs(a1, b)
@@ -103,3 +103,60 @@ class TestHomomorphism(unittest.TestCase):
         g2 = dihedral_group(6)
 
         self.assertTrue(g1.is_isomorphism(g2))
+
+    def test_isomorphism_groups(self):
+        # D12 is S3 x C2
+        g1 = dihedral_group(6)
+        rep = PermutationGroupRep(degree=5)
+        g2 = rep.group([[[0, 1, 2]], [[0, 1]], [[3, 4]]])
+
+        hom = g1.isomorphism_groups(g2)
+        self.assertIsNotNone(hom)
+        self.assertEqual(hom.image().order(), 12)
+        self.assertEqual(hom.kernel().order(), 1)
+        for x in g1.element_list():
+            for y in g1.generator:
+                self.assertEqual(hom.value(x + y), hom.value(x) + hom.value(y))
+
+        self.assertEqual(g1.group_id(), g2.group_id())
+        self.assertIsNone(g1.isomorphism_groups(alternative_group(4)))
+
+    def test_relabel(self):
+        g1 = symmetric_group(5)
+        a, b = g1.generator
+
+        # other generators on other points
+        rep = PermutationGroupRep(degree=5)
+        label = [3, 0, 4, 1, 2]
+        ol = list(g1.represent.object_list())
+        g2 = rep.group([
+            [{label[i]: label[g.act(o).value] for i, o in enumerate(ol)}]
+            for g in [a + b, b + a + a]
+        ])
+
+        self.assertTrue(g1.is_isomorphism(g2))
+        self.assertEqual(g1.group_id(), g2.group_id())
+
+    def test_derived_series(self):
+        self.assertEqual(
+            [g.order() for g in symmetric_group(4).derived_series()],
+            [24, 12, 4, 1]
+        )
+        self.assertEqual(
+            [g.order() for g in alternative_group(5).derived_series()],
+            [60]
+        )
+
+    def test_group_id_invariant(self):
+        # C2^2 : C4 and C4 o D8 have same order statistics
+        rep = PermutationGroupRep(degree=8)
+        g1 = rep.group([[[0, 1]], [[0, 2], [1, 3], [4, 5, 6, 7]]])
+        g2 = rep.group([
+            [[0, 1], [2, 3], [4, 5], [6, 7]],
+            [[1, 5], [3, 7]],
+            [[0, 2, 4, 6], [1, 3, 5, 7]],
+        ])
+
+        self.assertEqual(g1.order_statistics(), g2.order_statistics())
+        self.assertNotEqual(g1.group_id(), g2.group_id())
+        self.assertFalse(g1.is_isomorphism(g2))
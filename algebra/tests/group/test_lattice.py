@@ -0,0 +1,55 @@
+import collections
+import unittest
+
+from algebra.group.abstract.shortcut import alternative_group, \
+    symmetric_group
+
+
+class TestLattice(unittest.TestCase):
+    def test_symmetric(self):
+        for n, class_count, total in [(4, 11, 30), (5, 19, 156)]:
+            group = symmetric_group(n)
+            class_list = group.conjugacy_classes_subgroups()
+
+            self.assertEqual(len(class_list), class_count)
+            self.assertEqual(sum(c.size for c in class_list), total)
+
+    def test_stream_order(self):
+        group = symmetric_group(4)
+        order_list = [
+            c.representative.order()
+            for c in group.conjugacy_classes_subgroups_iter()
+        ]
+        self.assertEqual(order_list[0], 1)
+        self.assertEqual(order_list[-1], 24)
+        self.assertEqual(
+            collections.Counter(order_list),
+            {1: 1, 2: 2, 3: 1, 4: 3, 6: 1, 8: 1, 12: 1, 24: 1}
+        )
+
+    def test_perfect(self):
+        # A5 has no subgroup of prime index, it is found as a seed
+        group = alternative_group(5)
+        self.assertEqual(
+            sorted(h.order() for h in group.normal_subgroups()), [1, 60]
+        )
+        self.assertEqual(
+            sorted(h.order() for h in group.maximal_subgroup_class_reps()),
+            [6, 10, 12]
+        )
+
+    def test_subgroup_list(self):
+        group = symmetric_group(4)
+        subgroup_list = list(group.subgroup_list())
+        self.assertEqual(len(subgroup_list), 30)
+        for subgroup in subgroup_list:
+            self.assertTrue(subgroup.is_subgroup(group))
+
+        rep = group.represent
+        transposition = rep.group([rep.element([[0, 1]])])
+        self.assertEqual(
+            sorted(h.order() for h in group.intermediate_subgroups(
+                transposition
+            )),
+            [4, 6, 6, 8]
+        )
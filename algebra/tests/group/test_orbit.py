@@ -0,0 +1,65 @@
+import unittest
+
+from algebra.group.abstract.base import ElementContainer
+from algebra.group.abstract.permutation import PermutationGroupRep
+from algebra.group.abstract.polycyclic.base import PolyCyclicGroupRep
+
+
+class TestOrbit(unittest.TestCase):
+    def test_partition(self):
+        for compact in [False, True]:
+            perm = PermutationGroupRep(degree=9, compact=compact)
+            group = perm.group([[[0, 1, 2]], [[1, 2]], [[4, 5]]])
+            o = perm.object_tuple
+
+            partition = group.orbit_partition()
+            self.assertIs(partition, group.orbit_partition())
+            self.assertEqual(
+                group.orbit_list(),
+                [{o[0], o[1], o[2]}, {o[4], o[5]}]
+            )
+            self.assertEqual(group.orbit(o[3]), {o[3]})
+            self.assertEqual(partition.orbit_size(o[2]), 3)
+            self.assertTrue(partition.is_same_orbit(o[0], o[2]))
+            self.assertFalse(partition.is_same_orbit(o[0], o[4]))
+            self.assertFalse(group.is_transitive())
+
+            transitive = perm.group([[list(range(9))]])
+            self.assertTrue(transitive.is_transitive())
+
+    def test_not_listed(self):
+        # automorphisms of C2 x C2 do not list the elements they act on
+        group = PolyCyclicGroupRep(degree=2, number=2).as_group()
+        automorphism = group.automorphism_group()
+        self.assertFalse(automorphism.represent.is_object_listed())
+
+        a, b = group.generator
+        self.assertEqual(automorphism.orbit(a), {a, b, a + b})
+
+    def test_schreier_tree(self):
+        perm = PermutationGroupRep(degree=8)
+        group = perm.group([[list(range(8))], [[0, 4]]])
+        o = perm.object_tuple
+
+        tree = group.orbit_partition().schreier_tree(o[0])
+        self.assertEqual(len(tree), 8)
+        self.assertIsNone(tree[o[0]])
+        for point, edge in tree.items():
+            if edge is None:
+                continue
+            parent, g = edge
+            self.assertEqual(g.act(parent), point)
+        # breadth first, 4 is reached by the transposition directly
+        self.assertEqual(tree[o[4]][0], o[0])
+
+    def test_base_order(self):
+        perm = PermutationGroupRep(degree=7)
+        group = perm.group([[[0, 1]], [[2, 3, 4]], [[3, 4]]])
+        o = perm.object_tuple
+
+        container = ElementContainer(
+            perm.object_list(), group.orbit_partition()
+        )
+        self.assertEqual(container.element_list, [o[2], o[3], o[4], o[0],
+                                                  o[1]])
+        self.assertEqual(group.order(), 12)
@@ -0,0 +1,40 @@
+import unittest
+
+from algebra.group.abstract.polycyclic.base import PolyCyclicGroupRep
+from algebra.group.abstract.polycyclic.p_convering import \
+    PCoveringGroupAlgorithm, echelon_mod_p
+
+
+class TestPCovering(unittest.TestCase):
+    def test_echelon(self):
+        reduced = echelon_mod_p([[1, 2, 0], [2, 1, 1], [0, 0, 2]], 3)
+        self.assertEqual(reduced, [(1, [2, 1, 0]), (2, [0, 0, 1])])
+
+        self.assertEqual(echelon_mod_p([[2, 2], [1, 1]], 2), [(1, [1, 1])])
+
+    def test_order(self):
+        # p-covering group of elementary abelian group of rank d has
+        # d (d + 1) / 2 more generators
+        for p, d in [(2, 2), (2, 4), (3, 2), (5, 3)]:
+            rep = PolyCyclicGroupRep(degree=p, number=d)
+            group = rep.as_group().p_covering_group()
+            self.assertEqual(group.order(), p ** (d + d * (d + 1) // 2))
+
+        q8 = PolyCyclicGroupRep(
+            degree=2, number=3,
+            power_relation={0: [2], 1: [2]},
+            commute_relation={(1, 0): [2]}
+        )
+        self.assertEqual(q8.as_group().p_covering_group().order(), 2 ** 6)
+
+    def test_consistent(self):
+        # Heisenberg group of order 27
+        rep = PolyCyclicGroupRep(
+            degree=3, number=3, commute_relation={(1, 0): [2]}
+        )
+        group = rep.as_group()
+        covering = group.p_covering_group()
+
+        algorithm = PCoveringGroupAlgorithm(group)
+        for left, right in algorithm.optimize_check_pair(covering.represent):
+            self.assertEqual(left, right)
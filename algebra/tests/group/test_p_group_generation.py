@@ -0,0 +1,93 @@
+import tempfile
+import unittest
+
+from algebra.group.abstract.polycyclic.base import PolyCyclicGroupRep
+from algebra.group.abstract.polycyclic.generation import PGroup, \
+    PGroupGenerator, annihilator, complement_subspace_list, subspace_key
+
+
+class TestPGroupGeneration(unittest.TestCase):
+    def test_p_cover(self):
+        c4 = PolyCyclicGroupRep(degree=2, number=2, power_relation={0: [1]})
+        cover = c4.as_group().p_cover()
+        self.assertEqual(cover.rank, 1)
+        self.assertEqual(cover.group.order(), 8)
+        self.assertEqual(cover.nucleus.order(), 2)
+
+        q8 = PolyCyclicGroupRep(
+            degree=2, number=3,
+            power_relation={0: [2], 1: [2]},
+            commute_relation={(1, 0): [2]}
+        ).as_group()
+        self.assertEqual(q8.p_multiplicator().order(), 4)
+        self.assertTrue(q8.nucleus().is_trivial())
+
+        # elementary abelian group of rank d has p-multiplicator of rank
+        # d (d + 1) / 2, which is the nucleus
+        rep = PolyCyclicGroupRep(degree=3, number=2)
+        cover = rep.as_group().p_cover()
+        self.assertEqual(cover.multiplicator.order(), 27)
+        self.assertEqual(cover.nucleus.order(), 27)
+
+        # C4 x C2, but the generator of order 2 is after a power
+        rep = PolyCyclicGroupRep(degree=2, number=3, power_relation={0: [1]})
+        with self.assertRaises(ValueError):
+            rep.as_group().p_cover()
+
+    def test_subspace(self):
+        # planes of F_2^3 without the line
+        line = [[0, 1, 0]]
+        key_set = {
+            subspace_key(row_list, 2)
+            for row_list in complement_subspace_list(3, line, 2, 2)
+        }
+        self.assertEqual(len(key_set), 4)
+        for key in key_set:
+            self.assertEqual(len(key), 2)
+            self.assertEqual(len(subspace_key(list(key) + line, 2)), 3)
+
+        row_list = [[1, 2, 0, 1], [0, 1, 1, 1]]
+        basis = annihilator(row_list, 4, 3)
+        self.assertEqual(len(basis), 2)
+        for row in row_list:
+            for vector in basis:
+                self.assertEqual(
+                    sum(a * b for a, b in zip(row, vector)) % 3, 0
+                )
+
+    def test_descendant(self):
+        generator = PGroupGenerator(2)
+        parent = PGroup.elementary_abelian(2, 2)
+        self.assertEqual(parent.automorphism_order, 6)
+
+        child_list = list(generator.descendants(parent, 1))
+        # C4 x C2, D8 and Q8
+        self.assertEqual(len(child_list), 3)
+        self.assertEqual(
+            sorted(child.automorphism_order for child in child_list),
+            [8, 8, 24]
+        )
+        self.assertEqual(
+            sorted(
+                child.group().order_statistics()[2]
+                for child in child_list
+            ),
+            [1, 3, 5]
+        )
+
+    def test_group_list(self):
+        for p, n, count in [(2, 3, 5), (2, 4, 14), (3, 3, 5)]:
+            generator = PGroupGenerator(p)
+            group_list = list(generator.group_list(n))
+            self.assertEqual(len(group_list), count)
+            for group in group_list:
+                self.assertEqual(group.order(), p ** n)
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            group_list = list(PGroupGenerator(2, cache_dir).group_list(4))
+            cached_list = list(PGroupGenerator(2, cache_dir).group_list(4))
+            self.assertEqual(
+                [g.model_dump() for g in group_list],
+                [g.model_dump() for g in cached_list]
+            )
@@ -0,0 +1,56 @@
+import unittest
+
+from algebra.group.abstract.base import StabilizerTraveler
+from algebra.group.abstract.parallel import order_statistics_block
+from algebra.group.abstract.permutation import PermutationGroupRep
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.perm = PermutationGroupRep(degree=6, compact=True)
+        self.group = self.perm.group([[list(range(6))], [[0, 1]]])
+
+    def test_block_list(self):
+        traveler = StabilizerTraveler(self.group).coset_traveler()
+
+        block_list = traveler.block_list(8)
+
+        self.assertGreaterEqual(len(block_list), 8)
+        self.assertEqual(0, block_list[0][0])
+        self.assertEqual(720, block_list[-1][1])
+        for (_, stop), (start, _) in zip(block_list, block_list[1:]):
+            self.assertEqual(stop, start)
+
+        element_list = []
+        for start, stop in block_list:
+            element_list.extend(traveler.visit(start, stop))
+        self.assertEqual(list(self.group.element_list()), element_list)
+
+    def test_batch_block(self):
+        traveler = StabilizerTraveler(self.group).coset_traveler()
+
+        for start, stop in [(0, 720), (0, 120), (7, 500), (719, 720)]:
+            element_list = list(traveler.visit(start, stop))
+            row_list = [
+                row
+                for matrix in traveler.batch_visit(start, stop, 16)
+                for row in matrix.tolist()
+            ]
+            self.assertEqual(
+                sorted(self.perm.image_of(e) for e in element_list),
+                sorted(row_list)
+            )
+            self.assertEqual(
+                order_statistics_block(traveler, start, stop),
+                order_statistics_block(traveler, start, stop, batch=True)
+            )
+
+    def test_order_statistics(self):
+        self.assertEqual(
+            self.group.order_statistics(),
+            self.group.order_statistics(workers=2)
+        )
+        self.assertEqual(
+            self.group.group_id(),
+            self.group.group_id(workers=2)
+        )
@@ -0,0 +1,78 @@
+import unittest
+
+from algebra.group.abstract import base
+from algebra.group.abstract.base import StabilizerBatchTraveler
+from algebra.group.abstract.permutation import PermutationGroupRep, numpy
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestPermutationBatch(unittest.TestCase):
+    def test_batch_operation(self):
+        rep = PermutationGroupRep(degree=5)
+        e1 = rep.element([[0, 1, 2]])
+        e2 = rep.element([[2, 3], [0, 4]])
+        matrix = rep.batch([e1, e2, e1 + e2])
+
+        self.assertEqual(
+            list(rep.batch_element_list(
+                rep.batch_compose(matrix, rep.batch([e2]))
+            )),
+            [e1 + e2, e2 + e2, e1 + e2 + e2]
+        )
+        self.assertEqual(
+            list(rep.batch_element_list(rep.batch_inverse(matrix))),
+            [-e1, -e2, -(e1 + e2)]
+        )
+        self.assertEqual(
+            rep.batch_order(matrix).tolist(),
+            [3, 2, (e1 + e2).order()]
+        )
+
+    def test_traveler(self):
+        for compact in [False, True]:
+            rep = PermutationGroupRep(degree=6, compact=compact)
+            group = rep.group([[list(range(6))], [[0, 1]]])
+
+            element_set = set(group.element_list())
+            for block_size in [1, 30, 720]:
+                batch_set = set()
+                traveler = StabilizerBatchTraveler(group, block_size)
+                for matrix in traveler.visit():
+                    batch_set.update(rep.batch_element_list(matrix))
+                self.assertSetEqual(batch_set, element_set)
+
+    def test_order_statistics(self):
+        rep = PermutationGroupRep(degree=11)
+        m11 = rep.group([
+            [list(range(11))],
+            [[2, 6, 10, 7], [3, 9, 4, 5]]
+        ])
+        self.assertTrue(m11._is_batch())
+
+        statistics = {
+            1: 1, 2: 165, 3: 440, 4: 990,
+            5: 1584, 6: 1320, 8: 1980, 11: 1440
+        }
+        self.assertEqual(m11.order_statistics(), statistics)
+        self.assertEqual(
+            {k: len(v) for k, v in m11.order_statistics_element().items()},
+            statistics
+        )
+        self.assertTrue(m11.center().is_trivial())
+
+    def test_center(self):
+        # Z_8^4 is large enough to use batch operation
+        rep = PermutationGroupRep(degree=32, compact=True)
+        group = rep.group([
+            [list(range(i, i + 8))]
+            for i in range(0, 32, 8)
+        ])
+        self.assertTrue(group._is_batch())
+        self.assertEqual(group.center().order(), 8 ** 4)
+
+        base_threshold = base.BATCH_THRESHOLD
+        try:
+            base.BATCH_THRESHOLD = group.order() + 1
+            self.assertFalse(group._is_batch())
+        finally:
+            base.BATCH_THRESHOLD = base_threshold
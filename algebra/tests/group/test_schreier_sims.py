@@ -0,0 +1,58 @@
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep
+
+
+class TestRandomSchreierSims(unittest.TestCase):
+    def _m12(self, compact=False):
+        rep = PermutationGroupRep(degree=12, compact=compact)
+        return rep.group([
+            [list(range(11))],
+            [[0, 11], [1, 10], [2, 5], [3, 7], [4, 8], [6, 9]],
+            [[2, 6, 10, 7], [3, 9, 4, 5]]
+        ])
+
+    def test_known_order(self):
+        group = self._m12()
+        chain = group.stabilizer_chain(order=95_040)
+        self.assertEqual(chain.order, 95_040)
+        self.assertEqual(group.order(), 95_040)
+
+        # M11 has order 7920, so the loop alone may stop at a subgroup
+        with self.assertRaises(ValueError):
+            self._m12().stabilizer_chain(order=7920, verify=True)
+
+    def test_verify(self):
+        for compact in [False, True]:
+            group = self._m12(compact)
+            chain = group.stabilizer_chain(certainty=1, verify=True)
+            self.assertEqual(chain.order, 95_040)
+
+            for _ in range(10):
+                self.assertTrue(group.element_test(group.random_element()))
+
+            rep = group.represent
+            self.assertFalse(group.element_test(rep.element([[0, 1]])))
+
+    def test_certainty(self):
+        rep = PermutationGroupRep(degree=8)
+        group = rep.group([[list(range(8))], [[0, 1]]])
+        chain = group.stabilizer_chain(certainty=30)
+        self.assertEqual(chain.order, 40_320)
+
+    def test_factor(self):
+        rep = PermutationGroupRep(degree=5, compact=True)
+        group = rep.group([[list(range(5))], [[0, 1]]])
+        group.stabilizer_chain(is_factor=True, certainty=10, verify=True)
+
+        for _ in range(10):
+            element = group.random_element()
+            target = rep.identity
+            for f in group.factor(element):
+                target += f
+            self.assertEqual(target, element)
+
+    def test_trivial(self):
+        rep = PermutationGroupRep(degree=4)
+        group = rep.group([rep.identity])
+        self.assertEqual(group.stabilizer_chain(certainty=5).order, 1)
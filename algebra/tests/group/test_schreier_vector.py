@@ -0,0 +1,62 @@
+import unittest
+
+from algebra.group.abstract.base import SchreierVector
+from algebra.group.abstract.permutation import PermutationGroupRep
+
+
+class TestSchreierVector(unittest.TestCase):
+    def _m11(self):
+        rep = PermutationGroupRep(degree=11, compact=True)
+        return rep.group([
+            [list(range(11))],
+            [[2, 6, 10, 7], [3, 9, 4, 5]]
+        ])
+
+    def test_element_test(self):
+        group = self._m11()
+        chain = group.stabilizer_chain(schreier_vector=True)
+        self.assertEqual(chain.order, 7920)
+
+        for stabilizer in chain.travel():
+            if stabilizer.is_trivial():
+                break
+            transversal = stabilizer.transversal
+            self.assertIsInstance(transversal, SchreierVector)
+            self.assertLessEqual(
+                len(transversal.label_list),
+                2 * len(stabilizer.generator_factor)
+            )
+            for point, info in transversal.items():
+                self.assertEqual(info.element.act(stabilizer.point), point)
+
+        rep = group.represent
+        for _ in range(10):
+            self.assertTrue(group.element_test(group.random_element()))
+        self.assertFalse(group.element_test(rep.element([[0, 1]])))
+
+    def test_random_schreier_sims(self):
+        group = self._m11()
+        chain = group.stabilizer_chain(order=7920, schreier_vector=True)
+        self.assertIsInstance(chain.transversal, SchreierVector)
+        self.assertEqual(group.order(), 7920)
+
+    def test_factor(self):
+        group = self._m11()
+        group.stabilizer_chain(is_factor=True, schreier_vector=True)
+
+        for _ in range(10):
+            element = group.random_element()
+            target = group.represent.identity
+            for f in group.factor(element):
+                target += f
+            self.assertEqual(target, element)
+
+    def test_cache(self):
+        rep = PermutationGroupRep(degree=6, compact=True)
+        group = rep.group([[list(range(6))]])
+        chain = group.stabilizer_chain(schreier_vector=True)
+        chain.transversal.cache_size = 2
+
+        element_list = list(chain.transversal.values())
+        self.assertEqual(len(element_list), 6)
+        self.assertEqual(len(chain.transversal._cache), 2)
@@ -0,0 +1,71 @@
+import math
+import unittest
+
+from algebra.group.abstract.permutation import PermutationGroupRep
+
+
+class TestStabilizer(unittest.TestCase):
+    def _symmetric(self, n):
+        rep = PermutationGroupRep(degree=n, compact=True)
+        return rep.group([[list(range(n))], [[0, 1]]])
+
+    def test_reduced_generator(self):
+        n = 12
+        group = self._symmetric(n)
+        ol = list(group.represent.object_list())
+
+        current = group
+        for i in range(5):
+            current = current.stabilizer(ol[i])
+            self.assertEqual(current.order(), math.factorial(n - i - 1))
+            # only strong generators of the chain are kept
+            self.assertLessEqual(
+                len(current.generator),
+                sum(
+                    len(c.generator_factor)
+                    for c in current.stabilizer_chain().travel()
+                )
+            )
+            for g in current.generator:
+                for o in ol[:i + 1]:
+                    self.assertEqual(g.act(o), o)
+
+    def test_reuse_chain(self):
+        group = self._symmetric(10)
+        chain = group.stabilizer_chain()
+        ol = list(group.represent.object_list())
+
+        base = chain.base()
+
+        stabilizer = group.stabilizer(ol[4])
+        self.assertEqual(chain.base(), base)
+        self.assertNotIn(ol[4], stabilizer.stabilizer_chain().base())
+        self.assertEqual(stabilizer.order(), math.factorial(9))
+
+        # result is detached from the chain of the group
+        group.stabilizer(ol[7])
+        self.assertEqual(stabilizer.order(), math.factorial(9))
+        rep = group.represent
+        self.assertFalse(stabilizer.element_test(rep.element([[4, 5]])))
+        self.assertTrue(stabilizer.element_test(rep.element([[7, 8]])))
+
+    def test_rank_kept(self):
+        group = self._symmetric(5)
+        ol = list(group.represent.object_list())
+        element_list = [group.element_unrank(i) for i in range(5)]
+
+        group.stabilizer(ol[3])
+        self.assertEqual(
+            [group.element_unrank(i) for i in range(5)], element_list
+        )
+        for i, element in enumerate(element_list):
+            self.assertEqual(group.element_rank(element), i)
+
+    def test_intransitive(self):
+        rep = PermutationGroupRep(degree=7)
+        ol = list(rep.object_list())
+        group = rep.group([[[0, 1, 2]], [[3, 4]]])
+
+        self.assertEqual(group.stabilizer(ol[0]).order(), 2)
+        self.assertEqual(group.stabilizer(ol[3]).order(), 3)
+        self.assertEqual(group.stabilizer(ol[6]).order(), 6)
@@ -0,0 +1,47 @@
+import unittest
+
+import pydantic
+
+from algebra.field.finite_prime import FinitePrimeField, \
+    FinitePrimeFieldElement
+from algebra.field.rational import RationalField
+from algebra.ring.polynomial.base import PolynomialRing, \
+    PolynomialRingElement, Monomial
+
+
+class TestUnvalidated(unittest.TestCase):
+    def test_entry_point_validation(self):
+        with self.assertRaises(pydantic.ValidationError):
+            FinitePrimeField(12)
+
+        pr = PolynomialRing(field=FinitePrimeField(7), number=2)
+        with self.assertRaises(pydantic.ValidationError):
+            Monomial(power=[1, -1], ring=pr)
+
+    def test_field_result(self):
+        field = FinitePrimeField(101)
+        a, b = field.element(17), field.element(55)
+
+        c = a * b
+        self.assertIsInstance(c, FinitePrimeFieldElement)
+        self.assertEqual(c, field.element(17 * 55))
+        self.assertEqual(c.model_dump(), {'field': {'char': 101}, 'value': 26})
+        self.assertEqual(a / a, field.one())
+
+        q = RationalField()
+        third = q.element(1) / q.element(3)
+        self.assertEqual(q.element(2) / q.element(6), third)
+
+    def test_polynomial_result(self):
+        pr = PolynomialRing(field=FinitePrimeField(7), number=2)
+        x, y = pr.variables()
+
+        f = (x + y) * (x - y)
+        self.assertEqual(f, x * x - y * y)
+        self.assertEqual(len(f.value), 2)
+
+        # zero terms are dropped without validation too
+        g = PolynomialRingElement.from_value(
+            pr, {m: c - c for m, c in f.value.items()}
+        )
+        self.assertTrue(g.is_zero())
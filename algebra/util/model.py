@@ -0,0 +1,23 @@
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+
+Model = TypeVar('Model', bound=BaseModel)
+
+_setattr = object.__setattr__
+
+
+def construct(cls: Type[Model], **values) -> Model:
+    """
+    Build a model from trusted values without validation. This is a thin
+    version of ``BaseModel.model_construct`` which does not look up default
+    values, so every field should be given. ``model_post_init`` still runs.
+    """
+    model = cls.__new__(cls)
+    _setattr(model, '__dict__', values)
+    _setattr(model, '__pydantic_fields_set__', set(values))
+    _setattr(model, '__pydantic_extra__', None)
+    _setattr(model, '__pydantic_private__', None)
+    if cls.__pydantic_post_init__ is not None:
+        model.model_post_init(None)
+    return model
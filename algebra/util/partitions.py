@@ -24,6 +24,19 @@ def integer_partition(n):
     return total
 
 
+def integer_partition_list(n: int, i: int = None):
+    # every partition of n with part at most i, as a non-increasing list
+    if i is None or i > n:
+        i = n
+    if n == 0:
+        yield []
+        return
+
+    for j in range(i, 0, -1):
+        for rest in integer_partition_list(n - j, j):
+            yield [j] + rest
+
+
 def prev_partition():
     step = 0
     sign = 1
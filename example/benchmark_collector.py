@@ -0,0 +1,142 @@
+import random
+import timeit
+
+from algebra.group.abstract.polycyclic.base import PolyCyclicGroupRep
+
+NUMBER = 200
+
+
+def presentation_list():
+    yield 'Q8', PolyCyclicGroupRep(
+        degree=2, number=3,
+        power_relation={0: [2], 1: [2]},
+        commute_relation={(1, 0): [2]}
+    )
+    yield 'D16', PolyCyclicGroupRep(
+        degree=2, number=4,
+        power_relation={1: [2], 2: [3]},
+        commute_relation={(1, 0): [2, 3], (2, 0): [3]}
+    )
+
+
+def to_stack(word):
+    # (index, power) of letters, to be popped from the first
+    return [(index, 1) for index in reversed(word)]
+
+
+def normalize_sequence(rep, sequence):
+    """
+    Collector of stacked (index, power) pairs, as __add__ of polycyclic
+    elements used to do. Kept as the reference of the benchmark.
+    """
+    stack = []
+    right_stack = list(sequence)
+    right_stack.reverse()
+
+    while right_stack:
+        index, power = right_stack.pop()
+        if power == 0:
+            continue
+
+        if power < 0:
+            if index in rep.power_relation:
+                right_stack.extend(to_stack(rep.power_relation[index]))
+            right_stack.append((index, power + rep.degree))
+            continue
+
+        if not stack:
+            stack.append((index, power))
+            continue
+
+        left_index, left_power = stack.pop()
+        if left_index < index:
+            stack.extend([(left_index, left_power), (index, power)])
+        elif left_index == index:
+            q, r = divmod(left_power + power, rep.degree)
+            if index in rep.power_relation:
+                for _ in range(q):
+                    right_stack.extend(to_stack(rep.power_relation[index]))
+            right_stack.append((index, r))
+        else:
+            pair = left_index, index
+            if pair not in rep.commute_relation:
+                right_stack.extend([(left_index, left_power), (index, power)])
+            else:
+                right_stack.append((index, power - 1))
+                for _ in range(left_power):
+                    right_stack.extend(to_stack(rep.commute_relation[pair]))
+                    right_stack.append((left_index, 1))
+                right_stack.append((index, 1))
+
+    power = [0] * rep.number
+    for index, p in stack:
+        power[index] = p
+    return rep.element(power)
+
+
+def sequence_add(a, b):
+    return normalize_sequence(a.group, [
+        (i, p)
+        for element in (a, b)
+        for i, p in enumerate(element.power)
+        if p
+    ])
+
+
+def measure(name, rep):
+    element_list = [
+        rep.element([random.randrange(rep.degree) for _ in range(rep.number)])
+        for _ in range(16)
+    ]
+    pair_list = [
+        (random.choice(element_list), random.choice(element_list))
+        for _ in range(NUMBER)
+    ]
+
+    for a, b in pair_list:
+        assert a + b == sequence_add(a, b)
+
+    def per_product(f):
+        return timeit.timeit(
+            lambda: [f(a, b) for a, b in pair_list], number=1
+        ) / NUMBER * 1e6
+
+    result = [per_product(sequence_add), per_product(lambda a, b: a + b)]
+
+    # products of the same presentation by Deep Thought formulas, unless
+    # they are too large to build
+    copy = rep.model_copy(deep=True)
+    try:
+        copy.build_deep_thought()
+    except ValueError:
+        deep_thought = '     -  '
+    else:
+        copy_list = [
+            (copy.element(a.power), copy.element(b.power))
+            for a, b in pair_list
+        ]
+        deep_thought = '{:8.2f}'.format(timeit.timeit(
+            lambda: [a + b for a, b in copy_list], number=1
+        ) / NUMBER * 1e6)
+
+    print(
+        f'{name:<16} generators {rep.number:3}'
+        f'  sequence {result[0]:10.2f}us  collector {result[1]:8.2f}us'
+        f'  deep thought {deep_thought}us'
+    )
+
+
+def main():
+    random.seed(0)
+    for name, rep in presentation_list():
+        measure(name, rep)
+
+        # p-covering groups grow in class and number of generators
+        group = rep.as_group()
+        for depth in range(1, 3):
+            group = group.p_covering_group()
+            measure(f'{name} cover {depth}', group.represent)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+import timeit
+
+from algebra.field.finite_prime import (
+    FinitePrimeField, FinitePrimeFieldElement
+)
+from algebra.group.abstract.permutation import (
+    PermutationGroupRep, PermutationGroupElement
+)
+from algebra.ring.polynomial.base import PolynomialRing, PolynomialRingElement
+from algebra.util.model import construct
+
+NUMBER = 20000
+
+
+def measure(name, validated, unvalidated, operation, number=NUMBER):
+    """
+    Print microseconds per call of validated construction, unvalidated
+    construction and the operation which uses the unvalidated one.
+    """
+    result = [
+        timeit.timeit(f, number=number) / number * 1e6
+        for f in (validated, unvalidated, operation)
+    ]
+    print(
+        f'{name:<28} validated {result[0]:8.2f}us'
+        f'  unvalidated {result[1]:8.2f}us'
+        f'  operation {result[2]:8.2f}us'
+    )
+
+
+def permutation():
+    rep = PermutationGroupRep(degree=12)
+    g = rep.element([[0, 1, 2, 3, 4]])
+    h = rep.element([[3, 5, 7], [8, 9]])
+    perm_map = dict((g + h).perm_map)
+
+    measure(
+        'permutation composition',
+        lambda: PermutationGroupElement(group=rep, perm_map=perm_map),
+        lambda: construct(
+            PermutationGroupElement, group=rep, perm_map=perm_map
+        ),
+        lambda: g + h,
+    )
+
+
+def prime_field():
+    field = FinitePrimeField(101)
+    a, b = field.element(17), field.element(55)
+
+    measure(
+        'prime field multiplication',
+        lambda: FinitePrimeFieldElement(field=field, value=26),
+        lambda: FinitePrimeFieldElement.from_value(field, 26),
+        lambda: a * b,
+    )
+
+
+def polynomial():
+    pr = PolynomialRing(field=FinitePrimeField(101), number=2)
+    x, y = pr.variables()
+    f = (x + 2 * y + 3) ** 2
+    g = x * y - 5 * y + 7
+    value = dict((f * g).value)
+
+    measure(
+        'polynomial multiplication',
+        lambda: PolynomialRingElement(ring=pr, value=value),
+        lambda: PolynomialRingElement.from_value(pr, value),
+        lambda: f * g,
+        number=NUMBER // 10,
+    )
+
+
+def main():
+    permutation()
+    prime_field()
+    polynomial()
+
+
+if __name__ == '__main__':
+    main()
@@ -318,13 +318,6 @@ def parse_args():
     return parser.parse_args()
 
 
-def factorial(n):
-    answer = 1
-    for i in range(2, n+1):
-        answer *= i
-    return answer
-
-
 def main():
     args = parse_args()
 
@@ -352,19 +345,14 @@ def show_subgroup_key(po, s_n, args):
 
 
 def build_subgroup(po, s_n, args):
-    po.insert(s_n.represent.group())
-    count = 0
-
-    for element in tqdm.tqdm(s_n.element_list(), total=factorial(args.degree)):
-        if po.has(s_n.represent.group(element)):
+    # subgroups come from the lattice engine by conjugacy class
+    for count, group in enumerate(tqdm.tqdm(s_n.subgroup_list()), 1):
+        if po.has(group):
             continue
 
-        count += 1
-
-        for group in po.element_list():
-            po.insert(group.append(element))
+        po.insert(group)
 
-        if count % 10 == 0:
+        if count % 100 == 0:
             po.dump(args.cache)
 
     print(po.size)
@@ -374,7 +362,8 @@ def build_subgroup(po, s_n, args):
     grouping_dict = {
         'iso': GroupingGroup('is_isomorphism'),
         'con': GroupingGroup('is_conjugate'),
-        'galois': GroupingGroup('is_conjugate', condition='is_transitive')
+        'galois': GroupingGroup('is_conjugate', condition='is_transitive'),
+        'primitive': GroupingGroup('is_conjugate', condition='is_primitive')
     }
 
     for group in tqdm.tqdm(po.element_list(), total=po.size):
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 from algebra.group.abstract.permutation import PermutationGroupRep
 from algebra.group.abstract.polycyclic.base import PolyCyclicGroupRep, \
     PolyCyclicGroup
+from algebra.group.abstract.polycyclic.generation import PGroup, \
+    PGroupGenerator
 
 
 def get_reference_group_list():
@@ -13,7 +15,7 @@ def get_reference_group_list():
 
     yield rep.group([[[0, 1]], [[2, 3]], [[4, 5]]], name='Z2Z2Z2')
     yield rep.group([[[0, 1]], [[2, 3, 4, 5]]], name='Z2Z4')
-    yield rep.group([[[0, 1, 2, 3, 4, 5, 6, 7]]], name='Z2Z4')
+    yield rep.group([[[0, 1, 2, 3, 4, 5, 6, 7]]], name='Z8')
     yield rep.group([[[0, 1, 2, 3]], [[4, 5, 6, 7]]], name='Z4Z4')
     yield rep.group([[[0, 1, 2, 3]], [[1, 3]]], name='D8')
     yield rep.group([
@@ -23,81 +25,50 @@ def get_reference_group_list():
 
 
 def main():
-    # Q8
-    g = PolyCyclicGroupRep(
+    reference_group_list = list(get_reference_group_list())
+    for reference in reference_group_list:
+        print(reference, reference.order(), reference.order_statistics())
+
+    # Q8 is terminal, it has no immediate descendants
+    q8 = PolyCyclicGroupRep(
         degree=2, number=3,
         power_relation={0: [2], 1: [2]},
         commute_relation={(1, 0): [2]}
     ).as_group()
+    print('p-multiplicator of Q8 :', q8.p_multiplicator().order())
+    print('Nucleus of Q8 :', q8.nucleus().order())
 
-    pcg = g.p_covering_group()
-    pcg.represent.show('Normalized')
-    print(pcg.order())
-
-    for group in pcg.lower_exponent_p_central_series():
-        print(group)
-
-    ag = pcg.automorphism_group()
-    print('Automorphism :', ag)
-
-    for am in ag.generator:
-        print('Map :')
-        print(am)
-        print('Check :')
-        for e in pcg.generator:
-            print(e, am.act(e))
-        print()
-
-    pm = pcg.lower_exponent_p_central()
-    cc = ClassifyContainer()
-    for subgroup in pm.subgroup_list():
-        if cc.is_element(subgroup):
-            continue
-        cc.update(ag.orbit(subgroup))
-        print(subgroup)
-        for ob in cc.by_class[-1]:
-            print('>', ob)
-        print(len(cc.element_set))
-
-    reference_group_list = list(get_reference_group_list())
-    for reference in reference_group_list:
-        print(reference, reference.order(), reference.order_statistics())
-
+    generator = PGroupGenerator(degree=2)
     result_relation = RelationContainer()
 
-    for i, c in enumerate(cc.by_class):
-        print('Class :', i)
-        print('Quotient :', c[0])
-        result = pcg / c[0]
-        result.represent.show('New :')
-        result.show()
-        print(result.model_dump())
-        for reference in reference_group_list:
-            if reference.is_isomorphism(result):
-                print('Isomorphic to', reference)  # 2번 이상 출력되면 안됨
-        if g.order() == result.order():
-            continue
-        result_relation.add_relation(g, result)
-        print()
+    def search(parent: PGroup, number: int):
+        parent_group = parent.group()
+        for child in generator.descendants(
+                parent, number - parent.represent.number):
+            child_group = child.group()
+            child.represent.show('Descendant :')
+            print('Order :', child.order())
+            print('Automorphism :', child.automorphism_order)
+            # order statistics tell groups of order 8 apart
+            statistics = child_group.order_statistics()
+            for reference in reference_group_list:
+                if reference.order_statistics() == statistics:
+                    print('Isomorphic to', reference)  # 2번 이상 출력되면 안됨
+            result_relation.add_relation(parent_group, child_group)
+            print()
+            search(child, number)
+
+    search(PGroup.elementary_abelian(2, 2), 3)
+    search(PGroup.elementary_abelian(2, 1), 3)
+
+    for n in range(1, 6):
+        group_list = list(generator.group_list(n))
+        print('Groups of order', 2 ** n, ':', len(group_list))
 
     print(result_relation.model_dump())
     # print(json.dumps(result_relation.model_dump(), indent=4))
 
 
-class ClassifyContainer:
-    def __init__(self):
-        self.by_class = []
-        self.element_set = set()
-
-    def update(self, class_list):
-        class_list = list(class_list)
-        self.by_class.append(class_list)
-        self.element_set.update(class_list)
-
-    def is_element(self, other):
-        return other in self.element_set
-
-
 class Relation(BaseModel):
     source: str
     target: str
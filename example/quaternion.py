@@ -85,9 +85,10 @@ def construct_quaternion():
     ol = list(rep.object_list())
 
     for index_map in index_map_construct():
-        element = rep.identity
-        for i, j in index_map.items():
-            element.perm_map[ol[i]] = ol[j]
+        element = rep.element([{
+            ol[i]: ol[j]
+            for i, j in index_map.items()
+        }])
         print(element)
 
 
@@ -111,7 +111,7 @@ class Rubik:
             yield Rotation(axis, 1)
 
     def group(self):
-        perm = PermutationGroupRep(degree=len(self.face_list))
+        perm = PermutationGroupRep(degree=len(self.face_list), compact=True)
         ol = perm.object_list()
         face_map = dict(zip(self.face_list, ol))
 
@@ -129,9 +129,9 @@ class Rubik:
                     done_face.add(face)
                     face = rotate(face)
                 seq.append(face_seq)
-            generators.append(perm.element(*seq))
+            generators.append(perm.element(seq))
 
-        return perm.group(*generators)
+        return perm.group(generators)
 
 
 def construct():